@@ -0,0 +1,183 @@
+"""
+Motor de amortización de créditos (sistema francés: cuota fija mensual) con NumPy.
+
+* `monthly_payment` y `payoff_months`: cuota para un plazo y plazo para una cuota, con
+  broadcasting sobre montos, tasas y plazos.
+* `amortization_schedule`: calendario mes a mes con abonos extraordinarios únicos
+  (`extra_payments`), abonos mensuales adicionales (`recurring_extra`) y cambios de tasa
+  (`rate_changes`). Entre dos eventos el saldo sigue la fórmula cerrada
+  B_k = B_0 (1 + r)^k - c ((1 + r)^k - 1) / r, así que cada tramo se calcula de una vez con
+  arreglos en lugar de iterar mes a mes.
+* `payment_grid`: cuota, meses, total pagado e intereses de cada combinación plazo × tasa
+  (p. ej. 12–84 meses × 2–15 %) en una sola llamada vectorizada.
+
+Las tasas son anuales en porcentaje (7.5 = 7,5 % anual) y se capitalizan mensualmente.
+"""
+import calendar
+from datetime import date
+
+import numpy as np
+
+MONTHS_PER_YEAR = 12
+MAX_SCHEDULE_MONTHS = 600
+# Saldos por debajo de medio centavo se consideran pagados (errores de redondeo de punto flotante).
+BALANCE_EPSILON = 0.005
+
+
+def monthly_rate(annual_rate):
+    """
+    Tasa mensual (fracción) de una tasa anual en porcentaje.
+    """
+    return np.asarray(annual_rate, dtype=float) / 100 / MONTHS_PER_YEAR
+
+
+def _scalar(values):
+    return float(values) if np.ndim(values) == 0 else values
+
+
+def monthly_payment(principal, annual_rate, months):
+    """
+    Cuota fija que salda `principal` en `months` meses a `annual_rate`. Acepta escalares o
+    arreglos que se combinan por broadcasting.
+    """
+    principal, rate, months = np.broadcast_arrays(np.asarray(principal, dtype=float), monthly_rate(annual_rate),
+                                                  np.asarray(months, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payment = np.where(rate > 0, principal * rate / -np.expm1(-months * np.log1p(rate)), principal / months)
+    return _scalar(payment)
+
+
+def balance_after(balance, annual_rate, payment, months):
+    """
+    Saldo tras pagar `months` cuotas de `payment` sobre `balance` (puede ser negativo si la
+    última cuota sobra). Vectorizado como `monthly_payment`.
+    """
+    balance, rate, payment, months = np.broadcast_arrays(np.asarray(balance, dtype=float), monthly_rate(annual_rate),
+                                                         np.asarray(payment, dtype=float), np.asarray(months, dtype=float))
+    growth = np.exp(months * np.log1p(rate))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = np.where(rate > 0, np.expm1(months * np.log1p(rate)) / rate, months)
+    return _scalar(balance * growth - payment * annuity)
+
+
+def payoff_months(balance, annual_rate, payment):
+    """
+    Meses (con fracción: la última cuota es parcial) para saldar `balance` pagando `payment`
+    cada mes. Es `inf` si la cuota no alcanza a cubrir los intereses.
+    """
+    balance, rate, payment = np.broadcast_arrays(np.asarray(balance, dtype=float), monthly_rate(annual_rate),
+                                                 np.asarray(payment, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = 1 - rate * balance / payment
+        months = np.where(rate > 0, -np.log(ratio) / np.log1p(rate), balance / payment)
+    months = np.where((payment <= 0) | ((rate > 0) & (ratio <= 0)), np.inf, months)
+    return _scalar(np.where(balance <= 0, 0.0, months))
+
+
+def add_months(start, months):
+    """
+    Fecha `months` meses después de `start` (el día se ajusta al último del mes si no existe).
+    """
+    month_index = start.month - 1 + int(months)
+    year, month = start.year + month_index // MONTHS_PER_YEAR, month_index % MONTHS_PER_YEAR + 1
+    return date(year, month, min(start.day, calendar.monthrange(year, month)[1]))
+
+
+def amortization_schedule(principal, annual_rate, months, payment=None, extra_payments=None, recurring_extra=0.0,
+                          rate_changes=None, max_months=MAX_SCHEDULE_MONTHS):
+    """
+    Calendario de pagos hasta saldar `principal` (o hasta `max_months`).
+
+    La cuota es `payment` o, si no se da, la que salda el crédito en `months` meses. Cada mes
+    se paga la cuota más `recurring_extra`; `extra_payments` ({mes: monto}) añade abonos únicos
+    a capital. `rate_changes` ({mes: tasa anual}) cambia la tasa desde ese mes y recalcula la
+    cuota para terminar en el plazo original (`months`), como un refinanciamiento. Los abonos
+    no cambian la cuota: acortan el plazo.
+
+    Devuelve un dict de arreglos por mes ("month", "rate", "payment", "extra", "interest",
+    "principal", "balance"), más "paid_off" (si el saldo llegó a cero).
+    """
+    extra_payments = {int(month): float(amount) for month, amount in (extra_payments or {}).items() if 1 <= month <= max_months}
+    rate_changes = {int(month): float(rate) for month, rate in (rate_changes or {}).items() if 1 <= month <= max_months}
+    payment = monthly_payment(principal, annual_rate, months) if payment is None else float(payment)
+    recurring_extra = float(recurring_extra)
+    rate = float(annual_rate)
+    balance = float(principal)
+
+    starts = sorted({1} | set(extra_payments) | set(rate_changes))
+    segments = []
+    for start, end in zip(starts, starts[1:] + [max_months + 1]):
+        if balance <= BALANCE_EPSILON:
+            break
+        if start in rate_changes:
+            rate = rate_changes[start]
+            payment = monthly_payment(balance, rate, max(months - start + 1, 1))
+        r = monthly_rate(rate)
+        lump = extra_payments.get(start, 0.0)
+        k = np.arange(1, end - start + 1, dtype=float)
+        # Saldo al final de cada mes del tramo; el abono único del primer mes también genera
+        # (menos) intereses en los meses siguientes.
+        balances = balance_after(balance, rate, payment + recurring_extra, k) - lump * np.exp((k - 1) * np.log1p(r))
+        opening = np.concatenate(([balance], balances[:-1]))
+        paid = np.flatnonzero(balances <= BALANCE_EPSILON)
+        size = paid[0] + 1 if len(paid) else len(k)
+        segment = dict(
+            month=np.arange(start, start + size),
+            rate=np.full(size, rate),
+            payment=np.full(size, payment),
+            extra=np.full(size, recurring_extra),
+            interest=opening[:size] * r,
+            balance=balances[:size].copy(),
+        )
+        segment["extra"][0] += lump
+        if len(paid):
+            # Última cuota: solo lo que falta (saldo anterior más sus intereses).
+            due = opening[size - 1] * (1 + r)
+            segment["payment"][-1] = min(payment, due)
+            segment["extra"][-1] = due - segment["payment"][-1]
+            segment["balance"][-1] = 0.0
+        segment["principal"] = segment["payment"] + segment["extra"] - segment["interest"]
+        segments.append(segment)
+        balance = float(segment["balance"][-1])
+
+    columns = ("month", "rate", "payment", "extra", "interest", "principal", "balance")
+    schedule = {column: np.concatenate([segment[column] for segment in segments]) if segments else np.zeros(0)
+                for column in columns}
+    schedule["paid_off"] = balance <= BALANCE_EPSILON
+    return schedule
+
+
+def schedule_summary(schedule, start=None):
+    """
+    Totales de un calendario: meses, total pagado, intereses, saldo pendiente y fecha del
+    último pago (si se da `start`, la fecha del primero).
+    """
+    months = len(schedule["month"])
+    summary = dict(
+        months=months,
+        total_paid=float(schedule["payment"].sum() + schedule["extra"].sum()),
+        total_interest=float(schedule["interest"].sum()),
+        remaining_balance=float(schedule["balance"][-1]) if months else 0.0,
+        paid_off=schedule["paid_off"],
+    )
+    if start is not None:
+        summary["payoff_date"] = add_months(start, months - 1) if months else start
+    return summary
+
+
+def payment_grid(principal, terms, annual_rates, recurring_extra=0.0):
+    """
+    Escenarios plazo × tasa en una sola llamada: filas = `annual_rates`, columnas = `terms`.
+    Devuelve la cuota de cada combinación y, pagando además `recurring_extra` al mes, los meses
+    hasta saldar el crédito, el total pagado y los intereses.
+    """
+    terms = np.asarray(terms, dtype=float)
+    rates = np.asarray(annual_rates, dtype=float)
+    payment = monthly_payment(principal, rates[:, None], terms[None, :])
+    installment = payment + recurring_extra
+    months = np.ceil(payoff_months(principal, rates[:, None], installment) - 1e-9)
+    # Todas las cuotas completas menos la última, que solo cubre el saldo pendiente y sus intereses.
+    last_due = balance_after(principal, rates[:, None], installment, months - 1) * (1 + monthly_rate(rates)[:, None])
+    total_paid = installment * (months - 1) + last_due
+    return dict(terms=terms, rates=rates, payment=payment, months=months, total_paid=total_paid,
+                total_interest=total_paid - principal)
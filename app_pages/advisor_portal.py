@@ -0,0 +1,41 @@
+import streamlit as st
+import time
+from app_resources import get_llm_gateway, load_model
+
+st.header("💼 Portal de Asesores")
+
+st.info("Herramientas para que los asesores gestionen y den seguimiento a las solicitudes de los clientes.")
+st.write("Aquí los asesores podrían:")
+st.markdown("- Ver un listado de todas las solicitudes de crédito (nuevas, en revisión, aprobadas).")
+st.markdown("- Acceder a los detalles de cada solicitud, incluyendo el análisis preliminar de IA.")
+st.markdown("- Cargar documentos adicionales solicitados a los clientes.")
+st.markdown("- Aprobar o rechazar solicitudes, con opciones para justificar la decisión.")
+st.markdown("- Enviar comunicaciones personalizadas a los clientes.")
+st.markdown("- Acceder a métricas de rendimiento y productividad.")
+
+st.subheader("Análisis de IA de las Solicitudes en Revisión")
+pending_applications = [app for app in st.session_state.dummy_user_data["loan_applications"] if app.get("status") == "En Revisión"]
+if st.button(f"Analizar {len(pending_applications)} solicitudes en revisión con IA", disabled=not pending_applications):
+    advisor_prompts = [
+        f"""
+        Eres un analista de crédito de Finanzauto y apoyas a un asesor comercial. Revisa esta solicitud de crédito automotriz:
+        - Solicitud: {app['id']} ({app['date']})
+        - Vehículo: {app['vehicle']}
+        - Monto solicitado: ${app['amount']:,.2f}
+        - Etapa actual: {app['stage']}
+
+        En un máximo de 5 viñetas, indica los principales riesgos a verificar, los documentos que el asesor debería pedir y el siguiente paso recomendado.
+        """
+        for app in pending_applications
+    ]
+    with st.spinner(f"Analizando {len(pending_applications)} solicitudes en paralelo..."):
+        batch_start = time.perf_counter()
+        advisor_analyses = load_model(get_llm_gateway).batch(advisor_prompts)
+        batch_seconds = time.perf_counter() - batch_start
+    st.caption(f"⏱️ {len(pending_applications)} análisis en {batch_seconds:.2f} s")
+    for app, analysis in zip(pending_applications, advisor_analyses):
+        with st.expander(f"Solicitud {app['id']}: {app['vehicle']}", expanded=True):
+            if isinstance(analysis, Exception):
+                st.error(f"No se pudo analizar esta solicitud. Error: {analysis}")
+            else:
+                st.markdown(analysis)
@@ -0,0 +1,85 @@
+import streamlit as st
+import numpy as np
+from app_resources import INVENTORY_DELTA_SIZE, NUM_CATALOG_VEHICLES, generate_random_vehicles, get_alert_matcher, get_alert_store, get_catalog_index
+from vehicle_alerts import process_inventory_delta
+
+st.header("🔔 Alertas de Vehículos")
+
+vehicles = generate_random_vehicles(num_vehicles=NUM_CATALOG_VEHICLES)
+st.info("Configura alertas personalizadas y te notificaremos cuando vehículos que coincidan con tus criterios estén disponibles.")
+
+alert_store = get_alert_store()
+
+st.subheader("Configurar Nueva Alerta")
+with st.form("vehicle_alert_form"):
+    alert_make = st.selectbox("Marca Preferida", options=["Cualquiera"] + get_catalog_index(vehicles).facet_values("make"), key="alert_make")
+    alert_model = st.text_input("Modelo Específico (opcional)", key="alert_model")
+    alert_max_price = st.number_input("Precio Máximo ($)", min_value=0, value=50000, step=1000, key="alert_max_price")
+    alert_type = st.multiselect("Tipos de Vehículo", options=get_catalog_index(vehicles).facet_values("type"), key="alert_type")
+    alert_email = st.text_input("Correo Electrónico para notificaciones", value=st.session_state.dummy_user_data["email"], key="alert_email")
+
+    submitted_alert = st.form_submit_button("Crear Alerta")
+
+    if submitted_alert:
+        if not alert_email:
+            st.warning("Por favor, ingresa un correo electrónico para las notificaciones.")
+        else:
+            alert_store.add_alert(
+                email=alert_email,
+                make=alert_make,
+                model=alert_model if alert_model else "Cualquiera",
+                max_price=alert_max_price,
+                types=alert_type if alert_type else "Cualquiera"
+            )
+            st.success("¡Alerta creada con éxito! Te notificaremos si encontramos vehículos que coincidan.")
+
+user_email = alert_email or st.session_state.dummy_user_data["email"]
+
+def deactivate_alert(alert_store, alert_id, number):
+    alert_store.set_status(alert_id, "Inactiva")
+    st.toast(f"Alerta #{number} desactivada.", icon="🔕")
+
+@st.fragment
+def user_alert_list(alert_store, user_email):
+    """
+    Alertas del usuario con sus botones para desactivarlas. Es un fragmento: desactivar una
+    alerta solo vuelve a ejecutar esta lista, no el formulario ni las notificaciones.
+    """
+    st.subheader("Tus Alertas Activas")
+    user_alerts = alert_store.alerts_for(user_email)
+    if user_alerts:
+        for i, alert in enumerate(user_alerts):
+            st.markdown(f"**Alerta #{i+1}**")
+            st.write(f"- Marca: {alert['make']} | Modelo: {alert['model']}")
+            st.write(f"- Precio Máximo: ${alert['max_price']:,.2f} | Tipo(s): {', '.join(alert['type']) if isinstance(alert['type'], list) else alert['type']}")
+            st.write(f"- Estado: {alert['status']} | Creada: {alert['created_date']}")
+            if alert['status'] == "Activa":
+                st.button(f"Desactivar Alerta {i+1}", key=f"deactivate_alert_{alert['id']}",
+                          on_click=deactivate_alert, args=(alert_store, alert['id'], i + 1))
+            else:
+                st.info("Esta alerta está inactiva.")
+            st.markdown("---")
+    else:
+        st.write("Aún no tienes alertas configuradas. ¡Crea una para no perderte tu vehículo ideal!")
+
+user_alert_list(alert_store, user_email)
+
+st.subheader("Notificaciones")
+st.caption(f"Cada lote de novedades de inventario ({INVENTORY_DELTA_SIZE} vehículos) se compara solo con las alertas candidatas según marca, tipo y precio máximo.")
+if st.button("Procesar Novedades de Inventario (Simulación)"):
+    # Simulación: cada lote toma los siguientes vehículos del catálogo como "recién llegados".
+    batch_number = alert_store.processed_batch_count()
+    start = (batch_number * INVENTORY_DELTA_SIZE) % len(vehicles)
+    delta_rows = np.arange(start, min(start + INVENTORY_DELTA_SIZE, len(vehicles)))
+    matcher = get_alert_matcher(alert_store.alerts_version())
+    num_notifications = process_inventory_delta(alert_store, matcher, vehicles, delta_rows, f"{vehicles.version}-{batch_number}")
+    st.success(f"Lote #{batch_number + 1} procesado: {len(delta_rows)} vehículos nuevos contra {len(matcher)} alertas activas, {num_notifications} notificaciones generadas.")
+
+user_notifications = alert_store.notifications_for(user_email)
+if user_notifications:
+    for notification in user_notifications:
+        matched_vehicles = [vehicles.get_by_id(vehicle_id) for vehicle_id in notification["vehicle_ids"]]
+        st.markdown(f"**📧 Para {notification['email']}** ({notification['created_at']}): {notification['num_matches']} vehículo(s) nuevo(s) coinciden con tu alerta.")
+        st.write(", ".join(f"{v['year']} {v['make']} {v['model']} (${v['price']:,.0f})" for v in matched_vehicles if v))
+else:
+    st.write("Aún no hay notificaciones para tus alertas.")
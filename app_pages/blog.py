@@ -0,0 +1,22 @@
+import streamlit as st
+
+st.header("📰 Blog")
+
+st.info("Artículos y noticias sobre el mundo automotriz, consejos financieros y novedades de Finanzauto.")
+st.write("Explora nuestros últimos posts:")
+st.markdown("---")
+st.markdown("#### **Guía Completa para Comprar tu Primer Auto Usado**")
+st.write("Aprende todo lo que necesitas saber para hacer una compra inteligente.")
+st.write("_Publicado el: 10 de Julio, 2025_")
+st.button("Leer Más", key="blog1")
+st.markdown("---")
+st.markdown("#### **5 Razones por las que un Vehículo Eléctrico Podría Ser tu Mejor Inversión**")
+st.write("Descubre los beneficios ambientales y económicos de la movilidad eléctrica.")
+st.write("_Publicado el: 1 de Julio, 2025_")
+st.button("Leer Más", key="blog2")
+st.markdown("---")
+st.markdown("#### **Cómo Mejorar tu Historial Crediticio para Obtener Mejores Tasas**")
+st.write("Consejos prácticos para fortalecer tu perfil financiero.")
+st.write("_Publicado el: 20 de Junio, 2025_")
+st.button("Leer Más", key="blog3")
+st.markdown("---")
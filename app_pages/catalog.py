@@ -0,0 +1,65 @@
+import streamlit as st
+from app_resources import NUM_CATALOG_VEHICLES, generate_random_vehicles, get_catalog_index
+from catalog_view import render_catalog_results
+
+st.header("🚗 Catálogo de Vehículos")
+
+vehicles = generate_random_vehicles(num_vehicles=NUM_CATALOG_VEHICLES)
+st.info(f"Explora nuestra selección de {len(vehicles):,} vehículos disponibles.")
+
+st.subheader("Filtros y Búsqueda")
+catalog_index = get_catalog_index(vehicles)
+
+@st.fragment
+def catalog_browser(vehicles, catalog_index):
+    """
+    Filtros y resultados del catálogo. Es un fragmento: cambiar un filtro, el orden o la página
+    solo vuelve a ejecutar esta función, no la página ni el script principal.
+    """
+    # Conteos por faceta según los filtros vigentes (los de la interacción anterior).
+    current_filters = dict(
+        search_query=st.session_state.get("catalog_search_query", "").lower(),
+        min_price=st.session_state.get("catalog_min_price", 0),
+        max_price=st.session_state.get("catalog_max_price", 150000),
+        types=st.session_state.get("catalog_types", []),
+        fuels=st.session_state.get("catalog_fuels", []),
+        min_year=st.session_state.get("catalog_year", 2018)
+    )
+    type_counts = catalog_index.facet_counts("type", **current_filters)
+    fuel_counts = catalog_index.facet_counts("fuel", **current_filters)
+
+    col_filter1, col_filter2, col_filter3 = st.columns(3)
+
+    with col_filter1:
+        search_query = st.text_input("Buscar por Marca o Modelo", "", key="catalog_search_query").lower()
+        min_price = st.number_input("Precio Mínimo ($)", min_value=0, value=0, step=1000, key="catalog_min_price")
+    with col_filter2:
+        max_price = st.number_input("Precio Máximo ($)", min_value=0, value=150000, step=1000, key="catalog_max_price")
+        selected_types = st.multiselect("Tipo de Vehículo", options=catalog_index.facet_values("type"),
+                                        format_func=lambda value: f"{value} ({type_counts[value]:,})", key="catalog_types")
+    with col_filter3:
+        selected_fuels = st.multiselect("Tipo de Combustible", options=catalog_index.facet_values("fuel"),
+                                        format_func=lambda value: f"{value} ({fuel_counts[value]:,})", key="catalog_fuels")
+        selected_year = st.slider("Año Mínimo", min_value=2018, max_value=2025, value=2018, key="catalog_year")
+
+    st.markdown("---")
+
+    # Los filtros se resuelven con los índices del catálogo, partiendo del más selectivo.
+    filtered_indices = catalog_index.filter(
+        search_query=search_query,
+        min_price=min_price,
+        max_price=max_price,
+        types=selected_types,
+        fuels=selected_fuels,
+        min_year=selected_year
+    )
+
+    st.write(f"Mostrando **{len(filtered_indices):,}** de **{len(vehicles):,}** vehículos que cumplen los criterios.")
+
+    if len(filtered_indices) > 0:
+        # Solo se renderiza y envía al navegador la página visible de resultados.
+        render_catalog_results(vehicles, filtered_indices, key="catalog")
+    else:
+        st.warning("No se encontraron vehículos que coincidan con tus criterios de búsqueda. Intenta ajustar los filtros.")
+
+catalog_browser(vehicles, catalog_index)
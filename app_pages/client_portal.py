@@ -0,0 +1,11 @@
+import streamlit as st
+
+st.header("👤 Portal de Clientes")
+
+st.info("Un espacio personalizado para que los clientes gestionen sus créditos y vehículos.")
+st.write("Aquí los clientes podrían:")
+st.markdown("- Ver el estado de sus solicitudes de crédito.")
+st.markdown("- Acceder a documentos de sus préstamos.")
+st.markdown("- Ver el historial de pagos y próximos vencimientos.")
+st.markdown("- Actualizar su información de contacto.")
+st.markdown("- Recibir ofertas personalizadas de vehículos o refinanciamientos.")
@@ -0,0 +1,78 @@
+import streamlit as st
+from app_resources import MAX_COMPARED_VEHICLES, NUM_CATALOG_VEHICLES, generate_random_vehicles, get_catalog_index
+
+st.header("⚖️ Comparador de Vehículos")
+
+vehicles = generate_random_vehicles(num_vehicles=NUM_CATALOG_VEHICLES)
+st.info(f"Busca y agrega hasta {MAX_COMPARED_VEHICLES} vehículos para comparar sus características lado a lado.")
+
+catalog_index = get_catalog_index(vehicles)
+if "compare_ids" not in st.session_state:
+    st.session_state.compare_ids = []
+
+def vehicle_label(vehicle_id):
+    # El id forma parte de la etiqueta: varios vehículos comparten marca, modelo y año.
+    vehicle = vehicles.get_by_id(vehicle_id)
+    return f"#{vehicle['id']} · {vehicle['make']} {vehicle['model']} ({vehicle['year']}) · ${vehicle['price']:,.0f}"
+
+def add_to_comparison(vehicle_id):
+    if vehicle_id not in st.session_state.compare_ids:
+        st.session_state.compare_ids.append(vehicle_id)
+
+def remove_from_comparison(vehicle_id):
+    st.session_state.compare_ids.remove(vehicle_id)
+
+@st.fragment
+def vehicle_comparator(vehicles, catalog_index):
+    """
+    Búsqueda, selección y comparación de vehículos. Es un fragmento: buscar, agregar, quitar o
+    comparar solo vuelve a ejecutar esta función. Agregar y quitar son callbacks, que se aplican
+    antes de dibujar la lista, así que no hace falta otro `st.rerun()`.
+    """
+    col1, col2 = st.columns(2)
+    with col1:
+        compare_query = st.text_input("Buscar vehículo (marca, modelo, año o ID)", key="compare_query")
+    # El selector solo recibe un número acotado de coincidencias del índice de prefijos.
+    matching_ids = [int(vehicles.columns["id"][row]) for row in catalog_index.typeahead.search(compare_query, limit=20)]
+    with col2:
+        # La clave depende de la búsqueda para que cada nueva lista de coincidencias preseleccione la primera.
+        picked_id = st.selectbox("Coincidencias", options=matching_ids, format_func=vehicle_label, key=f"compare_pick_{compare_query}")
+
+    compare_ids = st.session_state.compare_ids
+    st.button("Agregar al Comparador", disabled=picked_id is None or len(compare_ids) >= MAX_COMPARED_VEHICLES,
+              on_click=add_to_comparison, args=(picked_id,))
+
+    if compare_ids:
+        st.subheader("Vehículos Seleccionados")
+        for vehicle_id in list(compare_ids):
+            col_label, col_remove = st.columns([4, 1])
+            with col_label:
+                st.write(vehicle_label(vehicle_id))
+            with col_remove:
+                st.button("Quitar", key=f"compare_remove_{vehicle_id}", on_click=remove_from_comparison, args=(vehicle_id,))
+
+    if st.button("Comparar"):
+        # Cada vehículo se resuelve por id en tiempo constante, sin recorrer el catálogo.
+        vehicles_to_compare = [vehicles.get_by_id(vehicle_id) for vehicle_id in compare_ids]
+
+        if len(vehicles_to_compare) >= 2:
+            st.subheader("Comparación entre " + ", ".join(f"{v['make']} {v['model']}" for v in vehicles_to_compare))
+
+            def display_vehicle_details(vehicle):
+                st.write(f"**Año:** {vehicle['year']}")
+                st.write(f"**Precio:** ${vehicle['price']:,.2f}")
+                st.write(f"**Tipo:** {vehicle['type']}")
+                st.write(f"**Combustible:** {vehicle['fuel']}")
+                st.write(f"**Kilometraje:** {vehicle['mileage']:,} km")
+                st.write(f"**Color:** {vehicle['color']}")
+                st.write(f"**Características:** {', '.join(vehicle['features'])}")
+
+            for comp_col, vehicle in zip(st.columns(len(vehicles_to_compare)), vehicles_to_compare):
+                with comp_col:
+                    st.markdown(f"### {vehicle['make']} {vehicle['model']}")
+                    st.caption(f"ID #{vehicle['id']}")
+                    display_vehicle_details(vehicle)
+        else:
+            st.warning("Por favor, agrega al menos dos vehículos para comparar.")
+
+vehicle_comparator(vehicles, catalog_index)
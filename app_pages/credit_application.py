@@ -0,0 +1,42 @@
+import streamlit as st
+
+st.header("📝 Solicitud de Crédito")
+
+st.info("Por favor, rellena tus datos para solicitar un crédito automotriz.")
+with st.form("credit_application_form"):
+    st.subheader("Información Personal")
+    col1, col2 = st.columns(2)
+    with col1:
+        first_name = st.text_input("Nombre(s)", key="app_first_name")
+        email = st.text_input("Correo Electrónico", key="app_email")
+    with col2:
+        last_name = st.text_input("Apellido(s)", key="app_last_name")
+        phone = st.text_input("Teléfono", key="app_phone")
+
+    st.subheader("Información Financiera")
+    st.session_state.income = st.number_input("Ingresos Mensuales Netos ($)", min_value=0, value=2000, key="app_income")
+    st.session_state.existing_debts = st.number_input("Deudas Mensuales Existentes ($)", min_value=0, value=500, key="app_existing_debts")
+    st.session_state.desired_vehicle_price = st.number_input("Precio del Vehículo Deseado ($)", min_value=0, value=30000, key="app_desired_vehicle_price")
+
+    # New inputs for Personalización de Tasas
+    st.subheader("Información Adicional (para Personalización de Tasas)")
+    job_stability = st.selectbox("Estabilidad Laboral", ["Empleado Fijo", "Contratista", "Independiente", "Desempleado"], key="app_job_stability")
+    vehicle_type_interest = st.selectbox("Tipo de Vehículo de Interés", ["Sedan", "SUV", "Camioneta", "Deportivo", "Eléctrico"], key="app_vehicle_type_interest")
+
+    submitted = st.form_submit_button("Enviar Solicitud")
+    if submitted:
+        if not first_name or not last_name or not email:
+            st.warning("Por favor, completa todos los campos obligatorios.")
+        else:
+            st.success(f"Solicitud recibida para {first_name} {last_name}. Un asesor se pondrá en contacto pronto.")
+            st.json({
+                "nombre": first_name,
+                "apellido": last_name,
+                "email": email,
+                "telefono": phone,
+                "ingresos": st.session_state.income,
+                "deudas_existentes": st.session_state.existing_debts, 
+                "precio_vehiculo_deseado": st.session_state.desired_vehicle_price,
+                "estabilidad_laboral": job_stability,
+                "tipo_vehiculo_interes": vehicle_type_interest
+            })
@@ -0,0 +1,83 @@
+import streamlit as st
+
+st.header("🎮 Gamificación de Crédito")
+
+st.info("Completa hitos en tu proceso de crédito para ganar puntos y beneficios exclusivos.")
+
+if 'gamification_points' not in st.session_state:
+    st.session_state.gamification_points = 0
+if 'gamification_badges' not in st.session_state:
+    st.session_state.gamification_badges = []
+
+st.subheader(f"Tus Puntos Actuales: {st.session_state.gamification_points} ⭐")
+
+st.subheader("Hitos para Ganar Puntos:")
+
+col_game1, col_game2 = st.columns(2)
+
+milestones = [
+    {"name": "Perfil Completo", "desc": "Completa toda tu información en la 'Solicitud de Crédito'.", "points": 50, "condition_key": "app_first_name", "badge": "🌟 Perfil Pro"},
+    {"name": "Análisis Preliminar Realizado", "desc": "Utiliza la herramienta de 'Análisis Preliminar'.", "points": 75, "condition_key": "ai_preliminary_analysis_output", "badge": "🧠 Analista Novato"},
+    {"name": "Plan Recomendado", "desc": "Obtén una recomendación de plan en 'Recomendador de Planes'.", "points": 100, "condition_key": "recommended_plans_output", "badge": "💡 Planificador Experto"},
+    {"name": "Solicitud Aprobada (Demo)", "desc": "Tu solicitud de crédito ha sido aprobada (simulado).", "points": 200, "condition_key": "dummy_loan_approved", "badge": "✅ Crédito Aprobado"},
+]
+
+points_to_add = 0
+badges_to_add = []
+
+for milestone in milestones:
+    is_completed = False
+    if milestone["condition_key"] == "app_first_name":
+        if st.session_state.get("app_first_name") and st.session_state.get("app_last_name"):
+            is_completed = True
+    elif milestone["condition_key"] == "ai_preliminary_analysis_output":
+        if st.session_state.get("ai_preliminary_analysis_output"):
+            is_completed = True
+    elif milestone["condition_key"] == "recommended_plans_output":
+        if st.session_state.get("recommended_plans_output"):
+            is_completed = True
+    elif milestone["condition_key"] == "dummy_loan_approved":
+        if any(app['status'] == "Aprobada" for app in st.session_state.dummy_user_data['loan_applications']):
+            is_completed = True
+
+    if is_completed and milestone["badge"] not in st.session_state.gamification_badges:
+        points_to_add += milestone["points"]
+        badges_to_add.append(milestone["badge"])
+        st.toast(f"¡Ganaste {milestone['points']} puntos por '{milestone['name']}' y la insignia '{milestone['badge']}'!", icon="🎉")
+
+if points_to_add > 0 or badges_to_add:
+    st.session_state.gamification_points += points_to_add
+    st.session_state.gamification_badges.extend(badges_to_add)
+    st.rerun()
+
+for milestone in milestones:
+    is_current_completed = False
+    if milestone["condition_key"] == "app_first_name":
+        if st.session_state.get("app_first_name") and st.session_state.get("app_last_name"):
+            is_current_completed = True
+    elif milestone["condition_key"] == "ai_preliminary_analysis_output":
+        if st.session_state.get("ai_preliminary_analysis_output"):
+            is_current_completed = True
+    elif milestone["condition_key"] == "recommended_plans_output":
+        if st.session_state.get("recommended_plans_output"):
+            is_current_completed = True
+    elif milestone["condition_key"] == "dummy_loan_approved":
+        if any(app['status'] == "Aprobada" for app in st.session_state.dummy_user_data['loan_applications']):
+            is_current_completed = True
+
+    status_emoji = "✅ Completado" if is_current_completed else "⏳ Pendiente"
+
+    with col_game1:
+        st.markdown(f"**{milestone['name']}**")
+        st.write(f"- {milestone['desc']}")
+    with col_game2:
+        st.write(f"Puntos: {milestone['points']} | Estado: {status_emoji}")
+
+st.subheader("Tus Insignias:")
+if st.session_state.gamification_badges:
+    st.write(", ".join(st.session_state.gamification_badges))
+else:
+    st.write("Aún no tienes insignias. ¡Empieza a completar hitos!")
+
+st.markdown("---")
+st.info("Puntos y insignias son solo una simulación para demostrar la funcionalidad. Los beneficios reales se comunicarían oportunamente.")
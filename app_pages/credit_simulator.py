@@ -0,0 +1,75 @@
+import streamlit as st
+from datetime import date
+import numpy as np
+from amortization import MONTHS_PER_YEAR, add_months, amortization_schedule, payment_grid, schedule_summary
+
+st.header("💰 Simulador de Crédito")
+
+st.write("Calcula tus pagos estimados, el calendario completo de pagos y el efecto de los abonos a capital.")
+
+loan_amount = st.slider("Monto del Préstamo ($)", 5000, 100000, 30000, step=1000)
+loan_term_years = st.slider("Plazo (años)", 1, 7, 5)
+interest_rate = st.slider("Tasa de Interés Anual (%)", 2.0, 15.0, 7.5, step=0.1)
+
+with st.expander("Abonos a capital (opcional)"):
+    recurring_extra = st.number_input("Abono adicional cada mes ($)", min_value=0, value=0, step=50, key="credit_sim_recurring_extra")
+    col_lump1, col_lump2 = st.columns(2)
+    with col_lump1:
+        lump_sum = st.number_input("Abono extraordinario único ($)", min_value=0, value=0, step=500, key="credit_sim_lump_sum")
+    with col_lump2:
+        lump_sum_month = st.number_input("En el mes", min_value=1, max_value=loan_term_years * MONTHS_PER_YEAR, value=1, step=1, key="credit_sim_lump_sum_month")
+
+GRID_TERMS = np.arange(12, 85, 12)
+GRID_RATES = np.arange(2.0, 15.01, 1.0)
+GRID_VIEWS = {"Cuota mensual": "payment", "Intereses totales": "total_interest", "Meses hasta saldar": "months"}
+grid_view = st.selectbox("Tabla de escenarios plazo × tasa", options=list(GRID_VIEWS), key="credit_sim_grid_view")
+
+if st.button("Calcular"):
+    num_payments = loan_term_years * MONTHS_PER_YEAR
+    first_payment = add_months(date.today(), 1)
+    base = schedule_summary(amortization_schedule(loan_amount, interest_rate, num_payments), first_payment)
+    schedule = amortization_schedule(loan_amount, interest_rate, num_payments, recurring_extra=recurring_extra,
+                                     extra_payments={lump_sum_month: lump_sum} if lump_sum else None)
+    summary = schedule_summary(schedule, first_payment)
+    monthly_payment = float(schedule["payment"][0])
+
+    st.subheader("Resultados del Cálculo:")
+    st.write(f"**Monto del Préstamo:** ${loan_amount:,.2f}")
+    st.write(f"**Plazo:** {loan_term_years} años ({num_payments} meses)")
+    st.write(f"**Tasa de Interés Anual:** {interest_rate:.1f}%")
+    st.markdown("---")
+    st.success(f"**Pago Mensual Estimado:** ${monthly_payment:,.2f}")
+    st.info(f"**Pago Total Estimado:** ${summary['total_paid']:,.2f}")
+    st.info(f"**Intereses Totales Estimados:** ${summary['total_interest']:,.2f}")
+    st.write(f"**Fecha del Último Pago:** {summary['payoff_date']:%m/%Y}")
+
+    if recurring_extra or lump_sum:
+        col_saved1, col_saved2 = st.columns(2)
+        col_saved1.metric("Meses hasta saldar", summary["months"], delta=summary["months"] - base["months"], delta_color="inverse")
+        col_saved2.metric("Intereses ahorrados", f"${base['total_interest'] - summary['total_interest']:,.2f}")
+
+    st.subheader("Calendario de Pagos")
+    st.dataframe(
+        {
+            "Mes": schedule["month"],
+            "Fecha": [f"{add_months(first_payment, month - 1):%m/%Y}" for month in schedule["month"]],
+            "Cuota ($)": schedule["payment"],
+            "Abono ($)": schedule["extra"],
+            "Intereses ($)": schedule["interest"],
+            "Capital ($)": schedule["principal"],
+            "Saldo ($)": schedule["balance"],
+        },
+        hide_index=True,
+        column_config={column: st.column_config.NumberColumn(format="$%.2f")
+                       for column in ("Cuota ($)", "Abono ($)", "Intereses ($)", "Capital ($)", "Saldo ($)")},
+    )
+
+    st.subheader(f"Escenarios plazo × tasa: {grid_view}")
+    st.caption(f"Para ${loan_amount:,.0f}" + (f" con un abono adicional de ${recurring_extra:,.0f} cada mes." if recurring_extra else "."))
+    grid = payment_grid(loan_amount, GRID_TERMS, GRID_RATES, recurring_extra=recurring_extra)
+    values = grid[GRID_VIEWS[grid_view]]
+    table = {"Tasa (%)": [f"{rate:.1f}%" for rate in GRID_RATES]}
+    table.update({f"{term} meses": values[:, column] for column, term in enumerate(GRID_TERMS)})
+    number_format = "%d" if GRID_VIEWS[grid_view] == "months" else "$%.2f"
+    st.dataframe(table, hide_index=True,
+                 column_config={f"{term} meses": st.column_config.NumberColumn(format=number_format) for term in GRID_TERMS})
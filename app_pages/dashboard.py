@@ -0,0 +1,59 @@
+import streamlit as st
+import random
+from app_resources import NUM_CATALOG_VEHICLES, generate_random_vehicles
+
+st.header("📊 Dashboard del Usuario")
+
+st.info("¡Bienvenido, Juan Pérez! Aquí tienes un resumen de tu actividad en Finanzauto.")
+
+user_data = st.session_state.dummy_user_data
+if "favorite_vehicles" not in user_data:
+    # El catálogo solo se carga en las páginas que lo muestran.
+    vehicles = generate_random_vehicles(num_vehicles=NUM_CATALOG_VEHICLES)
+    user_data["favorite_vehicles"] = random.sample(vehicles, k=3)
+    user_data["recommended_vehicles"] = random.sample(vehicles, k=2)
+
+tab_titles = ["Todas las Solicitudes", "En Análisis/Revisión", "Documentos Pendientes", "Aprobadas", "Firmado/Desembolsado", "Rechazadas"]
+tabs = st.tabs(tab_titles)
+
+applications_by_stage = {
+    "Todas las Solicitudes": user_data["loan_applications"],
+    "En Análisis/Revisión": [app for app in user_data["loan_applications"] if app.get("stage") == "Análisis Preliminar" or app.get("status") == "En Revisión"],
+    "Documentos Pendientes": [app for app in user_data["loan_applications"] if app.get("stage") == "Recopilación de Documentos"],
+    "Aprobadas": [app for app in user_data["loan_applications"] if app.get("status") == "Aprobada"],
+    "Firmado/Desembolsado": [app for app in user_data["loan_applications"] if app.get("stage") == "Firma de Contrato" or app.get("stage") == "Desembolsado"],
+    "Rechazadas": [app for app in user_data["loan_applications"] if app.get("status") == "Rechazada"]
+}
+
+for i, tab_title in enumerate(tab_titles):
+    with tabs[i]:
+        st.subheader(f"Solicitudes: {tab_title}")
+        current_apps = applications_by_stage[tab_title]
+        if current_apps:
+            for app in current_apps:
+                status_emoji = "✅" if app.get("status") == "Aprobada" else "⏳" if app.get("status") == "En Revisión" else "❌"
+                st.markdown(f"- **Solicitud {app.get('id', 'N/A')}:** Vehículo: {app.get('vehicle', 'N/A')} | Monto: ${app.get('amount', 0):,.2f} | Estado: **{status_emoji} {app.get('status', 'Desconocido')}** | Etapa: _{app.get('stage', 'Desconocida')}_ ({app.get('date', 'N/A')})")
+                if "reason" in app:
+                    st.info(f"    *Razón:* {app['reason']}")
+            st.markdown("---")
+        else:
+            st.write(f"No hay solicitudes en la etapa '{tab_title}' en este momento.")
+
+st.subheader("Tus Vehículos Favoritos")
+if user_data["favorite_vehicles"]:
+    for fav_car in user_data["favorite_vehicles"]:
+        st.markdown(f"- **{fav_car['year']} {fav_car['make']} {fav_car['model']}** (Precio: ${fav_car['price']:,.2f})")
+        st.markdown(f"  *Tipo: {fav_car['type']}, Combustible: {fav_car['fuel']}*")
+    st.markdown("---")
+else:
+    st.write("Aún no has marcado ningún vehículo como favorito.")
+
+st.subheader("Recomendaciones de Vehículos para Ti")
+st.write("Basado en tus intereses y actividad, estas son algunas recomendaciones:")
+if user_data["recommended_vehicles"]:
+    for rec_car in user_data["recommended_vehicles"]:
+        st.markdown(f"- **{rec_car['year']} {rec_car['make']} {rec_car['model']}** (Precio: ${rec_car['price']:,.2f})")
+        st.markdown(f"  *Ideal para: [Explicación generada por IA en la sección de Recomendador de Planes]*")
+    st.markdown("---")
+else:
+    st.write("No hay recomendaciones personalizadas en este momento. Explora el catálogo o usa el recomendador.")
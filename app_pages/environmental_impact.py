@@ -0,0 +1,61 @@
+import streamlit as st
+
+st.header("🌎 Calculadora de Impacto Ambiental")
+
+st.info("Estima la huella de carbono de diferentes vehículos y descubre opciones más sostenibles.")
+
+with st.form("environmental_impact_form"):
+    col_env1, col_env2 = st.columns(2)
+    with col_env1:
+        env_vehicle_type = st.selectbox("Tipo de Vehículo", ["Gasolina", "Diésel", "Híbrido", "Eléctrico"], key="env_vehicle_type")
+        env_mileage_year = st.number_input("Kilometraje Anual Estimado (km)", min_value=1000, value=15000, step=1000, key="env_mileage_year")
+    with col_env2:
+        if env_vehicle_type == "Eléctrico":
+            env_fuel_efficiency = st.number_input("Consumo de Energía (Km/kWh)", min_value=0.1, value=5.0, step=0.1, key="env_fuel_efficiency_ev")
+            env_avg_price_fuel = st.number_input("Precio promedio de la Electricidad (COP/kWh)", min_value=100, value=600, step=10, key="env_avg_price_fuel_ev")
+        else:
+            env_fuel_efficiency = st.number_input("Consumo de Combustible (Km/Litro)", min_value=1.0, value=12.0, step=0.1, key="env_fuel_efficiency_ice")
+            env_avg_price_fuel = st.number_input("Precio promedio del Combustible (COP/Litro)", min_value=1000, value=9500, step=100, key="env_avg_price_fuel_ice")
+
+    submitted_env = st.form_submit_button("Calcular Huella y Costo")
+
+    if submitted_env:
+        co2_emissions_kg = 0
+        annual_fuel_cost = 0
+
+        if env_fuel_efficiency <= 0:
+            st.error("El consumo de combustible/energía debe ser mayor que cero.")
+        else:
+            if env_vehicle_type == "Gasolina":
+                liters_consumed = env_mileage_year / env_fuel_efficiency
+                co2_emissions_kg = liters_consumed * 2.3
+                annual_fuel_cost = liters_consumed * env_avg_price_fuel
+            elif env_vehicle_type == "Diésel":
+                liters_consumed = env_mileage_year / env_fuel_efficiency
+                co2_emissions_kg = liters_consumed * 2.6
+                annual_fuel_cost = liters_consumed * env_avg_price_fuel
+            elif env_vehicle_type == "Híbrido":
+                liters_consumed = env_mileage_year / env_fuel_efficiency
+                co2_emissions_kg = liters_consumed * 2.3 * 0.7
+                annual_fuel_cost = liters_consumed * env_avg_price_fuel
+            elif env_vehicle_type == "Eléctrico":
+                kwh_consumed = env_mileage_year / env_fuel_efficiency
+                co2_emissions_kg = kwh_consumed * 0.3
+                annual_fuel_cost = kwh_consumed * env_avg_price_fuel
+
+            st.subheader("Resultados del Impacto Ambiental y Costo Anual:")
+            st.success(f"**Emisiones de CO2 Anuales Estimadas:** {co2_emissions_kg:,.2f} kg")
+            st.info(f"**Costo Anual Estimado de Combustible/Electricidad:** ${annual_fuel_cost:,.2f} COP")
+
+            st.markdown("---")
+            st.subheader("Recomendaciones para Reducir Impacto:")
+            if env_vehicle_type in ["Gasolina", "Diésel"]:
+                st.write("- Considera opciones híbridas o eléctricas en tu próxima compra.")
+                st.write("- Mantén tu vehículo con un mantenimiento regular para mejorar la eficiencia.")
+                st.write("- Adopta hábitos de conducción eficientes (evita aceleraciones y frenadas bruscas).")
+            elif env_vehicle_type == "Híbrido":
+                st.write("- Aprovecha al máximo el modo eléctrico de tu vehículo.")
+                st.write("- Considera la transición a un vehículo 100% eléctrico para cero emisiones directas.")
+            elif env_vehicle_type == "Eléctrico":
+                st.write("- Asegúrate de cargar tu vehículo con energía de fuentes renovables si es posible (ej. paneles solares).")
+                st.write("- Sigue promoviendo la infraestructura de carga para vehículos eléctricos.")
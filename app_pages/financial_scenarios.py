@@ -0,0 +1,119 @@
+import streamlit as st
+from datetime import date
+from amortization import MAX_SCHEDULE_MONTHS, add_months, amortization_schedule, monthly_payment, payoff_months, schedule_summary
+from app_resources import PROMPT_CACHE_REFRESH_LABEL, write_cached_llm_stream
+from prompt_cache import bucket
+
+st.header("🔮 Simulador de Escenarios Financieros (IA)")
+
+st.info("Explora cómo diferentes situaciones financieras podrían afectar tu préstamo automotriz. Las cifras se calculan al instante; la IA te explica el resultado y te da consejos.")
+
+# Carga financiera máxima recomendada: cuotas de créditos sobre el ingreso mensual neto.
+MAX_DEBT_TO_INCOME = 0.40
+
+st.subheader("Datos Actuales de tu Préstamo (o simulados)")
+current_loan_amount = st.number_input("Monto actual de tu préstamo automotriz ($)", min_value=1000, value=25000, step=1000, key="sim_loan_amount")
+current_monthly_payment = st.number_input("Cuota mensual actual ($)", min_value=100, value=500, step=50, key="sim_monthly_payment")
+remaining_term = st.number_input("Plazo restante (meses)", min_value=1, value=36, step=1, key="sim_remaining_term")
+current_interest_rate = st.slider("Tasa de Interés Anual actual (%)", 2.0, 15.0, 8.0, step=0.1, key="sim_interest_rate")
+
+st.subheader("Escenario a Simular")
+scenario_type = st.selectbox("¿Qué escenario quieres simular?",
+                             options=["Cambio de Ingresos", "Deuda Adicional", "Pago Extra", "Refinanciamiento"], key="sim_scenario_type")
+
+scenario_value = 0
+if scenario_type == "Cambio de Ingresos":
+    scenario_value = st.number_input("Nuevo Ingreso Mensual Neto ($) (Ej: 2500)", min_value=0, value=2000, step=100, key="sim_scenario_income")
+elif scenario_type == "Deuda Adicional":
+    scenario_value = st.number_input("Monto de Nueva Deuda Mensual ($) (Ej: 200)", min_value=0, value=100, step=10, key="sim_scenario_debt")
+elif scenario_type == "Pago Extra":
+    scenario_value = st.number_input("Monto de Pago Extra Único ($) (Ej: 1000)", min_value=0, value=500, step=100, key="sim_scenario_extra_payment")
+elif scenario_type == "Refinanciamiento":
+    scenario_value = st.slider("Nueva Tasa de Interés Anual (%) (Ej: 6.5)", 2.0, 15.0, 6.5, step=0.1, key="sim_scenario_refi_rate")
+
+first_payment = add_months(date.today(), 1)
+current = schedule_summary(amortization_schedule(current_loan_amount, current_interest_rate, remaining_term,
+                                                 payment=current_monthly_payment), first_payment)
+if not current["paid_off"]:
+    st.error(f"Con una cuota de ${current_monthly_payment:,.2f} el préstamo no se salda en {MAX_SCHEDULE_MONTHS} meses: "
+             f"los intereses del primer mes ya son ${current_loan_amount * current_interest_rate / 1200:,.2f}. Revisa los datos del préstamo.")
+    st.stop()
+if abs(current["months"] - remaining_term) > 1:
+    st.caption(f"Con esta cuota, saldo y tasa el préstamo se salda en {current['months']} meses (no en {remaining_term}); "
+               "la comparación usa la cuota que ingresaste.")
+
+# Cada escenario se reduce a un nuevo calendario de pagos (otra cuota, un abono o otra tasa).
+scenario_payment = current_monthly_payment
+if scenario_type == "Cambio de Ingresos":
+    debt_to_income = current_monthly_payment / scenario_value if scenario_value else float("inf")
+    scenario_notes = f"La cuota actual representa el {debt_to_income:.0%} del nuevo ingreso (máximo recomendado: {MAX_DEBT_TO_INCOME:.0%})."
+    if debt_to_income > MAX_DEBT_TO_INCOME:
+        scenario_payment = MAX_DEBT_TO_INCOME * scenario_value
+        scenario_notes += f" Para bajar al {MAX_DEBT_TO_INCOME:.0%} la cuota tendría que ser de ${scenario_payment:,.2f} (reestructurando el plazo)."
+elif scenario_type == "Deuda Adicional":
+    scenario_notes = (f"Las obligaciones mensuales pasan de ${current_monthly_payment:,.2f} a ${current_monthly_payment + scenario_value:,.2f}. "
+                      f"Para mantener la misma carga mensual, la cuota del vehículo tendría que bajar a ${current_monthly_payment - scenario_value:,.2f} "
+                      "(reestructurando el plazo).")
+    scenario_payment = current_monthly_payment - scenario_value
+elif scenario_type == "Pago Extra":
+    scenario_notes = f"Abono único a capital de ${scenario_value:,.2f} junto con la próxima cuota; la cuota no cambia y el plazo se acorta."
+else:
+    scenario_payment = monthly_payment(current_loan_amount, scenario_value, current["months"])
+    scenario_notes = f"Refinanciamiento del saldo a {scenario_value:.1f}% anual en los mismos {current['months']} meses restantes."
+
+if payoff_months(current_loan_amount, current_interest_rate if scenario_type != "Refinanciamiento" else scenario_value,
+                 scenario_payment) > MAX_SCHEDULE_MONTHS:
+    st.warning(f"En este escenario la cuota del vehículo tendría que ser de ${max(scenario_payment, 0):,.2f}, que no alcanza a cubrir "
+               "los intereses del saldo actual: el préstamo no se podría saldar.")
+    st.stop()
+scenario = schedule_summary(amortization_schedule(
+    current_loan_amount, scenario_value if scenario_type == "Refinanciamiento" else current_interest_rate, current["months"],
+    payment=scenario_payment, extra_payments={1: scenario_value} if scenario_type == "Pago Extra" else None), first_payment)
+
+st.subheader("Impacto del Escenario")
+st.write(scenario_notes)
+col_payment, col_months, col_interest, col_date = st.columns(4)
+col_payment.metric("Cuota mensual", f"${scenario_payment:,.2f}", delta=f"{scenario_payment - current_monthly_payment:,.2f}", delta_color="inverse")
+col_months.metric("Meses restantes", scenario["months"], delta=scenario["months"] - current["months"], delta_color="inverse")
+col_interest.metric("Intereses totales", f"${scenario['total_interest']:,.2f}",
+                    delta=f"{scenario['total_interest'] - current['total_interest']:,.2f}", delta_color="inverse")
+col_date.metric("Último pago", f"{scenario['payoff_date']:%m/%Y}", delta=f"antes: {current['payoff_date']:%m/%Y}", delta_color="off")
+
+refresh_scenario = st.checkbox(PROMPT_CACHE_REFRESH_LABEL, key="sim_refresh")
+simulate_button = st.button("Explicar este Escenario con IA")
+
+if simulate_button:
+    with st.spinner("Analizando tu escenario financiero..."):
+        scenario_template = """
+        Eres un experto en finanzas personales de Finanzauto. Explica a un cliente el impacto de un escenario financiero en su préstamo automotriz.
+        Las cifras salen del calendario de amortización, con los montos redondeados a 2 cifras significativas: preséntalos como aproximados (el cliente ve los valores exactos en pantalla) y no vuelvas a calcularlos.
+
+        Préstamo Actual:
+        - Saldo: ${current_loan_amount:,.2f}
+        - Cuota Mensual: ${current_monthly_payment:,.2f}
+        - Tasa de Interés Anual: {current_interest_rate:.1f}%
+        - Meses hasta saldarlo: {current_months}
+        - Intereses por pagar: ${current_interest:,.2f}
+
+        Escenario: "{scenario_type}" ({scenario_value})
+        - Cuota Mensual: ${scenario_payment:,.2f}
+        - Meses hasta saldarlo: {scenario_months}
+        - Intereses por pagar: ${scenario_interest:,.2f}
+
+        Explica con claridad qué cambia en la cuota, el plazo y los intereses, y ofrece consejos prácticos sobre cómo manejar este escenario o aprovecharlo. Utiliza formato de moneda de Colombia ($ pesos con puntos para miles y comas para decimales, ej. $1.000.000,00).
+        """
+        try:
+            st.subheader("Análisis de Escenario por IA:")
+            # Montos a 2 cifras significativas (también en el prompt, que los presenta como aproximados): escenarios
+            # equivalentes comparten la respuesta guardada sin que esta cite las cifras exactas de otro escenario.
+            scenario_inputs = dict(
+                current_loan_amount=bucket(current_loan_amount), current_monthly_payment=bucket(current_monthly_payment),
+                current_interest_rate=round(current_interest_rate, 1), current_months=current["months"],
+                current_interest=bucket(current["total_interest"]), scenario_type=scenario_type,
+                scenario_value=f"{scenario_value:.1f}%" if scenario_type == "Refinanciamiento" else bucket(scenario_value),
+                scenario_payment=bucket(scenario_payment), scenario_months=scenario["months"],
+                scenario_interest=bucket(scenario["total_interest"]),
+            )
+            write_cached_llm_stream("Simulador de Escenarios Financieros (IA)", scenario_template, scenario_inputs, refresh=refresh_scenario) # Usar el único LLM configurado
+        except Exception as e:
+            st.error(f"Lo siento, no pude simular el escenario en este momento. Por favor, inténtalo de nuevo. Error: {e}")
@@ -0,0 +1,10 @@
+import streamlit as st
+
+st.header("🌐 Soporte Multi-idioma")
+
+st.info("Selecciona el idioma de tu preferencia para la interfaz y el Asistente AI.")
+
+selected_language = st.selectbox("Idioma de la Interfaz", options=["Español", "English", "Português"], key="app_language")
+
+st.success(f"Idioma de la interfaz establecido a: **{selected_language}**.")
+st.write("Nota: La implementación completa del multi-idioma (traducción de todos los textos y respuestas de la IA) es una funcionalidad compleja que requiere integración profunda y servicios de traducción para el modelo de IA. Esta es una demostración conceptual.")
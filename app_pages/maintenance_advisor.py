@@ -0,0 +1,35 @@
+import streamlit as st
+from app_resources import PROMPT_CACHE_REFRESH_LABEL, write_cached_llm_stream
+
+st.header("🔧 Asesor de Mantenimiento (IA)")
+
+st.info("Pregunta a nuestra IA sobre problemas de tu vehículo, mantenimiento recomendado o costos de reparación.")
+
+with st.form("maintenance_advisor_form"):
+    vehicle_make_model = st.text_input("Marca y Modelo de tu Vehículo (Ej: Toyota Corolla 2020)", key="maint_vehicle_model")
+    problem_description = st.text_area("Describe tu pregunta o problema (Ej: 'ruido en el motor al encender', 'cuándo cambiar las bujías de un Mazda 3')", key="maint_problem_desc")
+
+    refresh_maintenance = st.checkbox(PROMPT_CACHE_REFRESH_LABEL, key="maint_refresh")
+    submitted_maint = st.form_submit_button("Obtener Asesoría")
+
+    if submitted_maint:
+        if not vehicle_make_model or not problem_description:
+            st.warning("Por favor, ingresa el modelo de tu vehículo y describe tu pregunta.")
+        else:
+            with st.spinner("Buscando la mejor asesoría para ti..."):
+                maintenance_template = """
+                Eres un asesor experto en mantenimiento automotriz de Finanzauto. El cliente tiene un **{vehicle_make_model}** y su pregunta/problema es: "{problem_description}".
+
+                Por favor, proporciona una respuesta detallada que incluya:
+                1.  Una posible causa o explicación del problema (si aplica).
+                2.  Posibles soluciones o acciones a tomar.
+                3.  Recomendaciones de mantenimiento preventivo relacionadas (si aplica).
+                4.  Una estimación general de costos si es una reparación común (ej. "puede variar entre $XXX.XXX y $YYY.YYY COP", usando formato de miles con punto y decimales con coma).
+                5.  Una advertencia para buscar un profesional si el problema es serio.
+                """
+                try:
+                    st.subheader("Asesoría de Mantenimiento de IA:")
+                    maintenance_inputs = dict(vehicle_make_model=vehicle_make_model, problem_description=problem_description)
+                    write_cached_llm_stream("Asesor de Mantenimiento (IA)", maintenance_template, maintenance_inputs, refresh=refresh_maintenance) # Usar el único LLM configurado
+                except Exception as e:
+                    st.error(f"Lo siento, no pude generar la asesoría en este momento. Por favor, inténtalo de nuevo. Error: {e}")
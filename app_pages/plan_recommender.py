@@ -0,0 +1,230 @@
+import streamlit as st
+import math
+import random
+from app_resources import get_llm_gateway, load_model, write_llm_stream
+
+st.header("💡 Recomendador de Planes")
+
+st.info("Cuéntanos sobre tus necesidades y te ayudaremos a encontrar el plan de financiamiento ideal.")
+
+with st.form("financial_plan_recommender_form"):
+    st.subheader("Tus Datos Financieros y Preferencias")
+
+    col_form1, col_form2 = st.columns(2)
+    with col_form1:
+        vehicle_value = st.number_input("Valor del Vehículo Deseado ($)", min_value=10000, value=50000, step=1000, key="reco_vehicle_value")
+        initial_payment = st.number_input("Cuota Inicial ($)", min_value=0, value=10000, step=500, key="reco_initial_payment")
+        monthly_income = st.number_input("Ingresos Mensuales Netos ($)", min_value=500, value=3000, step=100, key="reco_monthly_income")
+    with col_form2:
+        monthly_expenses = st.number_input("Gastos Mensuales (sin auto) ($)", min_value=0, value=1000, step=50, key="reco_monthly_expenses")
+        credit_history = st.selectbox(
+            "Historial de Crédito",
+            options=["Excelente", "Bueno", "Regular", "Limitado/Sin historial"],
+            key="reco_credit_history"
+        )
+        priority = st.selectbox(
+            "¿Qué priorizas en tu crédito?",
+            options=["Cuota mensual baja", "Pagar el préstamo rápidamente", "Flexibilidad en pagos/refinanciamiento", "Bajas tasas de interés"],
+            key="reco_priority"
+        )
+        # Input para personalización de Tasas
+        job_stability_reco = st.selectbox("Estabilidad Laboral (para personalización)", ["Empleado Fijo", "Contratista", "Independiente", "Desempleado"], key="reco_job_stability")
+        vehicle_type_interest_reco = st.selectbox("Tipo de Vehículo de Interés (para personalización)", ["Sedan", "SUV", "Camioneta", "Deportivo", "Eléctrico"], key="reco_vehicle_type_interest")
+
+    submitted_reco = st.form_submit_button("Encontrar mi Plan Ideal")
+
+    if submitted_reco:
+        if vehicle_value <= initial_payment:
+            st.error("El valor del vehículo debe ser mayor que la cuota inicial.")
+        elif monthly_income <= monthly_expenses:
+            st.error("Tus ingresos mensuales deben ser mayores que tus gastos mensuales para calificar.")
+        else:
+            with st.spinner("Analizando tus datos y encontrando planes ideales..."):
+                loan_amount = vehicle_value - initial_payment
+                disposable_income = monthly_income - monthly_expenses
+
+                dummy_loan_plans_data = [
+                    {"name": "Plan Balance Ideal", "description": "Este plan está diseñado para un pago mensual equilibrado, ajustándose a tus ingresos y gastos, mientras mantiene la deuda manejable. Es la opción más sensata considerando tu preferencia por un balance.", "min_term": 48, "max_term": 72, "base_rate": 0.22, "priority_match": ["Cuota mensual baja", "Flexibilidad en pagos/refinanciamiento"], "income_factor": 0.35},
+                    {"name": "Plan Pago Rápido", "description": "Si tu objetivo es reducir la deuda y minimizar los intereses totales, este plan te permite pagar más rápido con cuotas más altas pero un plazo menor.", "min_term": 24, "max_term": 48, "base_rate": 0.20, "priority_match": ["Pagar el préstamo rápidamente", "Bajas tasas de interés"], "income_factor": 0.45},
+                    {"name": "Plan Flexi-Cuota", "description": "Con plazos extendidos y la opción de pagos extraordinarios, este plan ofrece máxima flexibilidad para adaptarse a cambios en tu situación financiera.", "min_term": 60, "max_term": 84, "base_rate": 0.25, "priority_match": ["Flexibilidad en pagos/refinanciamiento", "Cuota mensual baja"], "income_factor": 0.30},
+                ]
+
+                generated_plans_info = []
+
+                for plan_template in dummy_loan_plans_data:
+                    adjusted_rate = plan_template["base_rate"]
+                    if credit_history == "Excelente":
+                        adjusted_rate -= 0.02
+                    elif credit_history == "Bueno":
+                        adjusted_rate -= 0.01
+                    elif credit_history == "Limitado/Sin historial":
+                        adjusted_rate += 0.03
+
+                    if job_stability_reco == "Empleado Fijo":
+                        adjusted_rate -= 0.005
+                    elif job_stability_reco == "Independiente":
+                        adjusted_rate += 0.01
+
+                    if vehicle_type_interest_reco == "Eléctrico":
+                        adjusted_rate -= 0.005
+
+                    adjusted_rate = max(0.18, adjusted_rate)
+
+                    calculated_term_months = 60
+
+                    if plan_template["name"] == "Plan Pago Rápido":
+                        target_payment_ratio = 0.35
+                        target_payment = disposable_income * target_payment_ratio
+
+                        if target_payment <= 0:
+                            calculated_term_months = plan_template["max_term"]
+                        else:
+                            monthly_rate = adjusted_rate / 12
+                            if monthly_rate > 0:
+                                log_arg = 1 - (monthly_rate * loan_amount) / target_payment
+                                if log_arg <= 0:
+                                    calculated_term_months = plan_template["max_term"]
+                                else:
+                                    term_calc = -math.log(log_arg) / math.log(1 + monthly_rate)
+                                    calculated_term_months = round(term_calc)
+                            else:
+                                calculated_term_months = round(loan_amount / target_payment) if target_payment > 0 else plan_template["max_term"]
+
+                        calculated_term_months = max(plan_template["min_term"], min(plan_template["max_term"], calculated_term_months))
+
+                    elif plan_template["name"] == "Plan Flexi-Cuota":
+                        target_payment_ratio = 0.25
+                        target_payment = disposable_income * target_payment_ratio
+
+                        if target_payment <= 0:
+                            calculated_term_months = plan_template["max_term"]
+                        else:
+                            monthly_rate = adjusted_rate / 12
+                            if monthly_rate > 0:
+                                log_arg = 1 - (monthly_rate * loan_amount) / target_payment
+                                if log_arg <= 0:
+                                    calculated_term_months = plan_template["max_term"]
+                                else:
+                                    term_calc = -math.log(log_arg) / math.log(1 + monthly_rate)
+                                    calculated_term_months = round(term_calc)
+                            else:
+                                calculated_term_months = round(loan_amount / target_payment) if target_payment > 0 else plan_template["max_term"]
+
+                        calculated_term_months = max(plan_template["min_term"], min(plan_template["max_term"], calculated_term_months))
+
+                    if not (plan_template["min_term"] <= calculated_term_months <= plan_template["max_term"]):
+                        calculated_term_months = random.randint(plan_template["min_term"], plan_template["max_term"])
+
+                    monthly_rate = adjusted_rate / 12
+                    if monthly_rate > 0 and calculated_term_months > 0:
+                        denominator = (1 - (1 + monthly_rate)**-calculated_term_months)
+                        if denominator == 0:
+                            monthly_payment = loan_amount / calculated_term_months
+                        else:
+                            monthly_payment = (loan_amount * monthly_rate) / denominator
+                    else:
+                        monthly_payment = loan_amount / calculated_term_months if calculated_term_months > 0 else 0
+
+                    total_payment = monthly_payment * calculated_term_months
+                    total_interest = total_payment - loan_amount
+
+                    generated_plans_info.append({
+                        "name": plan_template["name"],
+                        "description": plan_template["description"],
+                        "cuota_mensual": monthly_payment,
+                        "plazo_meses": calculated_term_months,
+                        "tasa_anual": adjusted_rate * 100,
+                        "monto_financiado": loan_amount,
+                        "intereses_totales": total_interest,
+                        "advantages": [],
+                        "disadvantages": []
+                    })
+
+                plans_for_ai_prompt = ""
+                for i, plan in enumerate(generated_plans_info):
+                    plans_for_ai_prompt += f"Plan {i+1}:\n"
+                    plans_for_ai_prompt += f"  Nombre: {plan['name']}\n"
+                    plans_for_ai_prompt += f"  Descripción: {plan['description']}\n"
+                    plans_for_ai_prompt += f"  Cuota Mensual Estimada: ${plan['cuota_mensual']:,.2f}\n"
+                    plans_for_ai_prompt += f"  Plazo: {plan['plazo_meses']} meses\n"
+                    plans_for_ai_prompt += f"  Tasa Anual: {plan['tasa_anual']:.2f}% E.A.\n"
+                    plans_for_ai_prompt += f"  Monto Financiado: ${plan['monto_financiado']:,.2f}\n"
+                    plans_for_ai_prompt += f"  Intereses Totales: ${plan['intereses_totales']:,.2f}\n\n"
+
+                ai_prompt = f"""
+                Como experto financiero de Finanzauto, te proporciono los datos de un cliente y tres posibles planes de financiamiento.
+                Tu tarea es:
+                1. Reafirmar cuál de los planes es el **más adecuado** basado en la prioridad del cliente.
+                2. Para cada plan, genera una sección de "Ventajas" y "Desventajas" específicas, considerando los datos del cliente y el plan.
+                3. La descripción inicial de cada plan ya está provista, pero puedes complementarla si lo consideras necesario.
+
+                Datos del Cliente:
+                - Valor del Vehículo Deseado: ${vehicle_value:,.2f}
+                - Cuota Inicial: ${initial_payment:,.2f}
+                - Monto a Financiar: ${loan_amount:,.2f}
+                - Ingresos Mensuales Netos: ${monthly_income:,.2f}
+                - Gastos Mensuales (sin auto): ${monthly_expenses:,.2f}
+                - Ingreso Disponible (para pago de deuda): ${disposable_income:,.2f}
+                - Historial de Crédito: {credit_history}
+                - Prioridad en el Crédito: "{priority}"
+                - Estabilidad Laboral: {job_stability_reco}
+                - Tipo de Vehículo de Interés: {vehicle_type_interest_reco}
+
+                Planes de Financiamiento Calculados (pre-calculados):
+                {plans_for_ai_prompt}
+
+                Genera la salida estructurada como una lista de tarjetas. Cada tarjeta debe seguir exactamente este formato Markdown, incluyendo los saltos de línea y el formato negrita/itálica.
+                Asegúrate de que los valores numéricos estén formateados con puntos para miles y comas para decimales, y el símbolo de dólar ($) al inicio, como "$ 1.145.775".
+
+                ---
+                **[Nombre del Plan]**
+                [Descripción del plan, puede ser la proporcionada o ligeramente mejorada por la IA]
+                **Cuota Mensual Estimada**
+                $[Cuota Mensual del Plan, formateada]
+                **Plazo**
+                [Plazo en meses] meses
+                **Tasa Anual**
+                [Tasa anual formateada]% E.A.
+                **Monto Financiado**
+                $[Monto Financiado formateado]
+                **Intereses Totales**
+                $[Intereses Totales formateado]
+
+                **Ventajas**
+                * [Ventaja 1 específica del plan y del cliente]
+                * [Ventaja 2 específica del plan y del cliente]
+                * [Ventaja 3 específica del plan y del cliente]
+
+                **Desventajas**
+                * [Desventaja 1 específica del plan y del cliente]
+                * [Desventaja 2 específica del plan y del cliente]
+                * [Desventaja 3 específica del plan y del cliente]
+                ---
+
+                Asegúrate de generar 3 tarjetas, una por cada plan proporcionado en la entrada, y que la "Descripción" de cada plan sea adecuada y coherente con el nombre y la filosofía del plan.
+                """
+
+                try:
+                    # El texto se muestra mientras llega y luego se reemplaza por las tarjetas de abajo.
+                    stream_placeholder = st.empty()
+                    with stream_placeholder.container():
+                        ai_recommendations_markdown = write_llm_stream("Recomendador de Planes", load_model(get_llm_gateway).stream(ai_prompt)) # Usar el único LLM configurado
+                    stream_placeholder.empty()
+                    st.session_state["recommended_plans_output"] = ai_recommendations_markdown
+
+                except Exception as e:
+                    st.error(f"Lo siento, hubo un error al generar las recomendaciones de planes. Por favor, inténtalo de nuevo. Error: {e}")
+                    st.session_state["recommended_plans_output"] = None
+
+if "recommended_plans_output" in st.session_state and st.session_state["recommended_plans_output"]:
+    st.subheader("Planes de Financiamiento Recomendados")
+    raw_cards = st.session_state["recommended_plans_output"].split("---")
+    processed_cards = [card.strip() for card in raw_cards if card.strip()]
+
+    if processed_cards:
+        for i, card_content in enumerate(processed_cards):
+            st.markdown(card_content)
+            st.button(f"Seleccionar este Plan (Plan {i+1})", key=f"select_plan_{i}")
+            st.markdown("---")
+    else:
+        st.warning("No se pudieron generar recomendaciones de planes. Por favor, ajusta tus datos.")
@@ -0,0 +1,83 @@
+import streamlit as st
+import random
+from app_resources import PROMPT_CACHE_REFRESH_LABEL, write_cached_llm_stream
+from prompt_cache import bucket
+
+st.header("🔎 Análisis Preliminar")
+
+st.info("Aquí se mostrará un análisis automatizado inicial de tu elegibilidad, basado en la información que proporciones en la sección de 'Solicitud de Crédito'.")
+
+income = st.session_state.get('income', 0)
+existing_debts = st.session_state.get('existing_debts', 0)
+desired_vehicle_price = st.session_state.get('desired_vehicle_price', 0)
+
+if income == 0 and existing_debts == 0 and desired_vehicle_price == 0:
+    st.warning("Por favor, completa la 'Solicitud de Crédito' para obtener un análisis preliminar.")
+else:
+    st.subheader("Tus Datos de Solicitud (para el análisis):")
+    st.write(f"- Ingresos Mensuales Netos: ${income:,.2f}")
+    st.write(f"- Deudas Mensuales Existentes: ${existing_debts:,.2f}")
+    st.write(f"- Precio del Vehículo Deseado: ${desired_vehicle_price:,.2f}")
+
+    refresh_analysis = st.checkbox(PROMPT_CACHE_REFRESH_LABEL, key="analysis_refresh")
+    if st.button("Realizar Análisis Preliminar con IA"):
+        with st.spinner("Analizando tus datos con IA..."):
+            try:
+                credit_rules_prompt = """
+                Reglas de elegibilidad generales para un préstamo automotriz:
+                1. La relación Ingresos/Deudas (DTI) después de la posible cuota del vehículo idealmente no debe exceder el 40% del ingreso neto.
+                2. Un buen indicador de capacidad de pago es que el ingreso neto sea al menos 3 veces el pago mensual estimado.
+                3. El precio del vehículo deseado no debe ser excesivamente alto en comparación con los ingresos (e.g., no más de 3 veces el ingreso anual).
+                4. Se valora un ingreso neto superior a $1,500 USD mensuales.
+                5. El total de deudas (existentes + pago estimado del vehículo) no debe superar el 60% del ingreso neto.
+                """
+
+                # Las reglas se evalúan con las cifras exactas; el prompt recibe los montos redondeados a 2 cifras
+                # significativas y ese resultado, así que solo comparten respuesta guardada las solicitudes
+                # equivalentes que además cumplen las mismas reglas.
+                estimated_monthly_payment = (desired_vehicle_price * 0.08 / 12) / (1 - (1 + 0.08 / 12)**-(60))
+                total_debts = existing_debts + estimated_monthly_payment
+                rule_checks = [
+                    total_debts <= 0.40 * income,
+                    income >= 3 * estimated_monthly_payment,
+                    desired_vehicle_price <= 3 * 12 * income,
+                    income > 1500,
+                    total_debts <= 0.60 * income,
+                ]
+                rule_results = "; ".join(f"regla {number}: {'cumple' if passed else 'no cumple'}"
+                                         for number, passed in enumerate(rule_checks, start=1))
+
+                fraud_detection_result = "No se detectaron anomalías significativas (simulado)."
+                if random.random() < 0.05:
+                    fraud_detection_result = "Anomalía detectada: Posible inconsistencia en la relación ingresos/precio del vehículo. Requiere revisión manual."
+
+                analysis_template = """
+                Eres un analista de crédito de Finanzauto. Necesito tu análisis preliminar de la elegibilidad de un cliente para un préstamo automotriz.
+                Aquí están los datos del cliente, redondeados a 2 cifras significativas (preséntalos como aproximados; el cliente ve sus cifras exactas en pantalla):
+                - Ingresos Mensuales Netos: ${income:,.0f}
+                - Deudas Mensuales Existentes (excluyendo el posible préstamo del auto): ${existing_debts:,.0f}
+                - Precio del Vehículo Deseado: ${desired_vehicle_price:,.0f}
+                - Pago mensual estimado del vehículo deseado (basado en un cálculo promedio): ${estimated_monthly_payment:,.0f}
+
+                {credit_rules_prompt}
+
+                Resultado de cada regla, evaluada con las cifras exactas del cliente (tómalo tal cual, no lo recalcules con las cifras aproximadas): {rule_results}.
+
+                Basado en estos datos y las reglas generales, por favor, proporciona un análisis preliminar conciso.
+                Clasifica la elegibilidad en una de estas categorías: "Altamente Probable", "Requiere Revisión Adicional", "Poco Probable".
+                Explica brevemente las razones de tu clasificación y sugiere qué pasos podría tomar el cliente si la elegibilidad no es "Altamente Probable".
+                Además, incluye un apartado de 'Detección de Fraude (IA)' con el siguiente resultado: "{fraud_detection_result}".
+                """
+
+                st.subheader("Resultados del Análisis Preliminar de IA:")
+                analysis_inputs = dict(
+                    income=bucket(income), existing_debts=bucket(existing_debts), desired_vehicle_price=bucket(desired_vehicle_price),
+                    estimated_monthly_payment=bucket(estimated_monthly_payment), rule_results=rule_results,
+                    credit_rules_prompt=credit_rules_prompt,
+                    fraud_detection_result=fraud_detection_result,
+                )
+                ai_analysis = write_cached_llm_stream("Análisis Preliminar", analysis_template, analysis_inputs, refresh=refresh_analysis) # Usar el único LLM configurado
+                st.session_state["ai_preliminary_analysis_output"] = ai_analysis
+
+            except Exception as e:
+                st.error(f"Lo siento, hubo un error al realizar el análisis. Por favor, inténtalo de nuevo. Error: {e}")
@@ -0,0 +1,62 @@
+import streamlit as st
+import time
+import uuid
+from app_resources import get_chat_archive, get_collection_versions, get_llm_gateway, get_rag_response, load_model, open_vector_store, write_llm_stream
+from chat_history import ARCHIVE_PAGE_TURNS, ChatHistory, summarize_turns
+
+st.header("🤖 Asistente AI (RAG)")
+
+st.info("¡Hola! Soy tu asistente de Finanzauto. Hazme preguntas sobre nuestros servicios o los documentos que has cargado.")
+vector_store, _ = open_vector_store()
+llm_gateway = load_model(get_llm_gateway)
+
+# Solo los últimos turnos quedan en la sesión y se dibujan en cada rerun; los anteriores se
+# archivan en disco y se resumen para dar contexto a las preguntas de seguimiento.
+if not isinstance(st.session_state.get("chat_history"), ChatHistory):
+    st.session_state.chat_history = ChatHistory(uuid.uuid4().hex)
+    st.session_state.chat_archive_shown = 0
+chat = st.session_state.chat_history
+
+def show_more_archived_turns(chat):
+    st.session_state.chat_archive_shown = min(chat.archived, st.session_state.chat_archive_shown + ARCHIVE_PAGE_TURNS)
+
+@st.fragment
+def chat_panel(chat, vector_store, llm_gateway):
+    """
+    Historial y entrada del chat. Es un fragmento: cada pregunta solo vuelve a ejecutar esta
+    función (buscar, responder y dibujar la ventana reciente), no la página.
+    """
+    if chat.archived:
+        with st.expander(f"🗂️ {chat.archived} turnos anteriores"):
+            if chat.summary:
+                st.caption(f"Resumen: {chat.summary}")
+            shown = st.session_state.chat_archive_shown
+            if shown < chat.archived:
+                st.button(f"Cargar {min(ARCHIVE_PAGE_TURNS, chat.archived - shown)} turnos anteriores", key="chat_load_archive",
+                          on_click=show_more_archived_turns, args=(chat,))
+            for question, answer in get_chat_archive().load(chat.session_id, chat.archived - shown, chat.archived):
+                with st.chat_message("user"):
+                    st.markdown(question)
+                with st.chat_message("assistant"):
+                    st.markdown(answer)
+
+    for question, answer in chat.turns:
+        with st.chat_message("user"):
+            st.markdown(question)
+        with st.chat_message("assistant"):
+            st.markdown(answer)
+
+    if prompt := st.chat_input("Escribe tu pregunta aquí..."):
+        # La versión se vuelve a leer: otra sesión pudo ingerir documentos desde la última ejecución de la página.
+        collection_version = get_collection_versions().get(vector_store._collection.name)
+        with st.chat_message("user"):
+            st.markdown(prompt)
+
+        with st.chat_message("assistant"):
+            # Llama a la función RAG, usando el LLM único; la respuesta se muestra a medida que llega
+            ai_response = write_llm_stream("Asistente AI (RAG)", get_rag_response(prompt, vector_store, llm_gateway, collection_version, chat.context()), start=time.perf_counter())
+        chat.add_turn(prompt, ai_response, get_chat_archive())
+        if chat.needs_summary():
+            chat.update_summary(lambda summary, turns: summarize_turns(llm_gateway, summary, turns))
+
+chat_panel(chat, vector_store, llm_gateway)
@@ -0,0 +1,44 @@
+import streamlit as st
+from app_resources import get_collection_count, get_collection_versions, get_document_sources, open_vector_store, process_and_save_document
+
+st.header("📂 Ingesta de Documentos para RAG")
+
+st.info("Carga documentos para enriquecer el conocimiento del Asistente AI. Los documentos se procesarán y almacenarán en la base de datos vectorial.")
+vector_store, collection_version = open_vector_store()
+
+st.subheader("Cargar Documento")
+uploaded_file = st.file_uploader("Sube un archivo (PDF, TXT, MD)", type=["pdf", "txt", "md"])
+
+if uploaded_file is not None:
+    file_details = {"FileName": uploaded_file.name, "FileType": uploaded_file.type, "FileSize": uploaded_file.size}
+    st.write(file_details)
+
+    if st.button("Procesar y Guardar en DB Vectorial"):
+        with st.spinner("Procesando documento y generando embeddings..."):
+            success = process_and_save_document(uploaded_file, vector_store)
+            if success:
+                collection_version = get_collection_versions().get(vector_store._collection.name)
+            else:
+                st.error("Fallo al guardar el documento. Revisa los logs para más detalles.")
+
+cache_stats = vector_store.embeddings.stats()
+st.caption(f"Caché de embeddings: {cache_stats['stored']:,} vectores guardados · {cache_stats['hits']:,} aciertos y {cache_stats['misses']:,} fallos desde el inicio del servidor ({cache_stats['hit_rate']:.0%} de aciertos).")
+
+st.subheader("Documentos Cargados en la DB Vectorial")
+current_doc_count = get_collection_count(collection_version)
+if current_doc_count > 0:
+    st.write(f"Actualmente hay **{current_doc_count}** fragmentos de documentos en la base de datos vectorial.")
+
+    try:
+        unique_sources = get_document_sources(collection_version)
+        if unique_sources:
+            st.markdown("**Archivos de origen cargados:**")
+            for source in unique_sources:
+                st.write(f"- {source}")
+        else:
+            st.info("No se encontraron metadatos de 'source' para los documentos cargados.")
+    except Exception as e:
+        st.error(f"Error al intentar listar los documentos cargados: {e}")
+        st.info("Esto puede ocurrir si la DB es muy grande o hay un problema con los metadatos.")
+else:
+    st.write("La base de datos vectorial está vacía. ¡Carga un documento para empezar!")
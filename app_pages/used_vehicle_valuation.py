@@ -0,0 +1,50 @@
+import streamlit as st
+from datetime import datetime
+from app_resources import NUM_CATALOG_VEHICLES, PROMPT_CACHE_REFRESH_LABEL, generate_random_vehicles, get_catalog_index, write_cached_llm_stream
+from prompt_cache import quantize
+
+st.header("📈 Valoración de Vehículos Usados (IA)")
+
+vehicles = generate_random_vehicles(num_vehicles=NUM_CATALOG_VEHICLES)
+st.info("Obtén una estimación del precio de mercado de tu vehículo usado con la ayuda de nuestra IA.")
+
+with st.form("vehicle_valuation_form"):
+    col_val1, col_val2 = st.columns(2)
+    with col_val1:
+        val_make = st.selectbox("Marca", options=get_catalog_index(vehicles).facet_values("make"), key="val_make")
+        val_year = st.slider("Año de Fabricación", min_value=1990, max_value=2024, value=2018, key="val_year")
+        val_mileage = st.number_input("Kilometraje (km)", min_value=0, value=50000, step=1000, key="val_mileage")
+    with col_val2:
+        val_model = st.text_input("Modelo", key="val_model")
+        val_condition = st.selectbox("Estado General", options=["Excelente", "Bueno", "Regular", "Necesita Reparaciones"], key="val_condition")
+        val_fuel = st.selectbox("Tipo de Combustible", options=["Gasoline", "Hybrid", "Electric", "Diesel"], key="val_fuel")
+
+    refresh_valuation = st.checkbox(PROMPT_CACHE_REFRESH_LABEL, key="val_refresh")
+    submitted_val = st.form_submit_button("Obtener Valoración")
+
+    if submitted_val:
+        with st.spinner("Analizando el mercado para tu vehículo..."):
+            valuation_template = """
+            Eres un tasador de vehículos para Finanzauto. Dada la siguiente información de un vehículo usado, estima su precio de mercado actual para venta o permuta. Considera que la fecha actual es {current_month} y que el mercado es Colombia.
+
+            Información del Vehículo:
+            - Marca: {val_make}
+            - Modelo: {val_model}
+            - Año: {val_year}
+            - Kilometraje: {val_mileage:,} km (aproximado)
+            - Estado General: {val_condition}
+            - Tipo de Combustible: {val_fuel}
+
+            Ofrece una valoración estimada como un rango de precios (ej. $X.XXX.XXX - $Y.YYY.YYY COP) y justifica tu estimación basándote en los factores proporcionados. También, menciona brevemente cualquier factor adicional que podría influir en el precio (ej. historial de accidentes, demanda del modelo). Utiliza valores realistas para el mercado colombiano.
+            """
+            try:
+                st.subheader("Valoración Estimada por IA:")
+                # Kilometraje a 5.000 km y fecha por mes: vehículos equivalentes comparten la valoración guardada.
+                valuation_inputs = dict(
+                    current_month=datetime.now().strftime('%B de %Y'), val_make=val_make, val_model=val_model, val_year=val_year,
+                    val_mileage=quantize(val_mileage, 5000), val_condition=val_condition, val_fuel=val_fuel,
+                )
+                write_cached_llm_stream("Valoración de Vehículos Usados (IA)", valuation_template, valuation_inputs, refresh=refresh_valuation) # Usar el único LLM configurado
+                st.success("¡Esperamos que esta valoración te sea útil!")
+            except Exception as e:
+                st.error(f"Lo siento, no pude generar la valoración en este momento. Por favor, inténtalo de nuevo. Error: {e}")
@@ -0,0 +1,381 @@
+"""
+Recursos compartidos por las páginas de la aplicación: rutas, modelos y bases de datos
+cacheados con `st.cache_resource` / `st.cache_data`, y las funciones de ayuda para RAG y para
+mostrar respuestas del LLM. Cada página de `app_pages/` importa de aquí solo lo que usa.
+"""
+import os
+import streamlit as st
+from catalog_index import CatalogIndex
+from chat_history import ChatArchive
+from llm_streaming import LLMLatencyLog
+from prompt_cache import PromptCache, cached_stream
+from vehicle_alerts import AlertStore, AlertMatcher
+from vehicle_catalog import VehicleTable, load_or_generate
+# Gemini, LangChain, Chroma y PyMuPDF tardan segundos en importarse: se importan dentro de las
+# funciones que crean los modelos, la base vectorial o ingieren documentos, la primera vez que
+# una página los necesita. El Dashboard y los simuladores no los cargan.
+
+# --- Constantes y Directorios ---
+CHROMA_DB_DIR = "chroma_db"
+CATALOG_SNAPSHOT_DIR = "catalog_data"
+CATALOG_SEED = 42
+# Tamaño del inventario. Para pruebas de carga se sube con la variable de entorno `CATALOG_VEHICLES`,
+# con el mismo número que se pasó a `python vehicle_catalog.py --vehicles` para pregenerarlo.
+NUM_CATALOG_VEHICLES = int(os.environ.get("CATALOG_VEHICLES", 5000))
+ALERTS_DB_PATH = "vehicle_alerts.db"
+INVENTORY_DELTA_SIZE = 500
+EMBEDDING_CACHE_PATH = "embedding_cache.db"
+PROMPT_CACHE_PATH = "prompt_cache.db"
+CHAT_ARCHIVE_PATH = "chat_archive.db"
+COLLECTION_VERSION_PATH = os.path.join(CHROMA_DB_DIR, "collection_version.db")
+LEXICAL_INDEX_PATH = os.path.join(CHROMA_DB_DIR, "lexical_index.db")
+
+# --- Inicialización de Modelos Gemini (Global para toda la app) ---
+# Se crean la primera vez que una página los pide y luego se comparten entre todas las sesiones.
+
+@st.cache_resource
+def configure_gemini():
+    """
+    Configura la clave API del SDK de Gemini (una vez por proceso).
+    """
+    import google.generativeai as genai
+
+    genai.configure(api_key=st.secrets["GOOGLE_API_KEY"])
+
+# Modelo de Embeddings para convertir texto en vectores. Cacheada para eficiencia.
+@st.cache_resource
+def get_embeddings_model():
+    """
+    Inicializa y devuelve el modelo de embeddings de Google Generative AI, detrás de una caché
+    persistente por contenido: un fragmento ya visto no se vuelve a enviar a la API.
+    """
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+    from embedding_cache import CachedEmbeddings, EmbeddingCache
+
+    configure_gemini()
+    return CachedEmbeddings(GoogleGenerativeAIEmbeddings(model="models/embedding-001"), EmbeddingCache(EMBEDDING_CACHE_PATH))
+
+# ÚNICO Modelo de Lenguaje Grande (LLM) para TODAS las tareas (general y RAG).
+# Ahora siempre usamos 'gemini-1.5-flash'.
+@st.cache_resource
+def get_llm_model():
+    """
+    Inicializa y devuelve el modelo de chat de Google Generative AI para todas las tareas.
+    """
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from llm_gateway import LLM_TIMEOUT_SECONDS
+
+    configure_gemini()
+    # Los reintentos y plazos los gestiona LLMGateway; max_retries=1 evita que se sumen a los del cliente.
+    return ChatGoogleGenerativeAI(model="gemini-1.5-flash", temperature=0.3, max_retries=1, timeout=LLM_TIMEOUT_SECONDS) # Usamos ChatGoogleGenerativeAI para consistencia con LangChain
+
+@st.cache_resource
+def get_llm_gateway():
+    """
+    Pasarela única hacia el LLM, compartida por todas las sesiones del proceso: limita las
+    llamadas simultáneas, aplica plazos y reintenta los errores transitorios.
+    """
+    from llm_gateway import LLMGateway
+
+    return LLMGateway(get_llm_model())
+
+def load_model(get_model):
+    """
+    Devuelve `get_model()` (el LLM o la base vectorial con su modelo de embeddings). Si no se
+    puede inicializar, muestra el error y detiene la página.
+    """
+    try:
+        return get_model()
+    except Exception as e:
+        st.error(f"❌ **Error al cargar los modelos Gemini:** {e}")
+        st.info("Asegúrate de que tus modelos estén disponibles y que tu clave API sea correcta.")
+        st.stop()
+
+# --- ChromaDB Setup ---
+
+@st.cache_resource
+def get_vector_store():
+    """
+    Carga una base de datos vectorial Chroma existente o crea una nueva si no existe.
+    Utiliza el modelo de embeddings configurado. El handle vive mientras viva el servidor:
+    la ingesta no lo recrea, sino que incrementa la versión de la colección.
+    """
+    from langchain_community.vectorstores import Chroma
+
+    embeddings_model = get_embeddings_model()
+    try:
+        vector_store = Chroma(persist_directory=CHROMA_DB_DIR, embedding_function=embeddings_model)
+    except Exception as e:
+        st.info(f"Creando nueva base de datos vectorial en '{CHROMA_DB_DIR}'.")
+        vector_store = Chroma(embedding_function=embeddings_model, persist_directory=CHROMA_DB_DIR)
+    return vector_store
+
+@st.cache_resource
+def get_collection_versions():
+    """
+    Versiones de la colección vectorial, compartidas por todas las sesiones y procesos.
+    """
+    from document_ingestion import CollectionVersion
+
+    return CollectionVersion(COLLECTION_VERSION_PATH)
+
+@st.cache_resource
+def get_lexical_index():
+    """
+    Índice léxico (BM25) de los fragmentos de la colección vectorial, para la recuperación
+    híbrida. Si falta (una colección creada antes del índice), se reconstruye desde Chroma.
+    """
+    from lexical_index import LexicalIndex
+
+    lexical_index = LexicalIndex(LEXICAL_INDEX_PATH)
+    collection = get_vector_store()._collection
+    if lexical_index.count() == 0 and collection.count() > 0:
+        lexical_index.rebuild_from(collection)
+    return lexical_index
+
+# Cachés del lado de consulta: se indexan por la versión de la colección, así que una ingesta
+# solo invalida estas (y no los clientes de Gemini ni el handle de Chroma).
+@st.cache_data(max_entries=4, show_spinner=False)
+def get_collection_count(collection_version):
+    """
+    Número de fragmentos en la colección vectorial para `collection_version`.
+    """
+    return get_vector_store()._collection.count()
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def get_document_sources(collection_version):
+    """
+    Archivos de origen (metadato 'source') de la colección vectorial para `collection_version`.
+    """
+    all_data = get_vector_store()._collection.get(include=['metadatas'])
+    return sorted(set(m.get('source', 'Desconocido') for m in all_data['metadatas'] if m))
+
+def open_vector_store():
+    """
+    Base vectorial y versión vigente de su colección para las páginas RAG, con un aviso del
+    número de fragmentos cargados.
+    """
+    vector_store = load_model(get_vector_store)
+    collection_version = get_collection_versions().get(vector_store._collection.name)
+    if get_collection_count(collection_version) == 0:
+        st.warning("La base de datos vectorial está vacía. Por favor, carga y procesa documentos en la sección de 'Ingesta de Documentos (RAG)'.")
+    else:
+        st.success(f"Cargada base de datos vectorial existente de '{CHROMA_DB_DIR}' con {get_collection_count(collection_version)} documentos/fragmentos.")
+    return vector_store, collection_version
+
+# --- Funciones de Procesamiento de Documentos (RAG) ---
+
+def get_text_chunks(pages, file_name="unknown_document"):
+    """
+    Divide las páginas `(número, texto)` de un documento en fragmentos (chunks) para el procesamiento.
+    Cada chunk se convierte en un objeto Document con metadatos: nombre del archivo y página.
+    """
+    from document_ingestion import chunk_pages
+
+    return list(chunk_pages(pages, file_name))
+
+def process_and_save_document(uploaded_file, vector_store):
+    """
+    Procesa un archivo subido (PDF, TXT, MD): extrae el texto página a página (los PDFs grandes
+    en paralelo), lo divide en chunks, genera embeddings por lotes y guarda los documentos (chunks)
+    con sus metadatos en la base de datos vectorial a medida que cada lote está listo.
+    Volver a subir un archivo sin cambios no hace nada; si cambió, solo se sustituyen los chunks
+    que son distintos.
+    """
+    from document_ingestion import EMBED_MAX_RETRIES, document_fingerprint, is_document_current, iter_document_pages, sync_document
+
+    try:
+        fingerprint = document_fingerprint(uploaded_file.getvalue())
+        if is_document_current(vector_store._collection, uploaded_file.name, fingerprint):
+            st.info(f"El documento '{uploaded_file.name}' ya está en la DB Vectorial sin cambios; no se vuelve a procesar.")
+            return True
+
+        try:
+            pages = iter_document_pages(uploaded_file)
+        except ValueError:
+            st.error("Tipo de archivo no soportado para ingesta RAG. Por favor, sube PDF, TXT o MD.")
+            return False
+
+        documents_with_metadata = get_text_chunks(pages, uploaded_file.name)
+        st.write("Documento leído exitosamente.")
+
+        if not documents_with_metadata:
+            st.error("No se pudo extraer contenido del documento.")
+            return False
+
+        st.write(f"Sincronizando {len(documents_with_metadata)} fragmentos de texto con la DB Vectorial...")
+        progress_bar = st.progress(0.0)
+
+        def show_progress(stats):
+            done = stats["stored"] + stats["failed"]
+            progress_bar.progress(done / stats["chunks"], text=f"{done}/{stats['chunks']} fragmentos nuevos · {stats['chunks_per_second']:.1f} fragmentos/s")
+
+        # Chroma guarda cada lote en disco al escribirlo; ya no hace falta `persist()`.
+        cache_before = vector_store.embeddings.stats()
+        stats = sync_document(documents_with_metadata, uploaded_file.name, fingerprint, vector_store.embeddings,
+                              vector_store._collection, lexical_index=get_lexical_index(), on_progress=show_progress)
+        get_collection_versions().bump(vector_store._collection.name)
+        cache_after = vector_store.embeddings.stats()
+        progress_bar.progress(1.0)
+        if stats["failed"]:
+            st.error(f"{stats['failed']} de {stats['chunks']} fragmentos no se pudieron guardar tras {EMBED_MAX_RETRIES} reintentos: {stats['errors'][-1]}")
+            return False
+        st.success(f"Documento '{uploaded_file.name}' procesado y guardado en la DB Vectorial: {stats['added']} fragmentos nuevos, "
+                   f"{stats['deleted']} eliminados y {stats['kept']} sin cambios ({stats['chunks_per_second']:.1f} fragmentos/s).")
+        st.caption(f"Caché de embeddings: {cache_after['hits'] - cache_before['hits']} fragmentos reutilizados, {cache_after['misses'] - cache_before['misses']} calculados.")
+        return True
+    except Exception as e:
+        st.error(f"Error al procesar o guardar el documento: {e}")
+        return False
+
+@st.cache_resource
+def get_rag_cache():
+    """
+    Caché de embeddings de consultas y de respuestas del Asistente AI, compartida por todas las sesiones.
+    """
+    from rag_pipeline import RAGCache
+
+    return RAGCache()
+
+def get_rag_response(user_query, vector_store, gateway, collection_version=0, conversation=""):
+    """
+    Genera una respuesta utilizando la técnica RAG (Retrieval Augmented Generation).
+    1. Busca documentos relevantes combinando la DB vectorial y el índice de palabras clave (BM25).
+    2. Combina los documentos más relevantes y no repetidos, con su fuente y página y hasta un presupuesto de tokens, con la pregunta del usuario para formar un prompt contextual.
+    3. Envía el prompt al LLM y produce su respuesta en fragmentos a medida que llega.
+    El embedding de la consulta y la respuesta se reutilizan entre sesiones mientras no cambie la colección.
+    `conversation` (resumen y últimos turnos del chat) ayuda a entender las preguntas de seguimiento.
+    """
+    from rag_pipeline import answer_query
+
+    try:
+        result = answer_query(user_query, vector_store.embeddings, vector_store._collection, gateway,
+                              collection_version, cache=get_rag_cache(), stream=True, lexical_index=get_lexical_index(),
+                              conversation=conversation)
+
+        unique_sources = set()
+        for doc in result["documents"]:
+            if 'source' in doc.metadata:
+                unique_sources.add(doc.metadata['source'])
+
+        if unique_sources:
+            st.info(f"🔎 Documentos relevantes encontrados: {list(unique_sources)}")
+        else:
+            st.warning("🤷‍♀️ No se encontraron documentos relevantes en la base de datos para esta consulta. Respondiendo solo con conocimiento general.")
+        context_stats = result["context"]
+        st.caption(f"🧩 Contexto: {context_stats['selected']} fragmentos de {context_stats['candidates']} candidatos "
+                   f"({context_stats['duplicates']} casi duplicados descartados) · ~{context_stats['context_tokens']:,} tokens de contexto, "
+                   f"~{context_stats['prompt_tokens']:,} tokens de prompt")
+        if result["retrieval"] == "léxica":
+            st.caption("🐢 El servicio de embeddings no respondió a tiempo: se buscó solo por palabras clave.")
+        if result["cached_answer"]:
+            st.caption("⚡ Respuesta reutilizada de una consulta anterior con los mismos documentos.")
+
+        yield from result["answer"]
+    except Exception as e:
+        st.error(f"Lo siento, hubo un error al procesar tu solicitud con RAG. Por favor, asegúrate de que haya documentos en la DB y que el modelo de embeddings funcione. Error: {e}")
+        yield "No pude generar una respuesta debido a un error interno."
+
+
+@st.cache_resource
+def get_chat_archive():
+    """
+    Turnos del chat que salieron de la ventana reciente, por sesión, para verlos bajo demanda.
+    """
+    return ChatArchive(CHAT_ARCHIVE_PATH)
+
+@st.cache_resource
+def get_llm_latency_log():
+    """
+    Registro de latencias del LLM (primer token y total) por página, compartido por todas las sesiones.
+    """
+    return LLMLatencyLog()
+
+def write_llm_stream(page, chunks, start=None):
+    """
+    Muestra la respuesta del LLM a medida que llegan los fragmentos `chunks`, registra el tiempo
+    hasta el primer token y el total para `page` (medidos desde `start`, si se da) y devuelve el
+    texto completo.
+    """
+    measurement = {}
+    text = st.write_stream(get_llm_latency_log().track(page, chunks, start=start, measurement=measurement))
+    st.caption(f"⏱️ Primer token en {measurement['ttft']:.2f} s · respuesta completa en {measurement['total']:.2f} s")
+    return text
+
+@st.cache_resource
+def get_prompt_cache():
+    """
+    Caché en disco de respuestas de las herramientas de IA, compartida por todas las sesiones.
+    """
+    return PromptCache(PROMPT_CACHE_PATH)
+
+def write_cached_llm_stream(page, template, inputs, refresh=False):
+    """
+    Como `write_llm_stream`, pero reutiliza la respuesta de una consulta anterior con la misma
+    plantilla y entradas equivalentes (ya cuantizadas), salvo que se pida `refresh`.
+    """
+    result = cached_stream(load_model(get_llm_gateway), get_prompt_cache(), page, template, inputs, refresh=refresh)
+    if result["cached"]:
+        st.caption("⚡ Respuesta reutilizada de una consulta equivalente anterior.")
+    return write_llm_stream(page, result["answer"])
+
+PROMPT_CACHE_REFRESH_LABEL = "🔄 Generar una respuesta nueva (sin usar respuestas guardadas)"
+
+
+# --- Dummy Data Generation (Dynamic) ---
+# `cache_resource` (y no `cache_data`) para que todas las sesiones lean la misma tabla sin copiarla.
+@st.cache_resource
+def generate_random_vehicles(num_vehicles=NUM_CATALOG_VEHICLES, seed=CATALOG_SEED):
+    """
+    Devuelve el inventario de vehículos como `VehicleTable` columnar de solo lectura.
+    La generación es vectorizada y determinista (con semilla); el resultado se guarda en disco
+    y se mapea en memoria, de modo que todos los procesos de Streamlit comparten las mismas
+    páginas del archivo en lugar de materializar cada uno su propia copia.
+    """
+    return load_or_generate(CATALOG_SNAPSHOT_DIR, num_vehicles, seed)
+
+MAX_COMPARED_VEHICLES = 4
+
+# --- Alertas de Vehículos ---
+@st.cache_resource
+def get_alert_store():
+    """
+    Devuelve el almacén SQLite de alertas y notificaciones, compartido por todas las sesiones.
+    """
+    return AlertStore(ALERTS_DB_PATH)
+
+@st.cache_resource(max_entries=1)
+def get_alert_matcher(alerts_version):
+    """
+    Construye el índice de predicados de las alertas activas. `alerts_version` cambia con
+    cada alta o baja de alertas, lo que invalida esta caché.
+    """
+    return AlertMatcher(get_alert_store().active_alerts())
+
+# Índices secundarios del catálogo: se construyen una sola vez por versión del catálogo.
+@st.cache_resource(hash_funcs={VehicleTable: lambda table: table.version})
+def get_catalog_index(table):
+    """
+    Construye (y cachea por versión del catálogo) los índices de precio, año, categorías y texto.
+    """
+    return CatalogIndex(table)
+
+
+# --- Simulate User Data for Dashboard (for a single dummy user) ---
+def init_dummy_user_data():
+    """
+    Crea en la sesión los datos del usuario de demostración que comparten el Dashboard, las
+    Alertas, la Gamificación y el Portal de Asesores.
+    """
+    if 'dummy_user_data' not in st.session_state or 'loan_applications' not in st.session_state.dummy_user_data:
+        st.session_state.dummy_user_data = {
+            "name": "Juan Pérez",
+            "email": "juan.perez@example.com",
+            "loan_applications": [
+                {"id": "APP001", "vehicle": "Toyota RAV4 2023", "amount": 32000, "status": "Aprobada", "stage": "Desembolsado", "date": "2025-06-01"},
+                {"id": "APP002", "vehicle": "Ford F-150 2022", "amount": 45000, "status": "En Revisión", "stage": "Análisis Preliminar", "date": "2025-07-10"},
+                {"id": "APP003", "vehicle": "Tesla Model 3 2024", "amount": 40000, "status": "Rechazada", "stage": "Análisis Preliminar", "date": "2025-05-15", "reason": "Ingresos insuficientes"},
+                {"id": "APP004", "vehicle": "Honda Civic 2024", "amount": 28000, "status": "En Revisión", "stage": "Recopilación de Documentos", "date": "2025-07-05"},
+                {"id": "APP005", "vehicle": "BMW X5 2023", "amount": 60000, "status": "Aprobada", "stage": "Firma de Contrato", "date": "2025-07-12"}
+            ]
+        }
@@ -0,0 +1,105 @@
+"""
+Benchmark del motor de Alertas de Vehículos.
+
+Crea N alertas sintéticas en un `AlertStore` temporal y procesa un lote de M vehículos nuevos.
+Mide la construcción del índice de predicados, el emparejamiento y la escritura de la bandeja
+de salida, y lo compara con el recorrido de todas las alertas por cada vehículo (medido sobre
+una muestra y extrapolado).
+
+Uso:
+    python benchmarks/bench_alert_matching.py [--alerts 100000] [--vehicles 10000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vehicle_alerts import ANY, AlertMatcher, AlertStore, process_inventory_delta  # noqa: E402
+from vehicle_catalog import MAKES, MODELS_BY_MAKE, VEHICLE_TYPES, generate_vehicle_table  # noqa: E402
+
+
+def synthetic_alerts(num_alerts, seed=7):
+    """
+    Alertas con una mezcla realista de criterios: la mayoría fija marca y algún tipo, y
+    algunas fijan también el modelo.
+    """
+    rng = random.Random(seed)
+    alerts = []
+    for i in range(num_alerts):
+        make = rng.choice(MAKES) if rng.random() < 0.8 else ANY
+        model = rng.choice(MODELS_BY_MAKE[make]) if make != ANY and rng.random() < 0.3 else ANY
+        types = rng.sample(VEHICLE_TYPES, rng.randint(1, 2)) if rng.random() < 0.7 else ANY
+        alerts.append(dict(email=f"cliente{i % 20000}@example.com", make=make, model=model,
+                           max_price=rng.randrange(20000, 120000, 1000), types=types))
+    return alerts
+
+
+def brute_force(alerts, table, rows):
+    """
+    Recorre todas las alertas por cada vehículo. Devuelve el conjunto de pares (alerta, fila).
+    """
+    pairs = set()
+    for row in rows:
+        vehicle = table.row(int(row))
+        for position, alert in enumerate(alerts):
+            if alert["make"] != ANY and alert["make"] != vehicle["make"]:
+                continue
+            if alert["model"] != ANY and alert["model"].lower() != vehicle["model"].lower():
+                continue
+            if alert["type"] != ANY and vehicle["type"] not in alert["type"]:
+                continue
+            if vehicle["price"] > alert["max_price"]:
+                continue
+            pairs.add((position, int(row)))
+    return pairs
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alerts", type=int, default=100_000)
+    parser.add_argument("--vehicles", type=int, default=10_000)
+    parser.add_argument("--sample", type=int, default=20, help="Vehículos usados para medir el recorrido completo.")
+    args = parser.parse_args()
+
+    table = generate_vehicle_table(args.vehicles, seed=2024)
+    rows = np.arange(len(table))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = AlertStore(os.path.join(tmp_dir, "alerts.db"))
+        insert_s, _ = timed(lambda: store.add_alerts(synthetic_alerts(args.alerts)))
+        alerts = store.active_alerts()
+        build_s, matcher = timed(lambda: AlertMatcher(alerts))
+        cols = table.columns
+        match_s, (counts, _) = timed(
+            lambda: matcher.match(cols["make"], cols["type"], cols["model"], cols["price"]))
+        process_s, notifications = timed(lambda: process_inventory_delta(store, matcher, table, rows, "bench-1"))
+
+        sample = rows[:args.sample]
+        brute_s, expected = timed(lambda: brute_force(alerts, table, sample))
+        sample_counts, _ = matcher.match(cols["make"][sample], cols["type"][sample], cols["model"][sample], cols["price"][sample])
+        assert np.array_equal(sample_counts, np.bincount([position for position, _ in expected], minlength=len(alerts)))
+
+    comparisons = args.alerts * args.vehicles
+    print(f"{args.alerts:,} alertas x {args.vehicles:,} vehículos nuevos ({comparisons:,} combinaciones)")
+    print(f"  alta de alertas en SQLite:        {insert_s:8.2f} s")
+    print(f"  construcción del índice:          {build_s:8.2f} s")
+    print(f"  emparejamiento:                   {match_s:8.2f} s  ({int(counts.sum()):,} coincidencias, "
+          f"{args.vehicles / match_s:,.0f} vehículos/s)")
+    print(f"  lote completo + bandeja salida:   {process_s:8.2f} s  ({notifications:,} notificaciones)")
+    print(f"  recorrido completo (extrapolado): {brute_s / len(sample) * args.vehicles:8.2f} s  "
+          f"(medido en {len(sample)} vehículos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark del motor de amortización (`amortization`): bucle mes a mes en Python vs. NumPy.
+
+* "calendario": calendario completo de un crédito a 360 meses con un abono mensual adicional,
+  dos abonos extraordinarios y un cambio de tasa (refinanciamiento) en el mes 36.
+* "tabla plazo × tasa": cuota, meses hasta saldar, total pagado e intereses de cada
+  combinación de plazo (12–84 meses, de uno en uno) y tasa (2,0–15,0 %, de 0,1 en 0,1) con un
+  abono mensual adicional: el bucle simula cada combinación mes a mes; `payment_grid` las
+  resuelve todas en una llamada.
+
+Se informa la mediana de `--repeat` ejecuciones y la máxima diferencia absoluta entre ambos
+resultados (deben coincidir salvo errores de redondeo).
+
+Uso:
+    python benchmarks/bench_amortization.py [--principal 30000] [--repeat 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from amortization import amortization_schedule, payment_grid  # noqa: E402
+
+SCHEDULE = dict(annual_rate=9.5, months=360, recurring_extra=150.0, extra_payments={12: 5000.0, 120: 10000.0},
+                rate_changes={36: 6.0})
+GRID_TERMS = np.arange(12, 85)
+GRID_RATES = np.round(np.arange(2.0, 15.01, 0.1), 1)
+GRID_EXTRA = 100.0
+
+
+def loop_payment(principal, annual_rate, months):
+    rate = annual_rate / 100 / 12
+    return principal * rate / (1 - (1 + rate) ** -months) if rate > 0 else principal / months
+
+
+def loop_schedule(principal, annual_rate, months, recurring_extra=0.0, extra_payments=None, rate_changes=None, max_months=600):
+    """
+    Referencia: el calendario mes a mes con listas de Python.
+    """
+    extra_payments, rate_changes = extra_payments or {}, rate_changes or {}
+    payment = loop_payment(principal, annual_rate, months)
+    rate, balance = annual_rate / 100 / 12, principal
+    rows = {column: [] for column in ("month", "payment", "extra", "interest", "balance")}
+    for month in range(1, max_months + 1):
+        if balance <= 0.005:
+            break
+        if month in rate_changes:
+            payment = loop_payment(balance, rate_changes[month], max(months - month + 1, 1))
+            rate = rate_changes[month] / 100 / 12
+        interest = balance * rate
+        due = balance + interest
+        paid = min(payment, due)
+        extra = min(recurring_extra + extra_payments.get(month, 0.0), due - paid)
+        balance = due - paid - extra
+        for column, value in zip(rows, (month, paid, extra, interest, balance)):
+            rows[column].append(value)
+    return rows
+
+
+def loop_grid(principal, terms, annual_rates, recurring_extra):
+    shape = (len(annual_rates), len(terms))
+    result = {name: np.zeros(shape) for name in ("payment", "months", "total_paid")}
+    for i, rate in enumerate(annual_rates):
+        for j, term in enumerate(terms):
+            schedule = loop_schedule(principal, rate, int(term), recurring_extra=recurring_extra)
+            result["payment"][i, j] = schedule["payment"][0]
+            result["months"][i, j] = len(schedule["month"])
+            result["total_paid"][i, j] = sum(schedule["payment"]) + sum(schedule["extra"])
+    return result
+
+
+def timed(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--principal", type=float, default=30000.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    loop_ms, expected = timed(lambda: loop_schedule(args.principal, **SCHEDULE), args.repeat)
+    numpy_ms, schedule = timed(lambda: amortization_schedule(args.principal, **SCHEDULE), args.repeat)
+    difference = max(np.abs(np.asarray(expected[column]) - schedule[column]).max() for column in expected) \
+        if len(expected["month"]) == len(schedule["month"]) else float("inf")
+    rows.append((f"calendario ({len(schedule['month'])} meses)", loop_ms, numpy_ms, difference))
+
+    grid_repeat = max(1, args.repeat // 10)
+    loop_ms, expected = timed(lambda: loop_grid(args.principal, GRID_TERMS, GRID_RATES, GRID_EXTRA), grid_repeat)
+    numpy_ms, grid = timed(lambda: payment_grid(args.principal, GRID_TERMS, GRID_RATES, recurring_extra=GRID_EXTRA), args.repeat)
+    difference = max(np.abs(expected[name] - grid[name]).max() for name in expected)
+    rows.append((f"tabla plazo × tasa ({grid['payment'].size:,} escenarios)", loop_ms, numpy_ms, difference))
+
+    header = f"{'cálculo':<40} | {'bucle (ms)':>12} | {'NumPy (ms)':>12} | {'aceleración':>12} | {'máx. diferencia':>16}"
+    print(header)
+    print("-" * len(header))
+    for name, loop_ms, numpy_ms, difference in rows:
+        print(f"{name:<40} | {loop_ms:>12.2f} | {numpy_ms:>12.3f} | {loop_ms / numpy_ms:>11.1f}x | {difference:>16.2e}")
+
+
+if __name__ == "__main__":
+    main()
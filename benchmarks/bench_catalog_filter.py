@@ -0,0 +1,116 @@
+"""
+Benchmark de latencia del filtro del Catálogo de Vehículos.
+
+Compara el bucle original sobre una lista de diccionarios, las máscaras booleanas de
+`VehicleTable` y los índices secundarios de `CatalogIndex` para 5k, 100k y 1M vehículos.
+Antes de medir verifica que `CatalogIndex.filter` coincide con las máscaras para búsquedas
+de texto cortas (que aparecen en casi todas las marcas y modelos); si no, termina con error.
+
+Uso:
+    python benchmarks/bench_catalog_filter.py [--sizes 5000 100000 1000000] [--legacy-max 100000]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog_index import CatalogIndex  # noqa: E402
+from vehicle_catalog import generate_vehicle_table  # noqa: E402
+
+# Filtros representativos de una interacción en la página del catálogo.
+SCENARIOS = {
+    "sin filtros": dict(search_query="", min_price=0, max_price=150000, types=[], fuels=[], min_year=2018),
+    "texto": dict(search_query="model", min_price=0, max_price=150000, types=[], fuels=[], min_year=2018),
+    "selectivo": dict(search_query="cyber", min_price=50000, max_price=150000, types=[], fuels=[], min_year=2024),
+    "combinado": dict(search_query="x", min_price=20000, max_price=60000, types=["SUV", "Sedan"], fuels=["Hybrid"], min_year=2021),
+}
+
+# Subcadenas cortas: sus listas de marca y de modelo se solapan y cubren casi todo el catálogo.
+SHORT_QUERIES = ["a", "e", "o", "i", "r", "an", "er", "on", "x", "3"]
+
+
+def check_short_queries(table, index):
+    """
+    `CatalogIndex.filter` debe devolver las mismas filas que las máscaras de `VehicleTable`
+    para las búsquedas de `SHORT_QUERIES`, solas y con otro filtro.
+    """
+    for query in SHORT_QUERIES:
+        for filters in (dict(search_query=query), dict(search_query=query, min_year=2018)):
+            expected, indexed = table.filter(**filters), index.filter(**filters)
+            assert np.array_equal(expected, indexed), f"{filters}: {len(indexed):,} filas con índices, {len(expected):,} con máscaras"
+
+
+def legacy_filter(vehicles, search_query, min_price, max_price, types, fuels, min_year):
+    """
+    Réplica del bucle original de la página del catálogo.
+    """
+    filtered_vehicles = []
+    for vehicle in vehicles:
+        match = True
+        if search_query:
+            if search_query not in vehicle['make'].lower() and \
+               search_query not in vehicle['model'].lower():
+                match = False
+        if not (min_price <= vehicle['price'] <= max_price):
+            match = False
+        if types and vehicle['type'] not in types:
+            match = False
+        if fuels and vehicle['fuel'] not in fuels:
+            match = False
+        if vehicle['year'] < min_year:
+            match = False
+        if match:
+            filtered_vehicles.append(vehicle)
+    return filtered_vehicles
+
+
+def time_call(func, repeat):
+    """
+    Ejecuta `func` `repeat` veces y devuelve la mediana en milisegundos y el último resultado.
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5000, 100000, 1000000])
+    parser.add_argument("--legacy-max", type=int, default=100000,
+                        help="Tamaño máximo para medir el bucle original (materializa un dict por vehículo).")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'filas':>10} | {'escenario':<12} | {'resultados':>10} | {'índices (ms)':>12} | {'máscaras (ms)':>13} | {'bucle (ms)':>10} | {'speedup':>7}")
+    print("-" * 97)
+    for size in args.sizes:
+        table = generate_vehicle_table(size)
+        build_start = time.perf_counter()
+        index = CatalogIndex(table)
+        print(f"{size:>10,} | construcción de índices: {(time.perf_counter() - build_start) * 1000:.1f} ms")
+        check_short_queries(table, index)
+        records = table.to_records() if size <= args.legacy_max else None
+        for name, filters in SCENARIOS.items():
+            vec_ms, indices = time_call(lambda: table.filter(**filters), args.repeat)
+            idx_ms, indexed = time_call(lambda: index.filter(**filters), args.repeat)
+            assert np.array_equal(indices, indexed)
+            if records is not None:
+                loop_ms, legacy = time_call(lambda: legacy_filter(records, **filters), max(1, args.repeat // 2))
+                assert [v["id"] for v in legacy] == table.columns["id"][indices].tolist()
+                loop_col, speedup = f"{loop_ms:10.2f}", f"{loop_ms / idx_ms:6.1f}x"
+            else:
+                loop_col, speedup = f"{'-':>10}", f"{'-':>7}"
+            print(f"{size:>10,} | {name:<12} | {len(indices):>10,} | {idx_ms:12.2f} | {vec_ms:13.2f} | {loop_col} | {speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark de generación del inventario de vehículos y de sus snapshots en disco.
+
+Compara la generación original fila a fila (`random.choice`/`random.sample` por vehículo)
+con `generate_vehicle_table` (vectorizada y con semilla), y mide el guardado y la carga del
+snapshot `.npz`.
+
+Uso:
+    python benchmarks/bench_catalog_generate.py [--sizes 5000 100000 1000000] [--legacy-max 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vehicle_catalog import (  # noqa: E402
+    MAKES, MODELS_BY_MAKE, VEHICLE_TYPES, FUEL_TYPES, COLORS, COMMON_FEATURES, PREMIUM_MAKES,
+    VehicleTable, generate_vehicle_table, save_snapshot, load_snapshot
+)
+
+
+def legacy_generate(num_vehicles):
+    """
+    Réplica de la generación original fila a fila (sin semilla) que termina en `VehicleTable`.
+    """
+    vehicles = []
+    for i in range(1, num_vehicles + 1):
+        make = random.choice(MAKES)
+        model = random.choice(MODELS_BY_MAKE.get(make, ["Generic Model"]))
+        year = random.randint(2018, 2025)
+        base_price = random.randint(15000, 80000)
+        if make in PREMIUM_MAKES:
+            base_price = random.randint(35000, 120000)
+        price = base_price + (year - 2018) * random.uniform(500, 2000) + random.uniform(-1000, 1000)
+        price = max(10000, price)
+        v_type = random.choice(VEHICLE_TYPES)
+        fuel = random.choice(FUEL_TYPES)
+        if v_type == "EV":
+            fuel = "Electric"
+            price = random.randint(35000, 90000)
+        selected_features = random.sample(COMMON_FEATURES, random.randint(2, 6))
+        vehicles.append({
+            "id": i, "make": make, "model": model, "year": year, "price": round(price, 2),
+            "type": v_type, "fuel": fuel, "features": selected_features,
+            "mileage": random.randint(500, 150000) if year < 2025 else random.randint(10, 5000),
+            "color": random.choice(COLORS)
+        })
+    return VehicleTable.from_records(vehicles)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5000, 100000, 1000000])
+    parser.add_argument("--legacy-max", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'filas':>10} | {'fila a fila (ms)':>16} | {'vectorizado (ms)':>16} | {'guardar (ms)':>12} | {'cargar (ms)':>11} | {'snapshot (MB)':>13}")
+    print("-" * 95)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in args.sizes:
+            legacy_ms = f"{timed(lambda: legacy_generate(size))[0]:16.1f}" if size <= args.legacy_max else f"{'-':>16}"
+            vector_ms, table = timed(lambda: generate_vehicle_table(size, args.seed))
+            assert generate_vehicle_table(min(size, 1000), args.seed).version == generate_vehicle_table(min(size, 1000), args.seed).version
+            path = os.path.join(tmp_dir, f"vehicles_{size}.npz")
+            save_ms, _ = timed(lambda: save_snapshot(table, path))
+            load_ms, loaded = timed(lambda: load_snapshot(path))
+            assert loaded.version == table.version
+            print(f"{size:>10,} | {legacy_ms} | {vector_ms:16.1f} | {save_ms:12.1f} | {load_ms:11.1f} | {os.path.getsize(path) / 1e6:13.1f}")
+
+
+if __name__ == "__main__":
+    main()
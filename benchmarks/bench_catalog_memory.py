@@ -0,0 +1,97 @@
+"""
+Reporte de memoria por réplica del catálogo de vehículos.
+
+Lanza varias réplicas (procesos) que cargan el mismo catálogo a la vez y mide, en cada una,
+la memoria residente (RSS) y la memoria proporcional (PSS, que reparte las páginas
+compartidas entre los procesos que las usan):
+
+* "antes": como `@st.cache_data` con una lista de diccionarios; el valor cacheado se guarda
+  serializado y cada acceso deserializa su propia copia.
+* "después": catálogo columnar mapeado en memoria (`open_mapped`) más sus índices.
+
+Uso:
+    python benchmarks/bench_catalog_memory.py [--vehicles 1000000] [--replicas 2]
+"""
+import argparse
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog_index import CatalogIndex  # noqa: E402
+from vehicle_catalog import load_or_generate, mapped_path, open_mapped  # noqa: E402
+
+
+def memory_kb():
+    """
+    Devuelve (RSS, PSS) del proceso actual en kB, leídos de /proc (solo Linux).
+    """
+    values = {}
+    with open("/proc/self/smaps_rollup") as rollup:
+        for line in rollup:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:"):
+                values[parts[0][:-1]] = int(parts[1])
+    return values["Rss"], values["Pss"]
+
+
+def replica(mode, path, loaded, measured, results):
+    """
+    Carga el catálogo según `mode`, espera a que todas las réplicas lo tengan cargado y mide.
+    """
+    baseline = memory_kb()
+    table = open_mapped(path)
+    if mode == "antes":
+        cached_bytes = pickle.dumps(table.to_records())  # lo que guarda st.cache_data
+        vehicles = pickle.loads(cached_bytes)  # la copia que recibe una sesión
+        hits = sum(1 for vehicle in vehicles if vehicle["type"] == "SUV" and vehicle["price"] < 50000)
+    else:
+        index = CatalogIndex(table)
+        hits = len(index.filter(types=["SUV"], max_price=50000))
+    loaded.wait()
+    rss, pss = memory_kb()
+    results.put((mode, rss - baseline[0], pss - baseline[1], hits))
+    measured.wait()
+
+
+def run(mode, path, replicas):
+    context = multiprocessing.get_context("fork")
+    loaded, measured = context.Barrier(replicas), context.Barrier(replicas)
+    results = context.Queue()
+    processes = [context.Process(target=replica, args=(mode, path, loaded, measured, results)) for _ in range(replicas)]
+    for process in processes:
+        process.start()
+    rows = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vehicles", type=int, default=1_000_000)
+    parser.add_argument("--replicas", type=int, default=2)
+    parser.add_argument("--data-dir", default=None, help="Directorio de snapshots (por defecto, uno temporal).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = args.data_dir or tmp_dir
+        load_or_generate(data_dir, args.vehicles)
+        path = mapped_path(data_dir, args.vehicles, 42)
+
+        print(f"{args.vehicles:,} vehículos, {args.replicas} réplicas simultáneas (memoria añadida al cargar el catálogo)")
+        print(f"{'versión':<10} | {'RSS/réplica (MB)':>16} | {'PSS/réplica (MB)':>16} | {'total PSS (MB)':>14}")
+        print("-" * 66)
+        for mode in ("antes", "después"):
+            rows = run(mode, path, args.replicas)
+            rss = sum(row[1] for row in rows) / len(rows) / 1024
+            pss = sum(row[2] for row in rows) / len(rows) / 1024
+            assert len({row[3] for row in rows}) == 1
+            print(f"{mode:<10} | {rss:16.1f} | {pss:16.1f} | {pss * len(rows):14.1f}")
+
+
+if __name__ == "__main__":
+    main()
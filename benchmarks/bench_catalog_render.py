@@ -0,0 +1,99 @@
+"""
+Benchmark de renderizado de resultados del Catálogo de Vehículos.
+
+Ejecuta con `streamlit.testing.v1.AppTest` dos versiones de la lista de resultados sobre el
+mismo catálogo sintético y mide, por rerun:
+
+* Tiempo de ejecución del script (mediana de varios reruns).
+* Número de elementos emitidos y tamaño serializado (bytes de protobuf) enviado al navegador.
+
+"antes": el bucle original de 200 bloques (subheader, 2 write, markdown HTML y botón por vehículo).
+"después": `catalog_view.render_catalog_results` (una tabla paginada + detalle bajo demanda).
+
+Uso:
+    python benchmarks/bench_catalog_render.py [--vehicles 5000] [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import time
+
+from streamlit.testing.v1 import AppTest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SETUP = f"""
+import sys
+sys.path.insert(0, {REPO_DIR!r})
+import streamlit as st
+from vehicle_catalog import generate_vehicle_table
+
+@st.cache_resource
+def get_table(num_vehicles):
+    return generate_vehicle_table(num_vehicles)
+
+table = get_table(__NUM_VEHICLES__)
+indices = table.filter()
+"""
+
+LEGACY_SCRIPT = SETUP + """
+display_limit = 200
+for vehicle in table.rows(indices[:display_limit]):
+    st.subheader(f"{vehicle['year']} {vehicle['make']} {vehicle['model']}")
+    st.write(f"**Tipo:** {vehicle['type']} | **Combustible:** {vehicle['fuel']} | **Kilometraje:** {vehicle['mileage']:,} km")
+    st.write(f"**Color:** {vehicle['color']} | **Características:** {', '.join(vehicle['features'])}")
+    st.markdown(f"### Precio: <span style='color:green; font-weight:bold;'>${vehicle['price']:,.2f}</span>", unsafe_allow_html=True)
+    st.button(f"Ver Detalles / Financiar {vehicle['id']}", key=f"details_{vehicle['id']}")
+    st.markdown("---")
+"""
+
+PAGINATED_SCRIPT = SETUP + """
+from catalog_view import render_catalog_results
+render_catalog_results(table, indices, key="catalog")
+"""
+
+
+def payload(node):
+    """
+    Devuelve (número de elementos, bytes serializados) del árbol de elementos de AppTest.
+    """
+    proto = getattr(node, "proto", None)
+    children = getattr(node, "children", {})
+    count, size = (0, 0) if proto is None else (1 if not children else 0, proto.ByteSize())
+    for child in children.values():
+        child_count, child_size = payload(child)
+        count += child_count
+        size += child_size
+    return count, size
+
+
+def measure(script, repeat):
+    """
+    Ejecuta el script una vez para calentar cachés y luego mide `repeat` reruns.
+    """
+    app = AppTest.from_string(script, default_timeout=120)
+    app.run()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    elements, size = payload(app._tree)
+    return statistics.median(timings), elements, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vehicles", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'versión':<10} | {'rerun (ms)':>10} | {'elementos':>9} | {'payload (KB)':>12}")
+    print("-" * 50)
+    for name, script in (("antes", LEGACY_SCRIPT), ("después", PAGINATED_SCRIPT)):
+        rerun_ms, elements, size = measure(script.replace("__NUM_VEHICLES__", str(args.vehicles)), args.repeat)
+        print(f"{name:<10} | {rerun_ms:10.1f} | {elements:>9,} | {size / 1024:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
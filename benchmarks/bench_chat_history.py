@@ -0,0 +1,144 @@
+"""
+Benchmark del historial del Asistente AI (RAG) en sesiones largas.
+
+Ejecuta con `streamlit.testing.v1.AppTest` la página de chat con una conversación ya
+acumulada de N turnos y compara dos versiones:
+
+"antes": la lista `st.session_state.messages` con todos los mensajes, que se dibujan completos
+en cada rerun; el contexto de conversación sería la transcripción entera.
+"después": `chat_history.ChatHistory` (ventana de turnos recientes, archivo en SQLite y
+resumen acumulado; aquí el resumen es el extractivo de respaldo, sin LLM).
+
+Mide por rerun: tiempo del script (mediana), elementos y bytes de protobuf enviados al
+navegador, tamaño serializado del historial en `st.session_state` y tokens estimados del
+contexto de conversación que se enviaría al LLM.
+
+Uso:
+    python benchmarks/bench_chat_history.py [--turns 50 200 500] [--repeat 5]
+"""
+import argparse
+import os
+import pickle
+import statistics
+import sys
+import tempfile
+import time
+
+from streamlit.testing.v1 import AppTest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from rag_pipeline import estimate_tokens  # noqa: E402
+
+SETUP = f"""
+import sys
+sys.path.insert(0, {REPO_DIR!r})
+import streamlit as st
+
+def turn(i):
+    question = f"Pregunta {{i}}: ¿qué cuota tendría un crédito de {{20 + i % 60}} millones a {{12 + i % 4 * 12}} meses?"
+    answer = f"Respuesta {{i}}: " + "Con el plan estándar la cuota mensual estimada depende de la tasa y del plazo elegido. " * 8
+    return question, answer
+"""
+
+LEGACY_SCRIPT = SETUP + """
+if "messages" not in st.session_state:
+    st.session_state.messages = []
+    for i in range(__TURNS__):
+        question, answer = turn(i)
+        st.session_state.messages.append({"role": "user", "content": question})
+        st.session_state.messages.append({"role": "assistant", "content": answer})
+
+for message in st.session_state.messages:
+    with st.chat_message(message["role"]):
+        st.markdown(message["content"])
+st.chat_input("Escribe tu pregunta aquí...")
+"""
+
+WINDOWED_SCRIPT = SETUP + """
+from chat_history import ChatArchive, ChatHistory
+
+archive = ChatArchive(__ARCHIVE_PATH__)
+if "chat_history" not in st.session_state:
+    chat = ChatHistory("bench")
+    for i in range(__TURNS__):
+        chat.add_turn(*turn(i), archive)
+        if chat.needs_summary():
+            chat.update_summary(lambda summary, turns: None)
+    st.session_state.chat_history = chat
+chat = st.session_state.chat_history
+
+if chat.archived:
+    with st.expander(f"🗂️ {chat.archived} turnos anteriores"):
+        if chat.summary:
+            st.caption(f"Resumen: {chat.summary}")
+        st.button("Cargar turnos anteriores", key="chat_load_archive")
+for question, answer in chat.turns:
+    with st.chat_message("user"):
+        st.markdown(question)
+    with st.chat_message("assistant"):
+        st.markdown(answer)
+st.chat_input("Escribe tu pregunta aquí...")
+"""
+
+
+def payload(node):
+    """
+    Número de elementos hoja y suma de bytes de protobuf del árbol de AppTest.
+    """
+    proto = getattr(node, "proto", None)
+    children = getattr(node, "children", {})
+    count, size = (0, 0) if proto is None else (1 if not children else 0, proto.ByteSize())
+    for child in children.values():
+        child_count, child_size = payload(child)
+        count += child_count
+        size += child_size
+    return count, size
+
+
+def legacy_context(app):
+    return "\n".join(f"{message['role']}: {message['content']}" for message in app.session_state["messages"])
+
+
+def measure(script, state_key, context, repeat):
+    """
+    Ejecuta el script una vez (crea la conversación) y luego mide `repeat` reruns.
+    """
+    app = AppTest.from_string(script, default_timeout=120)
+    app.run()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    elements, size = payload(app._tree)
+    state_bytes = len(pickle.dumps(app.session_state[state_key]))
+    return statistics.median(timings), elements, size, state_bytes, estimate_tokens(context(app))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'turnos':>6} | {'versión':<8} | {'rerun (ms)':>10} | {'elementos':>9} | {'payload (KB)':>12} | {'sesión (KB)':>11} | {'contexto (tokens)':>17}")
+    print("-" * 94)
+    with tempfile.TemporaryDirectory() as tmp:
+        for turns in args.turns:
+            archive_path = os.path.join(tmp, f"chat_archive_{turns}.db")
+            versions = (
+                ("antes", LEGACY_SCRIPT, "messages", legacy_context),
+                ("después", WINDOWED_SCRIPT.replace("__ARCHIVE_PATH__", repr(archive_path)), "chat_history",
+                 lambda app: app.session_state["chat_history"].context()),
+            )
+            for name, script, state_key, context in versions:
+                rerun_ms, elements, size, state_bytes, tokens = measure(
+                    script.replace("__TURNS__", str(turns)), state_key, context, args.repeat
+                )
+                print(f"{turns:>6} | {name:<8} | {rerun_ms:10.1f} | {elements:>9,} | {size / 1024:12.1f} | {state_bytes / 1024:11.1f} | {tokens:>17,}")
+
+
+if __name__ == "__main__":
+    main()
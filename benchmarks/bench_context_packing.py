@@ -0,0 +1,151 @@
+"""
+Benchmark del empaquetado de contexto del Asistente AI (`rag_pipeline.pack_context`).
+
+Ingiere un documento sintético de políticas con una sección larga por plan (varios
+fragmentos solapados por sección) y una copia parcial del mismo documento subida con otro
+nombre, que produce fragmentos casi duplicados. Para preguntas sobre cada plan compara:
+
+* "top-3": los 3 mejores candidatos de la búsqueda híbrida concatenados (comportamiento
+  anterior).
+* "MMR + presupuesto": `pack_context` con varios presupuestos de tokens.
+
+Reporta el acierto (la sección correcta está en el contexto), los tokens de prompt estimados,
+los fragmentos por prompt y cuántos de ellos repiten texto de otro fragmento del contexto.
+
+Antes comprueba que un fragmento que solo encuentra una de las búsquedas (la léxica, en el
+segundo puesto) entra al contexto junto a los que encuentran ambas; si no, termina con error.
+
+Uso:
+    python benchmarks/bench_context_packing.py [--plans 40] [--duplicated 0.3]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chromadb  # noqa: E402
+
+from document_ingestion import chunk_pages, document_fingerprint, sync_document  # noqa: E402
+from fake_backends import FakeEmbeddings  # noqa: E402
+from lexical_index import LexicalIndex  # noqa: E402
+from langchain_core.documents import Document  # noqa: E402
+from rag_pipeline import (  # noqa: E402
+    MMR_CANDIDATES, RAG_PROMPT_TEMPLATE, build_rag_prompt, estimate_tokens, pack_context, reciprocal_rank_fusion,
+    retrieve_candidates
+)
+
+NAMES = ["Flexi-Cuota", "Ágil", "Tranquilo", "Verde", "Joven", "Pyme", "Premium", "Express", "Familiar", "Escolar"]
+CATEGORIES = ["nuevos", "usados", "eléctricos", "comerciales", "de carga", "importados"]
+SENTENCES = [
+    "Para vehículos {category} el Plan {name} ofrece una tasa de {rate}% E.A.",
+    "La cuota inicial mínima del Plan {name} para vehículos {category} es del {down}% del valor comercial.",
+    "El plazo del Plan {name} para vehículos {category} va de 12 a {term} meses, con pagos mensuales fijos.",
+    "Los vehículos {category} del Plan {name} requieren una póliza de todo riesgo con deducible del {deductible}%.",
+]
+
+
+def policy(num_plans, seed=8):
+    rng = random.Random(seed)
+    pages, plans = [], []
+    for page in range(1, num_plans + 1):
+        name = f"{NAMES[(page - 1) % len(NAMES)]}-{(page - 1) // len(NAMES) + 1}"
+        sentences = []
+        for category in CATEGORIES:
+            values = dict(name=name, category=category, rate=f"{rng.randint(10, 29)},{rng.randint(10, 99)}",
+                          down=rng.randint(10, 40), term=rng.choice([48, 60, 72, 84]), deductible=rng.randint(5, 20))
+            sentences.extend(sentence.format(**values) for sentence in SENTENCES)
+        pages.append((page, " ".join(sentences)))
+        plans.append((page, name))
+    return pages, plans
+
+
+def repeated_chunks(documents):
+    """
+    Fragmentos del contexto cuyos primeros 100 caracteres aparecen en otro fragmento del
+    contexto (solapamiento entre vecinos o copia de otra fuente).
+    """
+    repeated = 0
+    for i, doc in enumerate(documents):
+        probe = doc.page_content[:100]
+        if any(probe in other.page_content for j, other in enumerate(documents) if j != i):
+            repeated += 1
+    return repeated
+
+
+def check_single_retriever_hit(collection):
+    """
+    Fusiona una búsqueda "vectorial" con los fragmentos de las páginas 1 a 4 y una "léxica" que
+    devuelve el primero de ellos y, en segundo lugar, uno de la página 5 que la vectorial no
+    encontró. Con presupuesto de sobra, `pack_context` debe incluir ese fragmento.
+    """
+    stored = collection.get(where={"source": "politicas.pdf"}, include=["documents", "metadatas"])
+    chunks = {chunk_id: Document(page_content=text, metadata=metadata)
+              for chunk_id, text, metadata in zip(stored["ids"], stored["documents"], stored["metadatas"])}
+    vector_ranking = [chunk_id for chunk_id, doc in chunks.items() if doc.metadata["page"] <= 4][:MMR_CANDIDATES // 2]
+    lexical_only = next(chunk_id for chunk_id, doc in chunks.items() if doc.metadata["page"] == 5)
+    fused = reciprocal_rank_fusion([vector_ranking, [vector_ranking[0], lexical_only]])
+    ids = [chunk_id for chunk_id, _ in fused]
+    selected, _, _ = pack_context(collection, ids, [chunks[chunk_id] for chunk_id in ids], [score for _, score in fused],
+                                  token_budget=100_000)
+    assert lexical_only in selected, "el fragmento que solo encontró la búsqueda léxica no entró al contexto"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plans", type=int, default=40)
+    parser.add_argument("--duplicated", type=float, default=0.3, help="Fracción del documento subida de nuevo con otro nombre.")
+    args = parser.parse_args()
+
+    pages, plans = policy(args.plans)
+    embeddings = FakeEmbeddings()
+    collection = chromadb.EphemeralClient().create_collection("politicas")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        lexical_index = LexicalIndex(os.path.join(tmp_dir, "lexical.db"))
+        copy = pages[:int(len(pages) * args.duplicated)]
+        for source, source_pages in (("politicas.pdf", pages), ("politicas_copia.pdf", copy)):
+            documents = list(chunk_pages(source_pages, source))
+            data = "".join(text for _, text in source_pages).encode("utf-8")
+            sync_document(documents, source, document_fingerprint(data), embeddings, collection, lexical_index=lexical_index)
+
+        check_single_retriever_hit(collection)
+
+        queries = [(f"¿Cuál es la cuota inicial mínima del Plan {name} para vehículos usados?", page) for page, name in plans]
+        candidates = {
+            query: retrieve_candidates(collection, lexical_index, query, embeddings.embed_query(query))
+            for query, _ in queries
+        }
+
+        def top3(query):
+            ids, documents, _ = candidates[query]
+            context = "\n\n".join(doc.page_content for doc in documents[:3])
+            return documents[:3], estimate_tokens(RAG_PROMPT_TEMPLATE.format(context=context, conversation="", user_query=query))
+
+        def packed(budget):
+            def run(query):
+                ids, documents, scores = candidates[query]
+                _, selected, _ = pack_context(collection, ids[:MMR_CANDIDATES], documents[:MMR_CANDIDATES],
+                                              scores[:MMR_CANDIDATES], budget)
+                return selected, estimate_tokens(build_rag_prompt(query, selected))
+            return run
+
+        print(f"{collection.count()} fragmentos ({args.plans} secciones, {len(copy)} duplicadas en otra fuente), {len(queries)} preguntas")
+        print(f"{'contexto':<26} | {'acierto':>7} | {'tokens prompt (media)':>21} | {'máx.':>5} | {'fragm./prompt':>13} | {'con texto repetido':>18}")
+        print("-" * 106)
+        for name, run in [("top-3", top3)] + [(f"MMR + presupuesto {budget}", packed(budget)) for budget in (600, 1000, 1500)]:
+            hits, tokens, chunks, repeated = 0, [], [], 0
+            for query, page in queries:
+                documents, prompt_tokens = run(query)
+                hits += any(doc.metadata.get("page") == page for doc in documents)
+                tokens.append(prompt_tokens)
+                chunks.append(len(documents))
+                repeated += repeated_chunks(documents)
+            print(f"{name:<26} | {hits / len(queries):7.0%} | {statistics.mean(tokens):21.0f} | {max(tokens):5} | "
+                  f"{statistics.mean(chunks):13.1f} | {repeated / sum(chunks):18.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark de la caché de embeddings al volver a ingerir un documento.
+
+Fragmenta un documento sintético de política de crédito y lo ingiere con `embed_and_store`
+contra `fake_backends.FakeEmbeddings` (con latencia) tres veces: la primera subida, la misma
+subida repetida y una versión con el 10% de las páginas editadas. Compara el tiempo y los
+textos enviados al backend sin caché y con `CachedEmbeddings` (SQLite temporal).
+
+Uso:
+    python benchmarks/bench_embedding_cache.py [--pages 200] [--edited 0.1]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chromadb  # noqa: E402
+
+from document_ingestion import chunk_pages, embed_and_store  # noqa: E402
+from embedding_cache import CachedEmbeddings, EmbeddingCache  # noqa: E402
+from fake_backends import FakeEmbeddings  # noqa: E402
+
+CLAUSE = ("Artículo {page}.{n}. La relación cuota/ingreso no podrá superar el {ratio}% y la cuota inicial "
+          "mínima será del {down}% del valor comercial del vehículo, con plazos de 12 a 84 meses según el "
+          "perfil de riesgo y el historial crediticio del solicitante. ")
+
+
+def document_pages(num_pages, edited_fraction=0.0, seed=3):
+    rng = random.Random(seed)
+    edited = set(rng.sample(range(1, num_pages + 1), int(num_pages * edited_fraction)))
+    pages = []
+    for page in range(1, num_pages + 1):
+        text = "".join(CLAUSE.format(page=page, n=n, ratio=30 + n, down=10 + n) for n in range(1, 12))
+        if page in edited:
+            text = text.replace("12 a 84 meses", "12 a 72 meses")
+        pages.append((page, text))
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--edited", type=float, default=0.1, help="Fracción de páginas editadas en la segunda versión.")
+    parser.add_argument("--latency", type=float, default=0.2, help="Segundos por llamada al backend.")
+    args = parser.parse_args()
+
+    uploads = [
+        ("primera subida", document_pages(args.pages)),
+        ("misma subida", document_pages(args.pages)),
+        (f"{args.edited:.0%} editado", document_pages(args.pages, args.edited)),
+    ]
+    client = chromadb.EphemeralClient()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        uncached_backend = FakeEmbeddings(latency=args.latency, latency_per_text=0.002)
+        cached_backend = FakeEmbeddings(latency=args.latency, latency_per_text=0.002)
+        cached = CachedEmbeddings(cached_backend, EmbeddingCache(os.path.join(tmp_dir, "cache.db")))
+
+        print(f"Documento de {args.pages} páginas, latencia {args.latency * 1000:.0f} ms/llamada + 2 ms/texto")
+        print(f"{'subida':<16} | {'fragm.':>6} | {'sin caché (s)':>13} | {'con caché (s)':>13} | {'aciertos':>8} | {'al backend':>10} | {'aceleración':>11}")
+        print("-" * 97)
+        for i, (name, pages) in enumerate(uploads):
+            documents = list(chunk_pages(pages, "politica.pdf"))
+            plain = embed_and_store(documents, uncached_backend, client.create_collection(f"sin_cache_{i}"))
+            before = cached.stats()
+            sent_before = cached_backend.texts_embedded
+            with_cache = embed_and_store(documents, cached, client.create_collection(f"con_cache_{i}"))
+            hits = cached.stats()["hits"] - before["hits"]
+            sent = cached_backend.texts_embedded - sent_before
+            print(f"{name:<16} | {len(documents):>6,} | {plain['seconds']:13.2f} | {with_cache['seconds']:13.2f} | "
+                  f"{hits:>8,} | {sent:>10,} | {plain['seconds'] / with_cache['seconds']:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
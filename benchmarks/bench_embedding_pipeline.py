@@ -0,0 +1,76 @@
+"""
+Benchmark del pipeline de embeddings de la ingesta RAG contra un backend local simulado.
+
+Usa `fake_backends.FakeEmbeddings` (latencia por llamada y por texto, y fallos transitorios)
+y una colección de Chroma en memoria, y compara:
+
+* "antes": una sola llamada `add_documents` con todos los fragmentos (el cliente los envía en
+  peticiones secuenciales de 100 y un solo fallo pierde todo el documento).
+* `embed_and_store` con distintos tamaños de lote y niveles de concurrencia.
+
+Uso:
+    python benchmarks/bench_embedding_pipeline.py [--chunks 2000] [--failure-rate 0.05]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chromadb  # noqa: E402
+from langchain_community.vectorstores import Chroma  # noqa: E402
+from langchain_core.documents import Document  # noqa: E402
+
+from document_ingestion import embed_and_store  # noqa: E402
+from fake_backends import FakeEmbeddings  # noqa: E402
+
+
+def synthetic_documents(num_chunks):
+    return [
+        Document(page_content=f"Fragmento {i} de la política de crédito: plazo de {12 + i % 72} meses, "
+                              f"cuota inicial del {10 + i % 30}% y tasa preferencial para el perfil {i % 5}.",
+                 metadata={"source": "politica.pdf", "page": 1 + i // 4})
+        for i in range(num_chunks)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.2, help="Segundos por llamada al backend.")
+    parser.add_argument("--latency-per-text", type=float, default=0.002, help="Segundos adicionales por texto.")
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    args = parser.parse_args()
+
+    documents = synthetic_documents(args.chunks)
+    client = chromadb.EphemeralClient()
+
+    def backend():
+        return FakeEmbeddings(latency=args.latency, latency_per_text=args.latency_per_text, failure_rate=args.failure_rate, seed=1)
+
+    print(f"{args.chunks:,} fragmentos, latencia {args.latency * 1000:.0f} ms/llamada + {args.latency_per_text * 1000:.0f} ms/texto, "
+          f"{args.failure_rate:.0%} de llamadas fallidas")
+    print(f"{'versión':<24} | {'tiempo (s)':>10} | {'fragm./s':>9} | {'guardados':>9} | {'reintentos':>10}")
+    print("-" * 75)
+
+    store = Chroma(client=client, collection_name="antes", embedding_function=backend())
+    start = time.perf_counter()
+    try:
+        store.add_documents(documents)
+        outcome = f"{store._collection.count():>9,}"
+    except ConnectionError:
+        outcome = f"{'error':>9}"
+    elapsed = time.perf_counter() - start
+    print(f"{'antes (1 llamada)':<24} | {elapsed:10.2f} | {'-':>9} | {outcome} | {'-':>10}")
+
+    for batch_size, max_workers in ((64, 1), (64, 4), (32, 8)):
+        collection = client.get_or_create_collection(f"lotes_{batch_size}_{max_workers}")
+        stats = embed_and_store(documents, backend(), collection, batch_size=batch_size, max_workers=max_workers, backoff=0.05)
+        assert collection.count() == stats["stored"]
+        name = f"lotes {batch_size} x {max_workers} hilos"
+        print(f"{name:<24} | {stats['seconds']:10.2f} | {stats['chunks_per_second']:9.1f} | {stats['stored']:>9,} | {stats['retries']:>10}")
+
+
+if __name__ == "__main__":
+    main()
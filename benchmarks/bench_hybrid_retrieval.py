@@ -0,0 +1,136 @@
+"""
+Benchmark de la recuperación híbrida (BM25 + vectorial con RRF) del Asistente AI.
+
+Construye un documento sintético de políticas de crédito con un plan por página (nombre del
+plan, número de artículo, tasa y cuota inicial) entre páginas de relleno con el mismo
+vocabulario, lo ingiere con `sync_document` en una colección de Chroma en memoria y en un
+`LexicalIndex`, y lanza preguntas por nombre de plan, número de artículo y porcentaje cuya
+página correcta se conoce.
+
+Compara la búsqueda vectorial, la léxica y la híbrida (acierto en top-k, MRR y latencias
+p50/p95 con la latencia del servicio de embeddings simulada por `fake_backends.FakeEmbeddings`),
+y el caso de un servicio de embeddings lento, donde la híbrida responde solo con la léxica.
+
+Uso:
+    python benchmarks/bench_hybrid_retrieval.py [--plans 60] [--filler 240] [--embedding-latency 0.15]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chromadb  # noqa: E402
+
+from document_ingestion import chunk_pages, document_fingerprint, sync_document  # noqa: E402
+from fake_backends import FakeEmbeddings  # noqa: E402
+from lexical_index import LexicalIndex  # noqa: E402
+from llm_streaming import percentile  # noqa: E402
+from rag_pipeline import embed_query_with_timeout, retrieve, retrieve_hybrid  # noqa: E402
+
+K = 3
+NAMES = ["Flexi-Cuota", "Ágil", "Tranquilo", "Verde", "Joven", "Pyme", "Premium", "Express", "Familiar", "Escolar",
+         "Taxi", "Rural", "Eléctrico", "Renove", "Profesional", "Campero", "Urbano", "Senior", "Flota", "Puente"]
+FILLER = ("Los planes de financiación de vehículos tienen una tasa efectiva anual que depende del perfil de riesgo, "
+          "de la cuota inicial y del plazo. Según el artículo correspondiente del reglamento, la cuota inicial "
+          "mínima y la tasa pueden cambiar con el historial crediticio del solicitante y el tipo de plan elegido. ")
+
+
+def policy(num_plans, num_filler, seed=21):
+    """
+    Páginas del documento y, por plan, (página, nombre, artículo, tasa).
+    """
+    rng = random.Random(seed)
+    pages, plans = [], []
+    plan_pages = set(rng.sample(range(1, num_plans + num_filler + 1), num_plans))
+    for page in range(1, num_plans + num_filler + 1):
+        if page in plan_pages:
+            name = f"{NAMES[len(plans) % len(NAMES)]}-{len(plans) // len(NAMES) + 1}"
+            article = f"{len(plans) // 10 + 3}.{len(plans) % 10 + 1}"
+            rate = f"{rng.randint(10, 29)},{rng.randint(10, 99)}"
+            text = (f"Artículo {article}. El Plan {name} ofrece una tasa de {rate}% E.A. con una cuota inicial del "
+                    f"{rng.randint(10, 40)}% y un plazo de hasta {rng.choice([36, 48, 60, 72, 84])} meses. " + FILLER)
+            plans.append((page, name, article, rate))
+        else:
+            text = FILLER * 2
+        pages.append((page, text))
+    return pages, plans
+
+
+def questions(plans):
+    result = []
+    for page, name, article, rate in plans:
+        result.append(("nombre de plan", f"¿Qué tasa tiene el Plan {name}?", page))
+        result.append(("artículo", f"¿Qué establece el artículo {article}?", page))
+        result.append(("porcentaje", f"¿Qué plan tiene una tasa de {rate}% E.A.?", page))
+    return result
+
+
+def evaluate(search, queries):
+    """
+    Acierto en top-k, MRR y latencias (ms) de `search(pregunta) -> documentos`.
+    """
+    hits, reciprocal_ranks, timings = 0, 0.0, []
+    for _, query, page in queries:
+        start = time.perf_counter()
+        documents = search(query)
+        timings.append((time.perf_counter() - start) * 1000)
+        ranks = [rank for rank, doc in enumerate(documents, 1) if doc.metadata.get("page") == page]
+        hits += bool(ranks)
+        reciprocal_ranks += 1 / ranks[0] if ranks else 0.0
+    return hits / len(queries), reciprocal_ranks / len(queries), timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plans", type=int, default=60)
+    parser.add_argument("--filler", type=int, default=240)
+    parser.add_argument("--embedding-latency", type=float, default=0.15)
+    parser.add_argument("--slow-latency", type=float, default=3.0, help="Latencia del servicio de embeddings lento.")
+    parser.add_argument("--timeout", type=float, default=0.5, help="Plazo del embedding de la consulta en la híbrida.")
+    args = parser.parse_args()
+
+    pages, plans = policy(args.plans, args.filler)
+    queries = questions(plans)
+    embeddings = FakeEmbeddings(latency=args.embedding_latency)
+    collection = chromadb.EphemeralClient().create_collection("politicas")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        lexical_index = LexicalIndex(os.path.join(tmp_dir, "lexical.db"))
+        documents = list(chunk_pages(pages, "politicas.pdf"))
+        data = "".join(text for _, text in pages).encode("utf-8")
+        sync_document(documents, "politicas.pdf", document_fingerprint(data), FakeEmbeddings(), collection, lexical_index=lexical_index)
+
+        modes = {
+            "vectorial": lambda q: retrieve(collection, embeddings.embed_query(q), K)[1],
+            "léxica": lambda q: lexical_index.search(q, K)[1],
+            "híbrida": lambda q: retrieve_hybrid(collection, lexical_index, q, embeddings.embed_query(q), K)[1],
+        }
+        print(f"{len(documents)} fragmentos ({args.plans} planes), {len(queries)} preguntas, "
+              f"embedding de consulta {args.embedding_latency * 1000:.0f} ms")
+        print(f"{'búsqueda':<10} | {'acierto top-' + str(K):>13} | {'nombre':>7} | {'artículo':>8} | {'porcentaje':>10} | {'MRR':>5} | {'p50 (ms)':>8} | {'p95 (ms)':>8}")
+        print("-" * 94)
+        for name, search in modes.items():
+            hit_rate, mrr, timings = evaluate(search, queries)
+            by_kind = [evaluate(search, [q for q in queries if q[0] == kind])[0] for kind in ("nombre de plan", "artículo", "porcentaje")]
+            print(f"{name:<10} | {hit_rate:13.0%} | {by_kind[0]:7.0%} | {by_kind[1]:8.0%} | {by_kind[2]:10.0%} | {mrr:5.2f} | "
+                  f"{percentile(timings, 0.5):8.1f} | {percentile(timings, 0.95):8.1f}")
+
+        slow = FakeEmbeddings(latency=args.slow_latency)
+        sample = queries[:10]
+        print(f"\nServicio de embeddings lento ({args.slow_latency:.1f} s), plazo de la híbrida {args.timeout:.1f} s, {len(sample)} preguntas")
+        print(f"{'búsqueda':<10} | {'acierto top-' + str(K):>13} | {'p50 (ms)':>8} | {'p95 (ms)':>8}")
+        print("-" * 48)
+        for name, search in (
+            ("vectorial", lambda q: retrieve(collection, slow.embed_query(q), K)[1]),
+            ("híbrida", lambda q: retrieve_hybrid(collection, lexical_index, q, embed_query_with_timeout(slow, q, timeout=args.timeout), K)[1]),
+        ):
+            hit_rate, _, timings = evaluate(search, sample)
+            print(f"{name:<10} | {hit_rate:13.0%} | {percentile(timings, 0.5):8.1f} | {percentile(timings, 0.95):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
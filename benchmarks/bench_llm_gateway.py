@@ -0,0 +1,85 @@
+"""
+Benchmark de la pasarela LLM (`llm_gateway.LLMGateway`).
+
+Contra `fake_backends.FakeChatModel` con latencia y fallos transitorios simulados compara:
+
+* "directo": llamadas secuenciales a `invoke` en el hilo de la sesión, con try/except y sin
+  plazo (comportamiento anterior).
+* "pasarela": `LLMGateway.batch` con concurrencia limitada, reintentos con jitter y plazo.
+
+Escenarios: un lote de análisis (uno por solicitud) y una llamada a un modelo que se cuelga,
+donde se mide cuánto tiempo queda bloqueado el hilo de la sesión.
+
+Uso:
+    python benchmarks/bench_llm_gateway.py [--applications 24] [--latency 0.5] [--failure-rate 0.1]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_backends import FakeChatModel  # noqa: E402
+from llm_gateway import LLMGateway  # noqa: E402
+
+PROMPT = "Analiza la solicitud {n}: vehículo de {amount} COP, etapa de análisis preliminar."
+
+
+def run_direct(llm, prompts):
+    results = []
+    for prompt in prompts:
+        try:
+            results.append(llm.invoke(prompt).content)
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def report(name, mode, seconds, results, retries="-"):
+    errors = sum(isinstance(result, Exception) for result in results)
+    print(f"{name:<22} | {mode:<8} | {seconds:8.2f} | {len(results) - errors:>10} | {errors:>7} | {retries:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applications", type=int, default=24)
+    parser.add_argument("--latency", type=float, default=0.5, help="Segundos por respuesta.")
+    parser.add_argument("--failure-rate", type=float, default=0.1)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--hang", type=float, default=10.0, help="Segundos que tarda el modelo colgado.")
+    parser.add_argument("--timeout", type=float, default=2.0, help="Plazo de la pasarela para el modelo colgado.")
+    args = parser.parse_args()
+
+    random.seed(5)
+    prompts = [PROMPT.format(n=n, amount=30_000_000 + 1_000_000 * n) for n in range(args.applications)]
+    llm = FakeChatModel(first_token_latency=args.latency, failure_rate=args.failure_rate)
+
+    print(f"{args.applications} solicitudes, {args.latency * 1000:.0f} ms por respuesta, {args.failure_rate:.0%} de fallos, "
+          f"concurrencia {args.concurrency}")
+    print(f"{'escenario':<22} | {'modo':<8} | {'tiempo (s)':>8} | {'respuestas':>10} | {'errores':>7} | {'reintentos':>10}")
+    print("-" * 80)
+
+    start = time.perf_counter()
+    results = run_direct(llm, prompts)
+    report("lote de análisis", "directo", time.perf_counter() - start, results)
+
+    gateway = LLMGateway(llm, max_concurrency=args.concurrency, backoff=0.2)
+    start = time.perf_counter()
+    results = gateway.batch(prompts)
+    report("lote de análisis", "pasarela", time.perf_counter() - start, results, gateway.stats()["retries"])
+
+    hung = FakeChatModel(first_token_latency=args.hang)
+    start = time.perf_counter()
+    results = run_direct(hung, prompts[:1])
+    report("modelo colgado", "directo", time.perf_counter() - start, results)
+
+    gateway = LLMGateway(hung, timeout=args.timeout)
+    start = time.perf_counter()
+    results = gateway.batch(prompts[:1])
+    report("modelo colgado", "pasarela", time.perf_counter() - start, results, gateway.stats()["retries"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark de la latencia percibida de las páginas con IA: respuesta completa vs. streaming.
+
+Genera los prompts de las páginas de IA contra `fake_backends.FakeChatModel` con latencia
+hasta el primer token y latencia por token, y compara:
+
+* "invoke": el usuario ve la respuesta cuando llega completa (comportamiento anterior).
+* "stream": `stream_text` + `LLMLatencyLog.track`, como `write_llm_stream` en la aplicación;
+  el usuario ve texto desde el primer token.
+
+Reporta p50/p95 del tiempo hasta ver texto y del tiempo total por modo.
+
+Uso:
+    python benchmarks/bench_llm_streaming.py [--requests 20] [--first-token 0.4] [--token 0.02]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_backends import FakeChatModel  # noqa: E402
+from llm_streaming import LLMLatencyLog, stream_text  # noqa: E402
+
+PROMPTS = {
+    "Análisis Preliminar": "Analiza el perfil financiero: ingresos {i} COP, deudas {d} COP, vehículo {p} COP.",
+    "Valoración de Vehículos": "Estima el valor de un vehículo Mazda 3 modelo {i} con {d} km y precio de lista {p} COP.",
+    "Simulador de Escenarios": "Compara escenarios de crédito de {p} COP a 36 y 60 meses con cuota inicial de {d} COP.",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20, help="Peticiones por página.")
+    parser.add_argument("--first-token", type=float, default=0.4, help="Segundos hasta el primer token.")
+    parser.add_argument("--token", type=float, default=0.02, help="Segundos por token siguiente.")
+    parser.add_argument("--words", type=int, default=120)
+    args = parser.parse_args()
+
+    llm = FakeChatModel(answer_words=args.words, first_token_latency=args.first_token, token_latency=args.token)
+    invoke_log = LLMLatencyLog()
+    stream_log = LLMLatencyLog()
+
+    for page, template in PROMPTS.items():
+        for n in range(args.requests):
+            prompt = template.format(i=2015 + n, d=1_000_000 * n, p=80_000_000 + 1_000_000 * n)
+            start = time.perf_counter()
+            text = llm.invoke(prompt).content
+            elapsed = time.perf_counter() - start
+            invoke_log.record(page, elapsed, elapsed, len(text))
+            for _ in stream_log.track(page, stream_text(llm, prompt)):
+                pass
+
+    print(f"{args.requests} peticiones por página, primer token {args.first_token * 1000:.0f} ms, "
+          f"{args.token * 1000:.0f} ms/token, {args.words} tokens por respuesta")
+    print(f"{'página':<24} | {'modo':<6} | {'ve texto p50 (s)':>16} | {'ve texto p95 (s)':>16} | {'total p50 (s)':>13} | {'total p95 (s)':>13}")
+    print("-" * 103)
+    invoke_summary = invoke_log.summary()
+    stream_summary = stream_log.summary()
+    for page in PROMPTS:
+        for mode, summary in (("invoke", invoke_summary), ("stream", stream_summary)):
+            stats = summary[page]
+            print(f"{page:<24} | {mode:<6} | {stats['ttft_p50']:16.2f} | {stats['ttft_p95']:16.2f} | "
+                  f"{stats['total_p50']:13.2f} | {stats['total_p95']:13.2f}")
+
+
+if __name__ == "__main__":
+    main()
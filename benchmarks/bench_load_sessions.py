@@ -0,0 +1,465 @@
+"""
+Prueba de carga de la aplicación con varias sesiones simultáneas y modelos locales.
+
+Arranca un servidor `streamlit run main.py` real en un proceso aparte y lo recorre con N
+clientes simultáneos que hablan con él por websocket como el navegador (mensajes `BackMsg` y
+`ForwardMsg`), cada uno en su propio hilo. Las sesiones comparten, como en producción, el
+proceso del servidor: `st.cache_resource` y `st.cache_data` (catálogo, índices, Chroma, pasarela
+LLM y su límite de concurrencia), los hilos de los scripts y el GIL. En el servidor, los clientes
+de Gemini se sustituyen por `fake_backends.FakeChatModel` y `FakeEmbeddings`, con latencias
+configurables, y la base vectorial se carga antes con el corpus de `benchmarks/rag_eval/corpus/`,
+de modo que no hace falta clave API ni red. El tamaño del catálogo se toma, como en la
+aplicación, de la variable de entorno `CATALOG_VEHICLES`.
+
+Cada sesión recorre varias veces, en un orden propio, los flujos de `FLOWS` (filtros del
+Catálogo de Vehículos, Comparador, Recomendador de Planes y Asistente AI). Cada interacción
+envía los widgets que cambió y espera a que el servidor termine de ejecutar el script, o
+solo el `st.fragment` del widget, como haría el navegador. Los widgets se leen con el árbol de
+elementos de `streamlit.testing.v1`, que se arma después de medir el rerun. Las sesiones de un
+nivel se conectan y arrancan a la vez.
+Para cada nivel de concurrencia se informa:
+
+* Por página: reruns, latencia p50/p95/p99 (ms) y errores de las sesiones: reruns con una
+  excepción en la página, que no terminaron en el plazo o que cortaron la conexión, y flujos
+  interrumpidos (el widget esperado no apareció).
+* Reruns por segundo del conjunto de sesiones, flujos interrumpidos y errores registrados
+  por el servidor (registros de nivel ERROR y excepciones de hilos en su salida).
+* Memoria residente (RSS) del servidor antes del nivel, con todas sus sesiones conectadas y
+  su crecimiento por sesión.
+
+El arranque en frío (catálogo, modelos y caché del índice) se mide aparte con una sesión de
+calentamiento. Todo se ejecuta en un directorio temporal. `--output` guarda el informe en JSON.
+
+Uso:
+    python benchmarks/bench_load_sessions.py [--sessions 1 2 4 8] [--iterations 2]
+        [--llm-first-token-latency 0.3] [--llm-token-latency 0.01] [--embedding-latency 0.05]
+"""
+import argparse
+import json
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from langchain_community.vectorstores import Chroma  # noqa: E402
+from streamlit.proto.BackMsg_pb2 import BackMsg  # noqa: E402
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg  # noqa: E402
+from streamlit.proto.WidgetStates_pb2 import WidgetState  # noqa: E402
+from streamlit.testing.v1.element_tree import Multiselect, Widget, _has_pending_value, parse_tree_from_messages  # noqa: E402
+from websockets.sync.client import connect  # noqa: E402
+
+from bench_rag_eval import CORPUS_DIR, EMBEDDING_DIMENSIONS, ingest_corpus, load_queries  # noqa: E402
+from document_ingestion import CollectionVersion  # noqa: E402
+from embedding_cache import CachedEmbeddings, EmbeddingCache  # noqa: E402
+from fake_backends import FakeChatModel, FakeEmbeddings  # noqa: E402
+from lexical_index import LexicalIndex  # noqa: E402
+from llm_streaming import percentile  # noqa: E402
+from vehicle_catalog import MAKES  # noqa: E402
+
+MAIN_SCRIPT = os.path.join(REPO_DIR, "main.py")
+STARTUP_PAGE = "carga inicial"
+QUESTIONS = [query["query"] for query in load_queries()]
+# Estados en los que el servidor da por terminada una interacción (los reruns de `st.rerun()`
+# terminan con FINISHED_EARLY_FOR_RERUN y siguen con otra ejecución).
+FINISHED = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+            ForwardMsg.FINISHED_WITH_COMPILE_ERROR}
+SERVER_ERROR_LINE = re.compile(r" (ERROR|CRITICAL) |^Exception in thread ")
+
+
+def catalog_flow(session, rng):
+    yield session.switch_page("Catálogo de Vehículos")
+    session.tree.text_input(key="catalog_search_query").input(rng.choice(MAKES))
+    yield "Catálogo de Vehículos"
+    types = session.tree.multiselect(key="catalog_types")
+    types.set_value(rng.sample(types.options, 2))
+    yield "Catálogo de Vehículos"
+    session.tree.slider(key="catalog_year").set_value(rng.randint(2018, 2023))
+    yield "Catálogo de Vehículos"
+
+
+def comparator_flow(session, rng):
+    yield session.switch_page("Comparador")
+    for make in rng.sample(MAKES, 2):
+        session.tree.text_input(key="compare_query").input(make)
+        yield "Comparador"
+        _button(session.tree, "Agregar al Comparador").click()
+        yield "Comparador"
+    _button(session.tree, "Comparar").click()
+    yield "Comparador"
+
+
+def recommender_flow(session, rng):
+    yield session.switch_page("Recomendador de Planes")
+    session.tree.number_input(key="reco_vehicle_value").set_value(rng.randrange(30000, 120000, 1000))
+    session.tree.number_input(key="reco_monthly_income").set_value(rng.randrange(2500, 9000, 100))
+    _button(session.tree, "Encontrar mi Plan Ideal").click()
+    yield "Recomendador de Planes"
+
+
+def assistant_flow(session, rng):
+    yield session.switch_page("Asistente AI (RAG)")
+    for question in rng.sample(QUESTIONS, 2):
+        session.tree.chat_input[0].set_value(question)
+        yield "Asistente AI (RAG)"
+
+
+FLOWS = [catalog_flow, comparator_flow, recommender_flow, assistant_flow]
+
+
+def _button(tree, label):
+    for button in tree.button:
+        if button.label == label:
+            return button
+    raise KeyError(label)
+
+
+def widget_state(node):
+    """
+    Valor de un widget tal como lo envía el navegador. El multiselect de `AppTest` formatea las
+    opciones con la función de la sesión del script, que el cliente no tiene; el navegador envía
+    las etiquetas de `options`, que ya vienen formateadas del servidor.
+    """
+    if isinstance(node, Multiselect):
+        state = WidgetState(id=node.id)
+        state.string_array_value.data[:] = [str(value) for value in node._value]
+        return state
+    return node._widget_state
+
+
+class RerunError(Exception):
+    """
+    El rerun no terminó: se venció el plazo o se cerró la conexión.
+    """
+
+
+class Session:
+    """
+    Una sesión simulada: un cliente websocket del servidor, el árbol de elementos de su última
+    ejecución, las latencias (ms) de sus reruns por página y sus errores.
+    """
+
+    def __init__(self, number, iterations, seed, url, timeout):
+        self.rng = random.Random(seed * 1000 + number)
+        self.iterations = iterations
+        self.timeout = timeout
+        self.connection = connect(url, subprotocols=["streamlit"], max_size=None, open_timeout=timeout)
+        self.pages = {}  # título -> hash del script de la página, de `st.navigation`
+        self.page_hash = ""
+        self.next_page = None
+        # Mensajes de elementos de la página por ruta en el árbol, como los mantiene el navegador:
+        # una ejecución completa los reemplaza todos; la de un fragmento, solo los suyos.
+        self.deltas = {}
+        self.widget_fragments = {}
+        self.tree = parse_tree_from_messages([])
+        self.timings = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.interrupted_flows = defaultdict(int)
+        self.page = STARTUP_PAGE
+        self.last_rerun_failed = False
+
+    def switch_page(self, title):
+        self.next_page = title
+        return title
+
+    def _back_msg(self):
+        """
+        Pide una ejecución con los widgets que el flujo cambió (el servidor conserva el valor de
+        los demás): la del fragmento de esos widgets si todos están en el mismo, si no la
+        completa, o la de otra página si el flujo navegó.
+        """
+        msg = BackMsg()
+        client_state = msg.rerun_script
+        if self.next_page is not None:
+            client_state.page_script_hash = self.pages[self.next_page]
+            self.next_page = None
+            return msg
+        client_state.page_script_hash = self.page_hash
+        changed = [node for node in self.tree if isinstance(node, Widget) and _has_pending_value(node)]
+        client_state.widget_states.widgets.extend(widget_state(node) for node in changed)
+        fragments = {self.widget_fragments.get(node.id, "") for node in changed}
+        if len(fragments) == 1 and "" not in fragments:
+            client_state.fragment_id = fragments.pop()
+        return msg
+
+    def _receive(self, msg):
+        """
+        Aplica un `ForwardMsg`. Devuelve el estado final si terminó la interacción y cuenta si la
+        página mostró una excepción.
+        """
+        kind = msg.WhichOneof("type")
+        if kind == "new_session":
+            self.page_hash = msg.new_session.page_script_hash
+            fragments = set(msg.new_session.fragment_ids_this_run)
+            self.deltas = {path: delta for path, delta in self.deltas.items()
+                           if fragments and delta.delta.fragment_id not in fragments}
+        elif kind == "navigation":
+            self.pages = {page.page_name: page.page_script_hash for page in msg.navigation.app_pages}
+        elif kind == "delta":
+            self.deltas[tuple(msg.metadata.delta_path)] = msg
+            element = msg.delta.new_element if msg.delta.HasField("new_element") else None
+            element_type = element.WhichOneof("type") if element is not None else None
+            if element_type == "exception":
+                self.last_rerun_failed = True
+            elif element_type is not None and getattr(getattr(element, element_type), "id", ""):
+                self.widget_fragments[getattr(element, element_type).id] = msg.delta.fragment_id
+        elif kind == "script_finished" and msg.script_finished in FINISHED:
+            if msg.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                self.last_rerun_failed = True
+            return msg.script_finished
+        return None
+
+    def rerun(self, page):
+        self.page = page
+        self.last_rerun_failed = False
+        start = time.perf_counter()
+        try:
+            self.connection.send(self._back_msg().SerializeToString())
+            while True:
+                msg = ForwardMsg()
+                msg.ParseFromString(self.connection.recv(timeout=self.timeout))
+                if self._receive(msg) is not None:
+                    break
+        except Exception as error:
+            self.errors[page] += 1
+            self.last_rerun_failed = True
+            raise RerunError(f"{page}: {error!r}") from error
+        self.timings[page].append((time.perf_counter() - start) * 1000)
+        self.tree = parse_tree_from_messages([self.deltas[path] for path in sorted(self.deltas)])
+        if self.last_rerun_failed:
+            self.errors[page] += 1
+
+    def _run_flow(self, name, steps, think_time):
+        try:
+            for page in steps:
+                self.rerun(page)
+                time.sleep(think_time)
+        except Exception:
+            # El rerun falló o el widget que el flujo esperaba no está: el flujo se corta y
+            # cuenta como error de la página (si el rerun no se contó ya).
+            self.interrupted_flows[name] += 1
+            if not self.last_rerun_failed:
+                self.errors[self.page] += 1
+
+    def run(self, think_time=0.0):
+        self._run_flow("carga_inicial", [STARTUP_PAGE], think_time)
+        for _ in range(self.iterations):
+            for flow in self.rng.sample(FLOWS, len(FLOWS)):
+                self._run_flow(flow.__name__, flow(self, self.rng), think_time)
+
+    def close(self):
+        self.connection.close()
+
+
+class Server:
+    """
+    `streamlit run main.py` en un subproceso (este mismo archivo con `--serve`), con su salida
+    en `log_path`.
+    """
+
+    def __init__(self, args, log_path, timeout=120):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            self.port = probe.getsockname()[1]
+        self.log_path = log_path
+        command = [sys.executable, os.path.abspath(__file__), "--serve", str(self.port),
+                   "--llm-first-token-latency", str(args.llm_first_token_latency),
+                   "--llm-token-latency", str(args.llm_token_latency),
+                   "--embedding-latency", str(args.embedding_latency)]
+        with open(log_path, "w", encoding="utf-8") as log:
+            self.process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/_stcore/health", timeout=1) as response:
+                    if response.status == 200:
+                        break
+            except OSError:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"El servidor no arrancó; ver {log_path}")
+                time.sleep(0.2)
+        self.url = f"ws://127.0.0.1:{self.port}/_stcore/stream"
+
+    def rss_mb(self):
+        """
+        Memoria residente actual del servidor (MB).
+        """
+        with open(f"/proc/{self.process.pid}/status") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith("VmRSS:")) / 1024
+
+    def error_lines(self):
+        with open(self.log_path, encoding="utf-8", errors="replace") as f:
+            return sum(1 for line in f if SERVER_ERROR_LINE.search(line))
+
+    def stop(self):
+        self.process.terminate()
+        self.process.wait(timeout=30)
+
+
+def run_level(server, num_sessions, args):
+    server_errors = server.error_lines()
+    rss_before = server.rss_mb()
+    sessions = [None] * num_sessions
+    failed_connections = []
+    start_barrier = threading.Barrier(num_sessions)
+    # Las sesiones quedan conectadas hasta medir la memoria del servidor con todas vivas.
+    done_barrier = threading.Barrier(num_sessions + 1)
+
+    def session_thread(number):
+        try:
+            sessions[number] = Session(number, args.iterations, args.seed, server.url, args.rerun_timeout)
+        except Exception as error:
+            failed_connections.append(repr(error))
+            start_barrier.abort()
+        try:
+            start_barrier.wait()
+            sessions[number].run(args.think_time)
+        except threading.BrokenBarrierError:
+            pass
+        finally:
+            done_barrier.wait()
+
+    threads = [threading.Thread(target=session_thread, args=(number,)) for number in range(num_sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    done_barrier.wait()
+    seconds = time.perf_counter() - start
+    rss_sessions = server.rss_mb()
+    for thread in threads:
+        thread.join()
+    for session in sessions:
+        if session is not None:
+            session.close()
+    if failed_connections:
+        raise RuntimeError(f"No se pudieron conectar {len(failed_connections)} sesiones: {failed_connections[0]}")
+
+    timings, errors, interrupted_flows = defaultdict(list), defaultdict(int), defaultdict(int)
+    for session in sessions:
+        for page, values in session.timings.items():
+            timings[page].extend(values)
+        for page, count in session.errors.items():
+            errors[page] += count
+        for name, count in session.interrupted_flows.items():
+            interrupted_flows[name] += count
+    reruns = sum(len(values) for values in timings.values())
+    return dict(
+        sessions=num_sessions,
+        seconds=seconds,
+        reruns=reruns,
+        reruns_per_second=reruns / seconds if seconds else 0.0,
+        rss_before_mb=rss_before,
+        rss_sessions_mb=rss_sessions,
+        rss_per_session_mb=(rss_sessions - rss_before) / num_sessions,
+        pages={page: dict(reruns=len(timings.get(page, [])), p50=percentile(timings.get(page, []), 0.5),
+                          p95=percentile(timings.get(page, []), 0.95), p99=percentile(timings.get(page, []), 0.99),
+                          errors=errors.get(page, 0))
+               for page in sorted(set(timings) | set(errors))},
+        interrupted_flows=dict(interrupted_flows),
+        server_errors=server.error_lines() - server_errors,
+    )
+
+
+def serve(port, args):
+    """
+    Proceso del servidor: sustituye los clientes de Gemini que importa `main.py` por los modelos
+    locales y ejecuta `streamlit run` en el directorio actual.
+    """
+    import langchain_google_genai
+    from streamlit.web import cli
+
+    langchain_google_genai.ChatGoogleGenerativeAI = lambda **kwargs: FakeChatModel(
+        first_token_latency=args.llm_first_token_latency, token_latency=args.llm_token_latency)
+    langchain_google_genai.GoogleGenerativeAIEmbeddings = lambda **kwargs: FakeEmbeddings(
+        dimensions=EMBEDDING_DIMENSIONS, latency=args.embedding_latency)
+    sys.exit(cli.main(args=[
+        "run", MAIN_SCRIPT, "--server.port", str(port), "--server.address", "127.0.0.1", "--server.headless", "true",
+        "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false", "--logger.level", "warning",
+        "--logger.messageFormat", "%(asctime)s %(levelname)s %(name)s: %(message)s",
+    ], prog_name="streamlit"))
+
+
+def write_secrets():
+    """
+    Guarda la clave en `.streamlit/secrets.toml` del directorio actual, donde la lee el servidor.
+    """
+    os.makedirs(".streamlit", exist_ok=True)
+    with open(os.path.join(".streamlit", "secrets.toml"), "w", encoding="utf-8") as f:
+        f.write('GOOGLE_API_KEY = "fake"\n')
+
+
+def load_corpus():
+    """
+    Ingiere el corpus de evaluación en las rutas que usa `main.py` (directorio actual).
+    """
+    embeddings = CachedEmbeddings(FakeEmbeddings(dimensions=EMBEDDING_DIMENSIONS), EmbeddingCache("embedding_cache.db"))
+    vector_store = Chroma(persist_directory="chroma_db", embedding_function=embeddings)
+    ingest_corpus(CORPUS_DIR, vector_store, LexicalIndex(os.path.join("chroma_db", "lexical_index.db")),
+                  CollectionVersion(os.path.join("chroma_db", "collection_version.db")))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8], help="Niveles de concurrencia.")
+    parser.add_argument("--iterations", type=int, default=2, help="Recorridos de todos los flujos por sesión.")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pausa entre interacciones de una sesión (s).")
+    parser.add_argument("--rerun-timeout", type=float, default=120.0, help="Plazo de cada rerun (s).")
+    parser.add_argument("--llm-first-token-latency", type=float, default=0.3)
+    parser.add_argument("--llm-token-latency", type=float, default=0.01)
+    parser.add_argument("--embedding-latency", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Ruta del informe JSON.")
+    parser.add_argument("--serve", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.serve, args)
+    output = os.path.abspath(args.output) if args.output else None
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir)
+        write_secrets()
+        load_corpus()
+        server = Server(args, os.path.join(tmp_dir, "server.log"))
+        try:
+            warmup_args = argparse.Namespace(**{**vars(args), "iterations": 1})
+            warmup = run_level(server, 1, warmup_args)
+            cold_start = warmup["pages"][STARTUP_PAGE]["p50"] / 1000 if STARTUP_PAGE in warmup["pages"] else float("nan")
+            print(f"Arranque en frío: {cold_start:.2f} s · LLM {args.llm_first_token_latency:.2f} s + "
+                  f"{args.llm_token_latency * 1000:.0f} ms/palabra · embeddings {args.embedding_latency * 1000:.0f} ms")
+
+            levels = []
+            for num_sessions in args.sessions:
+                level = run_level(server, num_sessions, args)
+                levels.append(level)
+                print(f"\n{num_sessions} sesiones: {level['reruns']} reruns en {level['seconds']:.1f} s "
+                      f"({level['reruns_per_second']:.1f} reruns/s) · RSS del servidor {level['rss_before_mb']:.0f} -> "
+                      f"{level['rss_sessions_mb']:.0f} MB ({level['rss_per_session_mb']:+.1f} MB por sesión)")
+                print(f"{'página':<26} | {'reruns':>6} | {'p50 (ms)':>8} | {'p95 (ms)':>8} | {'p99 (ms)':>8} | {'errores':>7}")
+                print("-" * 79)
+                for page, stats in level["pages"].items():
+                    print(f"{page:<26} | {stats['reruns']:>6} | {stats['p50']:8.0f} | {stats['p95']:8.0f} | "
+                          f"{stats['p99']:8.0f} | {stats['errors']:>7}")
+                for name, count in level["interrupted_flows"].items():
+                    print(f"flujo interrumpido: {name} ({count})")
+                if level["server_errors"]:
+                    print(f"errores registrados por el servidor: {level['server_errors']}")
+        finally:
+            server.stop()
+            os.chdir(REPO_DIR)
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(dict(config=vars(args), cold_start_seconds=cold_start, levels=levels), f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Benchmark del tiempo de rerun por interacción: script único vs. páginas con fragmentos.
+
+Cada interacción (un filtro del Catálogo de Vehículos, buscar o agregar en el Comparador, una
+pregunta al Asistente AI, desactivar una alerta, mover un slider del Simulador de Crédito) se
+mide con `streamlit.testing.v1.AppTest` como el tiempo del rerun que provoca:
+
+* "script completo": rerun de todo `main.py`, como ocurría con todas las páginas en un mismo
+  script (solo se mide en `--baseline`).
+* "página": rerun de `main.py` y de la página elegida con `st.navigation`.
+* "fragmento": rerun solo del `st.fragment` que contiene el widget, como lo pide el navegador.
+  `AppTest` siempre ejecuta el script completo, así que aquí se encola el fragmento en la
+  petición de rerun (`fragment_id_queue`), igual que hace el servidor. Las interacciones sobre
+  widgets fuera de fragmentos no tienen esta columna.
+
+`AppTest` compila el script en cada ejecución; el benchmark reutiliza la misma `ScriptCache`
+entre reruns, como el servidor, para no medir la compilación. Los clientes de Gemini se
+sustituyen por `fake_backends` sin latencia: se mide el trabajo de la aplicación, no el del
+modelo. Cada árbol se mide en un proceso nuevo y en un directorio vacío; la primera ronda
+calienta las cachés y no cuenta. Se informa la mediana y el p95 de `--repeat` rondas.
+
+Uso:
+    python benchmarks/bench_page_reruns.py [--baseline HEAD~1] [--repeat 10] [--output reruns.json]
+"""
+import argparse
+import functools
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGE_FILES = {
+    "Simulador de Crédito": "app_pages/credit_simulator.py",
+    "Catálogo de Vehículos": "app_pages/catalog.py",
+    "Comparador": "app_pages/comparator.py",
+    "Asistente AI (RAG)": "app_pages/rag_assistant.py",
+    "Alertas de Vehículos": "app_pages/alerts.py",
+}
+MAKES = ["Toyota", "Honda", "Ford", "Chevrolet", "Nissan", "Mazda", "Kia", "Hyundai"]
+QUESTIONS = ["¿Qué tasa tiene el Plan Balance Ideal?", "¿Qué documentos necesito para el crédito?",
+             "¿Cuánto tarda la respuesta a un reclamo?", "¿Puedo hacer pagos anticipados?"]
+
+
+def open_page(app, page):
+    """
+    Abre `page` con un rerun completo: con el menú de radio del script único o con
+    `st.navigation` (`AppTest.switch_page`).
+    """
+    if app.sidebar.radio and app.sidebar.radio[0].label == "Navegación":
+        app.sidebar.radio[0].set_value(page)
+    else:
+        app.switch_page(PAGE_FILES[page])
+    app.run()
+
+
+def _button(app, prefix):
+    return next(button for button in app.button if button.label.startswith(prefix))
+
+
+def catalog_search(app, round_number):
+    app.text_input(key="catalog_search_query").input(MAKES[round_number % len(MAKES)])
+
+
+def catalog_page(app, round_number):
+    app.number_input(key="catalog_page").set_value(2)
+
+
+def catalog_types(app, round_number):
+    types = app.multiselect(key="catalog_types")
+    start = round_number % (len(types.options) - 1)
+    types.set_value(types.options[start:start + 2])
+
+
+def catalog_year(app, round_number):
+    app.slider(key="catalog_year").set_value(2019 + round_number % 5)
+
+
+def comparator_search(app, round_number):
+    app.text_input(key="compare_query").input(MAKES[round_number % len(MAKES)])
+
+
+def comparator_add(app, round_number):
+    _button(app, "Agregar al Comparador").click()
+
+
+def assistant_question(app, round_number):
+    app.chat_input[0].set_value(QUESTIONS[round_number % len(QUESTIONS)])
+
+
+def create_alert(app, round_number):
+    _button(app, "Crear Alerta").click()
+    app.run()
+
+
+def alert_deactivate(app, round_number):
+    _button(app, "Desactivar Alerta").click()
+
+
+def simulator_amount(app, round_number):
+    app.slider[0].set_value(20000 + 1000 * round_number)
+
+
+# (página, preparación sin medir al abrir la página, [(interacción, acción, ¿widget en un fragmento?)])
+SCENARIOS = [
+    ("Catálogo de Vehículos", None, [
+        ("Catálogo · buscar marca", catalog_search, True),
+        ("Catálogo · página siguiente", catalog_page, True),
+        ("Catálogo · tipo de vehículo", catalog_types, True),
+        ("Catálogo · año mínimo", catalog_year, True),
+    ]),
+    ("Comparador", None, [
+        ("Comparador · buscar", comparator_search, True),
+        ("Comparador · agregar", comparator_add, True),
+    ]),
+    ("Asistente AI (RAG)", None, [
+        ("Asistente AI · pregunta", assistant_question, True),
+    ]),
+    ("Alertas de Vehículos", create_alert, [
+        ("Alertas · desactivar", alert_deactivate, True),
+    ]),
+    ("Simulador de Crédito", None, [
+        ("Simulador de Crédito · monto", simulator_amount, False),
+    ]),
+]
+
+
+def run_fragments(app, local_script_runner):
+    """
+    Rerun solo de los fragmentos registrados por la última ejecución completa (los de la página
+    abierta), con la misma petición que envía el navegador al usar un widget de un fragmento.
+    """
+    rerun_data = local_script_runner.RerunData
+    local_script_runner.RerunData = functools.partial(
+        rerun_data, fragment_id_queue=list(app._fragment_storage._fragments), is_fragment_scoped_rerun=True)
+    try:
+        app.run()
+    finally:
+        local_script_runner.RerunData = rerun_data
+
+
+def measure_tree(app_dir, mode, repeat):
+    """
+    En el proceso hijo: tiempos (ms) de cada interacción de `SCENARIOS` sobre `app_dir`.
+    `mode` es "script" (reruns completos) o "fragment".
+    """
+    sys.path.insert(0, app_dir)
+    import langchain_google_genai
+    from fake_backends import FakeChatModel, FakeEmbeddings
+    from streamlit import logger
+    from streamlit.testing.v1 import AppTest, app_test, local_script_runner
+
+    langchain_google_genai.ChatGoogleGenerativeAI = lambda **kwargs: FakeChatModel()
+    langchain_google_genai.GoogleGenerativeAIEmbeddings = lambda **kwargs: FakeEmbeddings(dimensions=768)
+    logger.set_log_level("error")
+    script_cache = app_test.ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache
+
+    app = AppTest.from_file(os.path.join(app_dir, "main.py"), default_timeout=300)
+    app.secrets["GOOGLE_API_KEY"] = "fake"
+    app.run()
+    timings, exceptions = {}, 0
+    for round_number in range(repeat + 1):
+        for page, prepare, interactions in SCENARIOS:
+            app.session_state["compare_ids"] = []
+            open_page(app, page)
+            if prepare:
+                prepare(app, round_number)
+            for name, action, in_fragment in interactions:
+                action(app, round_number)
+                start = time.perf_counter()
+                if mode == "fragment" and in_fragment:
+                    run_fragments(app, local_script_runner)
+                else:
+                    app.run()
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                exceptions += len(app.exception)
+                if round_number > 0 and (mode == "script" or in_fragment):
+                    timings.setdefault(name, []).append(elapsed_ms)
+    return dict(timings=timings, exceptions=exceptions)
+
+
+def run_child(app_dir, mode, repeat):
+    with tempfile.TemporaryDirectory() as work_dir:
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", app_dir, mode, "--repeat", str(repeat)],
+                                cwd=work_dir, capture_output=True, text=True, timeout=1800)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "error")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(values):
+    ordered = sorted(values)
+    return dict(p50=statistics.median(ordered), p95=ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))])
+
+
+def export_revision(revision, target_dir):
+    """
+    Extrae el árbol de `revision` en `target_dir`.
+    """
+    archive = subprocess.run(["git", "-C", REPO_DIR, "archive", revision], capture_output=True, check=True).stdout
+    subprocess.run(["tar", "-x", "-C", target_dir], input=archive, check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", help="Revisión de git con todas las páginas en un solo script (p. ej. HEAD~1).")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", help="Ruta del informe JSON.")
+    parser.add_argument("--child", nargs=2, metavar=("APP_DIR", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_tree(*args.child, args.repeat)))
+        return
+
+    columns = {}
+    with tempfile.TemporaryDirectory() as baseline_dir:
+        if args.baseline:
+            export_revision(args.baseline, baseline_dir)
+            columns["script completo"] = run_child(baseline_dir, "script", args.repeat)
+        columns["página"] = run_child(REPO_DIR, "script", args.repeat)
+        columns["fragmento"] = run_child(REPO_DIR, "fragment", args.repeat)
+
+    report = dict(config=dict(baseline=args.baseline, repeat=args.repeat),
+                  exceptions={name: column["exceptions"] for name, column in columns.items()},
+                  interactions={})
+    for _, _, interactions in SCENARIOS:
+        for name, _, _ in interactions:
+            report["interactions"][name] = {column_name: summarize(column["timings"][name])
+                                            for column_name, column in columns.items() if name in column["timings"]}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    header = f"{'interacción':<30}" + "".join(f" | {name + ' p50/p95 (ms)':>30}" for name in columns)
+    print(header)
+    print("-" * len(header))
+    for name, results in report["interactions"].items():
+        cells = [f"{results[column]['p50']:.1f} / {results[column]['p95']:.1f}" if column in results else "—"
+                 for column in columns]
+        print(f"{name:<30}" + "".join(f" | {cell:>30}" for cell in cells))
+    for name, count in report["exceptions"].items():
+        if count:
+            print(f"{name}: {count} reruns con excepción")
+
+
+if __name__ == "__main__":
+    main()
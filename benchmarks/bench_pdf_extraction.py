@@ -0,0 +1,113 @@
+"""
+Benchmark de extracción de texto de PDFs para la ingesta RAG.
+
+Genera un PDF sintético de política de crédito (500 páginas por defecto) y mide, cada versión
+en un proceso nuevo para que el pico de memoria sea comparable:
+
+* "antes": `pdf_file.read()` completo y `text += page.get_text()`, y luego fragmentación del
+  texto entero (sin número de página).
+* "streaming": `iter_pdf_pages` en el proceso actual + `chunk_pages`.
+* "paralelo": `iter_pdf_pages` con un pool de procesos + `chunk_pages`.
+
+Reporta tiempo total, pico de memoria residente por encima de la del proceso ya iniciado (del
+proceso y, en paralelo, el mayor de sus procesos hijos) y número de fragmentos.
+
+Uso:
+    python benchmarks/bench_pdf_extraction.py [--pages 500] [--workers 4]
+"""
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import fitz  # noqa: E402
+from langchain.text_splitter import RecursiveCharacterTextSplitter  # noqa: E402
+from langchain_core.documents import Document  # noqa: E402
+
+from document_ingestion import CHUNK_OVERLAP, CHUNK_SIZE, chunk_pages, iter_pdf_pages  # noqa: E402
+
+CLAUSE = ("Artículo {page}.{n}. El solicitante deberá acreditar ingresos estables durante los últimos "
+          "seis meses. La relación cuota/ingreso no podrá superar el {ratio}% y la cuota inicial mínima "
+          "será del {down}% del valor comercial del vehículo. Los plazos disponibles van de 12 a 84 meses "
+          "según el perfil de riesgo, la antigüedad laboral y el historial crediticio del cliente. ")
+
+
+def build_pdf(path, num_pages):
+    """
+    PDF de `num_pages` páginas con unos 3.000 caracteres de texto cada una.
+    """
+    doc = fitz.open()
+    for page_number in range(1, num_pages + 1):
+        page = doc.new_page()
+        text = "".join(CLAUSE.format(page=page_number, n=n, ratio=30 + n, down=10 + n) for n in range(1, 9))
+        page.insert_textbox(fitz.Rect(40, 40, 555, 800), text, fontsize=8)
+    doc.save(path)
+    doc.close()
+
+
+def legacy_documents(pdf_file, source):
+    doc = fitz.open(stream=pdf_file.read(), filetype="pdf")
+    text = ""
+    for page in doc:
+        text += page.get_text()
+    splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP, length_function=len)
+    return [Document(page_content=chunk, metadata={"source": source}) for chunk in splitter.split_text(text)]
+
+
+def run_mode(mode, path, workers):
+    """
+    Ejecuta una versión en este proceso e imprime sus métricas como JSON.
+    """
+    with open(path, "rb") as pdf:
+        uploaded = io.BytesIO(pdf.read())  # como el UploadedFile de Streamlit
+    with open("/proc/self/statm") as statm:
+        baseline_kb = int(statm.read().split()[1]) * resource.getpagesize() / 1024
+    start = time.perf_counter()
+    if mode == "antes":
+        documents = legacy_documents(uploaded, "politica.pdf")
+    else:
+        pages = iter_pdf_pages(uploaded, workers=1 if mode == "streaming" else workers)
+        documents = list(chunk_pages(pages, "politica.pdf"))
+    elapsed = time.perf_counter() - start
+    peak_kb = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    print(json.dumps({"seconds": elapsed, "peak_mb": (peak_kb - baseline_kb) / 1024, "chunks": len(documents),
+                      "pages": len({d.metadata.get("page") for d in documents} - {None})}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    parser.add_argument("--pdf", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.pdf, args.workers)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "politica_credito.pdf")
+        build_pdf(path, args.pages)
+        print(f"PDF de {args.pages} páginas ({os.path.getsize(path) / 1e6:.1f} MB), {args.workers} procesos en paralelo")
+        print(f"{'versión':<10} | {'tiempo (s)':>10} | {'pico RSS (MB)':>13} | {'fragmentos':>10} | {'con página':>10}")
+        print("-" * 66)
+        for mode in ("antes", "streaming", "paralelo"):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--mode", mode, "--pdf", path, "--workers", str(args.workers)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:<10} | {result['seconds']:10.2f} | {result['peak_mb']:13.1f} | {result['chunks']:>10,} | {result['pages']:>10,}")
+
+
+if __name__ == "__main__":
+    main()
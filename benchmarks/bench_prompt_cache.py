@@ -0,0 +1,94 @@
+"""
+Benchmark de la caché de respuestas de las herramientas de IA (`prompt_cache`).
+
+Reproduce envíos sintéticos del formulario de Valoración de Vehículos Usados de muchos
+usuarios (marcas y modelos populares con distribución de Zipf, años y kilometrajes
+realistas) contra `fake_backends.FakeChatModel` con latencia, a través de `LLMGateway`:
+
+* "sin caché": cada envío llama al LLM.
+* "entradas exactas": caché con las entradas tal cual llegan del formulario.
+* "cuantizada": caché con el kilometraje redondeado a 5.000 km, como la página.
+
+Reporta la tasa de aciertos, las llamadas al LLM y las latencias p50/p95 por envío.
+
+Uso:
+    python benchmarks/bench_prompt_cache.py [--submissions 1000] [--latency 0.1]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_backends import FakeChatModel  # noqa: E402
+from llm_gateway import LLMGateway  # noqa: E402
+from llm_streaming import percentile  # noqa: E402
+from prompt_cache import PromptCache, cached_stream, quantize  # noqa: E402
+
+TOOL = "Valoración de Vehículos Usados (IA)"
+TEMPLATE = """
+Eres un tasador de vehículos para Finanzauto. Estima el precio de mercado en Colombia de:
+- Marca: {make}
+- Modelo: {model}
+- Año: {year}
+- Kilometraje: {mileage:,} km (aproximado)
+- Estado General: {condition}
+"""
+VEHICLES = [("Mazda", "3"), ("Chevrolet", "Onix"), ("Renault", "Logan"), ("Toyota", "Corolla"), ("Kia", "Picanto"),
+            ("Nissan", "Versa"), ("Volkswagen", "Gol"), ("Hyundai", "Tucson"), ("Ford", "Escape"), ("Suzuki", "Swift")]
+CONDITIONS = ["Excelente", "Bueno", "Regular", "Necesita Reparaciones"]
+
+
+def submissions(count, seed=13):
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, len(VEHICLES) + 1)]
+    result = []
+    for _ in range(count):
+        make, model = rng.choices(VEHICLES, weights)[0]
+        year = rng.randint(2015, 2023)
+        # Kilometraje coherente con la edad del vehículo, con el paso de 1.000 km del formulario.
+        mileage = int(rng.gauss((2024 - year) * 15_000, 8_000) // 1000 * 1000)
+        result.append(dict(make=make, model=model, year=year, mileage=max(mileage, 0),
+                           condition=rng.choices(CONDITIONS, [2, 5, 2, 1])[0]))
+    return result
+
+
+def replay(forms, gateway, cache, quantized):
+    timings = []
+    for form in forms:
+        inputs = dict(form, mileage=quantize(form["mileage"], 5000)) if quantized else form
+        start = time.perf_counter()
+        if cache is None:
+            "".join(gateway.stream(TEMPLATE.format(**inputs)))
+        else:
+            "".join(cached_stream(gateway, cache, TOOL, TEMPLATE, inputs)["answer"])
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--submissions", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.1, help="Segundos hasta el primer token.")
+    args = parser.parse_args()
+
+    forms = submissions(args.submissions)
+    print(f"{len(forms)} valoraciones, LLM {args.latency * 1000:.0f} ms hasta el primer token")
+    print(f"{'versión':<17} | {'aciertos':>8} | {'llamadas LLM':>12} | {'p50 (ms)':>9} | {'p95 (ms)':>9} | {'total (s)':>9}")
+    print("-" * 79)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for i, (name, use_cache, quantized) in enumerate((("sin caché", False, False), ("entradas exactas", True, False),
+                                                           ("cuantizada", True, True))):
+            gateway = LLMGateway(FakeChatModel(first_token_latency=args.latency))
+            cache = PromptCache(os.path.join(tmp_dir, f"cache_{i}.db")) if use_cache else None
+            timings = replay(forms, gateway, cache, quantized)
+            hit_rate = f"{cache.stats()[TOOL]['hit_rate']:.0%}" if cache else "-"
+            print(f"{name:<17} | {hit_rate:>8} | {gateway.stats()['calls']:>12} | {percentile(timings, 0.5):9.1f} | "
+                  f"{percentile(timings, 0.95):9.1f} | {sum(timings) / 1000:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
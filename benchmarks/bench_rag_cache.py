@@ -0,0 +1,133 @@
+"""
+Benchmark de la caché de consultas y respuestas del Asistente AI (RAG).
+
+Reproduce un registro sintético de consultas tipo FAQ (distribución de Zipf sobre un conjunto
+de preguntas, con variaciones de mayúsculas, tildes y signos) contra una colección de Chroma en
+memoria, con `fake_backends.FakeEmbeddings` y `fake_backends.FakeChatModel` con latencia. A
+mitad del registro se ingiere un documento nuevo y se incrementa la versión de la colección,
+como hace la página de ingesta.
+
+Compara `answer_query` sin caché y con `RAGCache`, y reporta las latencias p50/p95 por consulta.
+
+Uso:
+    python benchmarks/bench_rag_cache.py [--queries 200] [--llm-latency 0.2]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chromadb  # noqa: E402
+
+from document_ingestion import chunk_pages, embed_and_store  # noqa: E402
+from fake_backends import FakeChatModel, FakeEmbeddings  # noqa: E402
+from llm_gateway import LLMGateway  # noqa: E402
+from rag_pipeline import RAGCache, answer_query  # noqa: E402
+
+QUESTIONS = [
+    "¿Cuál es la tasa de interés para un crédito de vehículo nuevo?",
+    "¿Qué documentos necesito para solicitar un crédito?",
+    "¿Cuál es la cuota inicial mínima?",
+    "¿Puedo hacer pagos extraordinarios sin penalización?",
+    "¿Cuál es el plazo máximo de financiación?",
+    "¿Financian vehículos usados?",
+    "¿Qué pasa si me atraso en una cuota?",
+    "¿Cuánto tarda la aprobación del crédito?",
+    "¿Qué seguro es obligatorio para el vehículo financiado?",
+    "¿Puedo refinanciar mi crédito actual?",
+    "¿Aceptan independientes sin certificado laboral?",
+    "¿Cuál es la relación cuota ingreso máxima?",
+    "¿Ofrecen tasas preferenciales para vehículos eléctricos?",
+    "¿Cómo consulto el saldo de mi crédito?",
+    "¿Puedo vender el vehículo antes de terminar de pagarlo?",
+    "¿Qué comisiones tiene el estudio de crédito?",
+    "¿Se puede financiar el 100% del vehículo?",
+    "¿Cuál es la edad máxima para solicitar un crédito?",
+    "¿Qué historial crediticio necesito?",
+    "¿Cómo cancelo anticipadamente el crédito?",
+]
+TOPICS = ["tasa de interés", "documentos requeridos", "cuota inicial", "pagos extraordinarios", "plazo máximo",
+          "vehículos usados", "mora", "aprobación", "seguro obligatorio", "refinanciación"]
+
+
+def policy_pages(num_pages, label="política"):
+    pages = []
+    for page in range(1, num_pages + 1):
+        topic = TOPICS[page % len(TOPICS)]
+        text = (f"Sección {page} de la {label}: {topic}. La {topic} depende del perfil de riesgo, del plazo entre 12 "
+                f"y 84 meses, de la cuota inicial y del historial crediticio del solicitante. " * 4)
+        pages.append((page, text))
+    return pages
+
+
+def query_log(num_queries, seed=11):
+    """
+    Consultas con popularidad de Zipf y variaciones de forma (mismo significado).
+    """
+    rng = random.Random(seed)
+    weights = [1 / rank ** 1.1 for rank in range(1, len(QUESTIONS) + 1)]
+    variants = [
+        lambda q: q,
+        lambda q: q.lower(),
+        lambda q: q.strip("¿?"),
+        lambda q: q.replace("á", "a").replace("é", "e").replace("í", "i").replace("ó", "o").replace("ú", "u"),
+        lambda q: "  " + q.upper() + " ",
+    ]
+    return [rng.choice(variants)(rng.choices(QUESTIONS, weights)[0]) for _ in range(num_queries)]
+
+
+def replay(queries, collection, embeddings, llm, cache):
+    """
+    Ejecuta el registro y devuelve las latencias en ms. A mitad del registro se ingiere un
+    documento nuevo y cambia la versión de la colección.
+    """
+    timings = []
+    collection_version = 1
+    for i, query in enumerate(queries):
+        if i == len(queries) // 2:
+            embed_and_store(list(chunk_pages(policy_pages(10, "circular"), "circular.pdf")), FakeEmbeddings(), collection)
+            collection_version += 1
+        start = time.perf_counter()
+        answer_query(query, embeddings, collection, llm, collection_version, cache=cache)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--embedding-latency", type=float, default=0.05)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    queries = query_log(args.queries)
+    embeddings = FakeEmbeddings(latency=args.embedding_latency)
+    llm = LLMGateway(FakeChatModel(first_token_latency=args.llm_latency))
+    client = chromadb.EphemeralClient()
+
+    print(f"{len(queries)} consultas ({len(set(queries))} textos distintos, {len(QUESTIONS)} preguntas), "
+          f"embedding {args.embedding_latency * 1000:.0f} ms, LLM {args.llm_latency * 1000:.0f} ms")
+    print(f"{'versión':<10} | {'p50 (ms)':>9} | {'p95 (ms)':>9} | {'media (ms)':>10} | {'aciertos embedding':>18} | {'aciertos respuesta':>18}")
+    print("-" * 89)
+    for i, (name, cache) in enumerate((("sin caché", None), ("con caché", RAGCache()))):
+        collection = client.create_collection(f"faq_{i}")
+        embed_and_store(list(chunk_pages(policy_pages(60), "politica.pdf")), FakeEmbeddings(), collection)
+        timings = replay(queries, collection, embeddings, llm, cache)
+        stats = cache.stats() if cache else None
+        embedding_hits = f"{stats['query_embeddings']['hit_rate']:.0%}" if stats else "-"
+        answer_hits = f"{stats['answers']['hit_rate']:.0%}" if stats else "-"
+        print(f"{name:<10} | {percentile(timings, 0.5):9.1f} | {percentile(timings, 0.95):9.1f} | "
+              f"{statistics.mean(timings):10.1f} | {embedding_hits:>18} | {answer_hits:>18}")
+
+
+if __name__ == "__main__":
+    main()
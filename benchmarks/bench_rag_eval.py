@@ -0,0 +1,233 @@
+"""
+Evaluación offline de la recuperación del Asistente AI (ver `RAG_EVALUATION_STRATEGIES.md`).
+
+Ingiere el corpus fijo de `benchmarks/rag_eval/corpus/` por el mismo camino que
+`process_and_save_document` de la aplicación (`iter_document_pages`, `chunk_pages` como en
+`get_text_chunks`, `sync_document` con el índice léxico y la versión de la colección) en una
+base Chroma temporal, con `fake_backends.FakeEmbeddings` (deterministas, sin red) detrás de
+la caché de embeddings, y lanza las preguntas etiquetadas de `benchmarks/rag_eval/queries.jsonl`.
+
+Un fragmento es relevante para una pregunta si viene del `source` de alguna de sus etiquetas
+y contiene su texto `contains` (sin distinguir mayúsculas ni espacios), así que las etiquetas
+no dependen del tamaño de los fragmentos. Para cada modo se mide:
+
+* Hit Rate@k: preguntas con al menos un fragmento relevante entre los recuperados.
+* MRR@k: media de 1 / posición del primer fragmento relevante.
+* Precisión del contexto: proporción de fragmentos recuperados que son relevantes.
+* Latencias p50/p95/p99 (ms) de cada consulta.
+
+Modos:
+"similarity_search": `Chroma.similarity_search` (solo vectorial, top-k).
+"get_rag_response": `rag_pipeline.answer_query` en streaming como en `get_rag_response`
+(híbrida, empaquetado del contexto y respuesta de `fake_backends.FakeChatModel` a través del
+`LLMGateway`), sin cachés; la latencia llega hasta el último fragmento de la respuesta y se
+evalúan los fragmentos que entraron en el prompt.
+
+El informe completo (configuración, métricas y la posición del primer fragmento relevante
+por pregunta) se escribe en JSON con `--output`. Con `--min-hit-rate`, `--min-mrr` o
+`--max-p95-ms` el script termina con código 1 si algún modo no cumple, para usarlo como
+control antes de aceptar un cambio en la recuperación.
+
+Uso:
+    python benchmarks/bench_rag_eval.py [--k 3] [--repeat 3] [--output rag_eval_report.json]
+        [--min-hit-rate 0.8] [--min-mrr 0.6] [--max-p95-ms 500]
+"""
+import argparse
+import json
+import mimetypes
+import os
+import platform
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from langchain_community.vectorstores import Chroma  # noqa: E402
+
+from document_ingestion import (  # noqa: E402
+    CHUNK_OVERLAP, CHUNK_SIZE, CollectionVersion, chunk_pages, document_fingerprint, is_document_current,
+    iter_document_pages, sync_document
+)
+from embedding_cache import CachedEmbeddings, EmbeddingCache  # noqa: E402
+from fake_backends import FakeChatModel, FakeEmbeddings  # noqa: E402
+from lexical_index import LexicalIndex  # noqa: E402
+from llm_gateway import LLMGateway  # noqa: E402
+from llm_streaming import percentile  # noqa: E402
+from rag_pipeline import DEFAULT_K, answer_query  # noqa: E402
+
+EVAL_DIR = os.path.join(REPO_DIR, "benchmarks", "rag_eval")
+CORPUS_DIR = os.path.join(EVAL_DIR, "corpus")
+QUERIES_PATH = os.path.join(EVAL_DIR, "queries.jsonl")
+EMBEDDING_DIMENSIONS = 768  # como models/embedding-001
+
+
+class CorpusFile:
+    """
+    Archivo del corpus con la interfaz que usa la ingesta de un `UploadedFile` de Streamlit.
+    """
+
+    def __init__(self, path):
+        self.name = os.path.basename(path)
+        self.type = mimetypes.guess_type(path)[0] or ("text/markdown" if path.endswith(".md") else "text/plain")
+        with open(path, "rb") as f:
+            self._data = f.read()
+
+    def getvalue(self):
+        return self._data
+
+
+def load_queries(path=QUERIES_PATH):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def ingest_corpus(corpus_dir, vector_store, lexical_index, versions):
+    """
+    Ingiere cada archivo del corpus como `process_and_save_document`. Devuelve el número de
+    fragmentos por archivo.
+    """
+    chunks = {}
+    for file_name in sorted(os.listdir(corpus_dir)):
+        uploaded_file = CorpusFile(os.path.join(corpus_dir, file_name))
+        fingerprint = document_fingerprint(uploaded_file.getvalue())
+        if is_document_current(vector_store._collection, uploaded_file.name, fingerprint):
+            continue
+        documents = list(chunk_pages(iter_document_pages(uploaded_file), uploaded_file.name))
+        stats = sync_document(documents, uploaded_file.name, fingerprint, vector_store.embeddings, vector_store._collection,
+                              lexical_index=lexical_index)
+        if stats["failed"]:
+            raise RuntimeError(f"No se pudo ingerir {uploaded_file.name}: {stats['errors'][-1]}")
+        versions.bump(vector_store._collection.name)
+        chunks[uploaded_file.name] = len(documents)
+    return chunks
+
+
+def _normalize(text):
+    return " ".join(text.lower().split())
+
+
+def is_relevant(document, labels):
+    text = _normalize(document.page_content)
+    source = document.metadata.get("source")
+    return any(source == label["source"] and _normalize(label["contains"]) in text for label in labels)
+
+
+def evaluate(search, queries, k, repeat):
+    """
+    Métricas de `search(pregunta) -> documentos` sobre `queries`. La primera ejecución de cada
+    pregunta da las métricas de calidad; todas cuentan para las latencias.
+    """
+    per_query, timings = [], []
+    for query in queries:
+        for attempt in range(repeat):
+            start = time.perf_counter()
+            documents = search(query["query"])[:k]
+            timings.append((time.perf_counter() - start) * 1000)
+            if attempt == 0:
+                relevant = [is_relevant(doc, query["relevant"]) for doc in documents]
+                rank = relevant.index(True) + 1 if any(relevant) else None
+                per_query.append(dict(id=query["id"], first_relevant_rank=rank, retrieved=len(documents),
+                                      relevant=sum(relevant)))
+    retrieved = sum(result["retrieved"] for result in per_query)
+    return dict(
+        hit_rate=sum(result["first_relevant_rank"] is not None for result in per_query) / len(per_query),
+        mrr=sum(1 / result["first_relevant_rank"] for result in per_query if result["first_relevant_rank"]) / len(per_query),
+        context_precision=sum(result["relevant"] for result in per_query) / retrieved if retrieved else 0.0,
+        latency_ms=dict(p50=percentile(timings, 0.5), p95=percentile(timings, 0.95), p99=percentile(timings, 0.99)),
+        queries=per_query,
+    )
+
+
+def rag_response_documents(vector_store, lexical_index, gateway, collection_version):
+    def search(user_query):
+        result = answer_query(user_query, vector_store.embeddings, vector_store._collection, gateway, collection_version,
+                              stream=True, lexical_index=lexical_index)
+        for _ in result["answer"]:
+            pass
+        return result["documents"]
+    return search
+
+
+def check_gates(report, args):
+    failures = []
+    for mode, metrics in report["modes"].items():
+        if args.min_hit_rate is not None and metrics["hit_rate"] < args.min_hit_rate:
+            failures.append(f"{mode}: Hit Rate@{args.k} {metrics['hit_rate']:.2f} < {args.min_hit_rate:.2f}")
+        if args.min_mrr is not None and metrics["mrr"] < args.min_mrr:
+            failures.append(f"{mode}: MRR@{args.k} {metrics['mrr']:.2f} < {args.min_mrr:.2f}")
+        if args.max_p95_ms is not None and metrics["latency_ms"]["p95"] > args.max_p95_ms:
+            failures.append(f"{mode}: p95 {metrics['latency_ms']['p95']:.1f} ms > {args.max_p95_ms:.1f} ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--k", type=int, default=DEFAULT_K)
+    parser.add_argument("--repeat", type=int, default=3, help="Ejecuciones de cada pregunta para las latencias.")
+    parser.add_argument("--embedding-latency", type=float, default=0.0, help="Latencia simulada del servicio de embeddings (s).")
+    parser.add_argument("--llm-first-token-latency", type=float, default=0.0)
+    parser.add_argument("--llm-token-latency", type=float, default=0.0)
+    parser.add_argument("--output", help="Ruta del informe JSON.")
+    parser.add_argument("--min-hit-rate", type=float)
+    parser.add_argument("--min-mrr", type=float)
+    parser.add_argument("--max-p95-ms", type=float)
+    args = parser.parse_args()
+
+    queries = load_queries()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        embeddings = CachedEmbeddings(
+            FakeEmbeddings(dimensions=EMBEDDING_DIMENSIONS, latency=args.embedding_latency),
+            EmbeddingCache(os.path.join(tmp_dir, "embedding_cache.db")),
+        )
+        vector_store = Chroma(persist_directory=os.path.join(tmp_dir, "chroma_db"), embedding_function=embeddings)
+        lexical_index = LexicalIndex(os.path.join(tmp_dir, "chroma_db", "lexical_index.db"))
+        versions = CollectionVersion(os.path.join(tmp_dir, "chroma_db", "collection_version.db"))
+        gateway = LLMGateway(FakeChatModel(first_token_latency=args.llm_first_token_latency,
+                                           token_latency=args.llm_token_latency))
+
+        start = time.perf_counter()
+        chunks = ingest_corpus(CORPUS_DIR, vector_store, lexical_index, versions)
+        ingest_seconds = time.perf_counter() - start
+        collection_version = versions.get(vector_store._collection.name)
+
+        modes = {
+            "similarity_search": lambda q: vector_store.similarity_search(q, k=args.k),
+            "get_rag_response": rag_response_documents(vector_store, lexical_index, gateway, collection_version),
+        }
+        report = dict(
+            config=dict(k=args.k, repeat=args.repeat, chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP,
+                        embeddings=f"FakeEmbeddings({EMBEDDING_DIMENSIONS})", embedding_latency=args.embedding_latency,
+                        llm_first_token_latency=args.llm_first_token_latency, llm_token_latency=args.llm_token_latency,
+                        python=platform.python_version()),
+            corpus=dict(documents=len(chunks), chunks=sum(chunks.values()), chunks_per_document=chunks,
+                        queries=len(queries), ingest_seconds=ingest_seconds),
+            modes={name: evaluate(search, queries, args.k, args.repeat) for name, search in modes.items()},
+        )
+
+    report["failures"] = check_gates(report, args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    corpus = report["corpus"]
+    print(f"{corpus['documents']} documentos, {corpus['chunks']} fragmentos (ingesta {corpus['ingest_seconds']:.2f} s), "
+          f"{corpus['queries']} preguntas, k={args.k}")
+    print(f"{'modo':<18} | {'Hit Rate':>8} | {'MRR':>5} | {'precisión':>9} | {'p50 (ms)':>8} | {'p95 (ms)':>8} | {'p99 (ms)':>8}")
+    print("-" * 83)
+    for name, metrics in report["modes"].items():
+        latency = metrics["latency_ms"]
+        print(f"{name:<18} | {metrics['hit_rate']:8.0%} | {metrics['mrr']:5.2f} | {metrics['context_precision']:9.0%} | "
+              f"{latency['p50']:8.1f} | {latency['p95']:8.1f} | {latency['p99']:8.1f}")
+    missed = sorted({result["id"] for metrics in report["modes"].values() for result in metrics["queries"]
+                     if result["first_relevant_rank"] is None})
+    if missed:
+        print(f"Sin fragmento relevante en algún modo: {', '.join(missed)}")
+    for failure in report["failures"]:
+        print(f"NO CUMPLE {failure}")
+    sys.exit(1 if report["failures"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark de reingesta idempotente de documentos.
+
+Sube varias veces el mismo documento sintético de política de crédito a una colección de
+Chroma en memoria (embeddings de `fake_backends.FakeEmbeddings`) y luego una versión con el
+10% de las páginas editadas:
+
+* "antes": cada subida agrega todos los fragmentos con ids aleatorios (`embed_and_store`).
+* "después": `is_document_current` + `sync_document` (huella del documento y diff por
+  fragmento).
+
+Reporta, tras cada subida, el tiempo, el tamaño de la colección, la latencia de una búsqueda
+por similitud y cuántos de los k resultados son duplicados.
+
+Antes comprueba que una primera ingesta con un lote fallido no deja el documento como "sin
+cambios": la siguiente subida del mismo archivo debe completar la colección. Si no, termina con
+error.
+
+Uso:
+    python benchmarks/bench_reingestion.py [--pages 200] [--uploads 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chromadb  # noqa: E402
+
+from document_ingestion import (  # noqa: E402
+    chunk_pages, document_fingerprint, embed_and_store, is_document_current, sync_document
+)
+from fake_backends import FakeEmbeddings  # noqa: E402
+
+CLAUSE = ("Artículo {page}.{n}. La relación cuota/ingreso no podrá superar el {ratio}% y la cuota inicial "
+          "mínima será del {down}% del valor comercial del vehículo, con plazos de 12 a 84 meses según el "
+          "perfil de riesgo y el historial crediticio del solicitante. ")
+QUERY = "¿Cuál es la cuota inicial mínima del vehículo?"
+K = 3
+
+
+def document_pages(num_pages, edited_fraction=0.0, seed=3):
+    rng = random.Random(seed)
+    edited = set(rng.sample(range(1, num_pages + 1), int(num_pages * edited_fraction)))
+    pages = []
+    for page in range(1, num_pages + 1):
+        text = "".join(CLAUSE.format(page=page, n=n, ratio=30 + n, down=10 + n) for n in range(1, 12))
+        if page in edited:
+            text = text.replace("12 a 84 meses", "12 a 72 meses")
+        pages.append((page, text))
+    return pages
+
+
+class FlakyEmbeddings(FakeEmbeddings):
+    """
+    `FakeEmbeddings` cuyas primeras `failing_calls` llamadas a `embed_documents` fallan.
+    """
+
+    def __init__(self, failing_calls=1, **kwargs):
+        super().__init__(**kwargs)
+        self.failing_calls = failing_calls
+
+    def embed_documents(self, texts):
+        with self._lock:
+            fail = self.failing_calls > 0
+            self.failing_calls -= fail
+        if fail:
+            raise ConnectionError("Fallo simulado de un lote de embeddings.")
+        return super().embed_documents(texts)
+
+
+def check_failed_batch(client, pages, source):
+    """
+    Primera ingesta con un lote fallido (sin reintentos) y nueva subida del mismo archivo: la
+    segunda debe procesarse y dejar todos los fragmentos con la huella.
+    """
+    collection = client.create_collection("reingesta_lote_fallido")
+    fingerprint = document_fingerprint("\n".join(text for _, text in pages).encode("utf-8"))
+    documents = list(chunk_pages(pages, source))
+    stats = sync_document(documents, source, fingerprint, FlakyEmbeddings(), collection, max_retries=0, backoff=0)
+    assert stats["failed"] and stats["stored"], "la primera ingesta debía guardar unos lotes y fallar otro"
+    assert not is_document_current(collection, source, fingerprint), "un documento a medio ingerir se da por actualizado"
+    pending = stats["failed"]
+    stats = sync_document(documents, source, fingerprint, FakeEmbeddings(), collection)
+    assert not stats["failed"] and collection.count() == len(documents), "la nueva subida no completó la colección"
+    assert is_document_current(collection, source, fingerprint), "tras completar la ingesta el documento no está al día"
+    print(f"Lote fallido en la primera ingesta: {pending} fragmentos pendientes, "
+          f"completados en la nueva subida ({collection.count():,} en la colección).")
+
+
+def search(collection, embeddings):
+    start = time.perf_counter()
+    result = collection.query(query_embeddings=[embeddings.embed_query(QUERY)], n_results=K)
+    elapsed = (time.perf_counter() - start) * 1000
+    documents = result["documents"][0]
+    return elapsed, len(documents) - len(set(documents))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--uploads", type=int, default=5)
+    parser.add_argument("--edited", type=float, default=0.1)
+    args = parser.parse_args()
+
+    source = "politica.pdf"
+    uploads = [("misma versión", document_pages(args.pages))] * args.uploads
+    uploads.append((f"{args.edited:.0%} editado", document_pages(args.pages, args.edited)))
+    embeddings = FakeEmbeddings()
+    client = chromadb.EphemeralClient()
+    check_failed_batch(client, document_pages(args.pages), source)
+
+    print(f"Documento de {args.pages} páginas, {args.uploads} subidas iguales y una editada")
+    print(f"{'versión':<8} | {'subida':<14} | {'tiempo (s)':>10} | {'colección':>9} | {'búsqueda (ms)':>13} | {'duplicados top-' + str(K):>15}")
+    print("-" * 86)
+    for i, mode in enumerate(("antes", "después")):
+        collection = client.create_collection(f"reingesta_{i}")
+        for name, pages in uploads:
+            data = "\n".join(text for _, text in pages).encode("utf-8")  # contenido del archivo subido
+            start = time.perf_counter()
+            if mode == "antes":
+                embed_and_store(list(chunk_pages(pages, source)), embeddings, collection)
+            else:
+                fingerprint = document_fingerprint(data)
+                if not is_document_current(collection, source, fingerprint):
+                    sync_document(list(chunk_pages(pages, source)), source, fingerprint, embeddings, collection)
+            elapsed = time.perf_counter() - start
+            search_ms, duplicates = search(collection, embeddings)
+            print(f"{mode:<8} | {name:<14} | {elapsed:10.2f} | {collection.count():>9,} | {search_ms:13.1f} | {duplicates:>15}")
+
+
+if __name__ == "__main__":
+    main()
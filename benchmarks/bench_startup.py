@@ -0,0 +1,131 @@
+"""
+Benchmark del arranque en frío de la aplicación.
+
+Cada medición se hace en un proceso de Python nuevo y en un directorio de trabajo vacío (sin
+catálogo ni base vectorial en disco), como una réplica recién desplegada:
+
+* "importación": tiempo de ejecutar las sentencias `import` de nivel superior de `main.py`
+  (con los módulos reales).
+* "primer render": tiempo hasta terminar la primera ejecución del script con
+  `streamlit.testing.v1.AppTest`, que abre el Dashboard. Incluye las importaciones y todo lo
+  que el script inicializa antes de dibujar la página. Los clientes de Gemini se importan de
+  verdad, pero sus clases se sustituyen por `fake_backends` al cargarse el módulo, así que no
+  se usa la red.
+* "rerun": una segunda ejecución del Dashboard en la misma sesión. `AppTest` vuelve a compilar
+  el script en cada ejecución (el servidor guarda el bytecode), así que este tiempo crece con
+  el tamaño de `main.py` más que con lo que hace la página.
+* Memoria residente del proceso tras el primer render.
+
+Con `--baseline REV` se mide también el árbol de esa revisión de git (por ejemplo, la anterior
+a un cambio) y se comparan. Se informa la mediana de `--repeat` procesos.
+
+Uso:
+    python benchmarks/bench_startup.py [--baseline HEAD~1] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_CHILD = """
+import ast, sys, time
+app_dir = sys.argv[1]
+sys.path.insert(0, app_dir)
+with open(f"{app_dir}/main.py", encoding="utf-8") as f:
+    tree = ast.parse(f.read())
+imports = ast.Module(body=[node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))], type_ignores=[])
+code = compile(imports, "main.py", "exec")
+start = time.perf_counter()
+exec(code, {})
+print(f'{{"import_ms": {(time.perf_counter() - start) * 1000}}}')
+"""
+
+RENDER_CHILD = """
+import importlib.abc, importlib.machinery, json, os, sys, time
+app_dir = sys.argv[1]
+sys.path.insert(0, app_dir)
+
+class PatchGemini(importlib.abc.MetaPathFinder):
+    # Importa el langchain_google_genai real y, al terminar de cargarlo, cambia sus clientes por los locales.
+    def find_spec(self, name, path, target=None):
+        if name != "langchain_google_genai":
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(name, path)
+        exec_module = spec.loader.exec_module
+        def patched(module):
+            exec_module(module)
+            from fake_backends import FakeChatModel, FakeEmbeddings
+            module.ChatGoogleGenerativeAI = lambda **kwargs: FakeChatModel()
+            module.GoogleGenerativeAIEmbeddings = lambda **kwargs: FakeEmbeddings(dimensions=768)
+        spec.loader.exec_module = patched
+        return spec
+
+sys.meta_path.insert(0, PatchGemini())
+from streamlit import logger
+logger.set_log_level("error")
+from streamlit.testing.v1 import AppTest
+
+start = time.perf_counter()
+app = AppTest.from_file(f"{app_dir}/main.py", default_timeout=300)
+app.secrets["GOOGLE_API_KEY"] = "fake"
+app.run()
+first_render_ms = (time.perf_counter() - start) * 1000
+assert not app.exception, app.exception
+assert app.header[0].value.endswith("Dashboard del Usuario"), [header.value for header in app.header]
+start = time.perf_counter()
+app.run()
+rerun_ms = (time.perf_counter() - start) * 1000
+with open("/proc/self/statm") as f:
+    rss_mb = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+print(json.dumps(dict(first_render_ms=first_render_ms, rerun_ms=rerun_ms, rss_mb=rss_mb)))
+"""
+
+
+def run_child(code, app_dir):
+    with tempfile.TemporaryDirectory() as work_dir:
+        result = subprocess.run([sys.executable, "-c", code, app_dir], cwd=work_dir, capture_output=True, text=True,
+                                timeout=600)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "error")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(app_dir, repeat):
+    samples = [dict(run_child(IMPORT_CHILD, app_dir), **run_child(RENDER_CHILD, app_dir)) for _ in range(repeat)]
+    return {name: statistics.median(sample[name] for sample in samples) for name in samples[0]}
+
+
+def export_revision(revision, target_dir):
+    """
+    Extrae el árbol de `revision` en `target_dir`.
+    """
+    archive = subprocess.run(["git", "-C", REPO_DIR, "archive", revision], capture_output=True, check=True).stdout
+    subprocess.run(["tar", "-x", "-C", target_dir], input=archive, check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", help="Revisión de git con la que comparar (p. ej. HEAD~1).")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'versión':<22} | {'importación (ms)':>16} | {'primer render (ms)':>18} | {'rerun (ms)':>10} | {'RSS (MB)':>8}")
+    print("-" * 88)
+    with tempfile.TemporaryDirectory() as baseline_dir:
+        versions = [("árbol actual", REPO_DIR)]
+        if args.baseline:
+            export_revision(args.baseline, baseline_dir)
+            versions.insert(0, (args.baseline, baseline_dir))
+        for name, app_dir in versions:
+            result = measure(app_dir, args.repeat)
+            print(f"{name:<22} | {result['import_ms']:16.0f} | {result['first_render_ms']:18.0f} | "
+                  f"{result['rerun_ms']:10.0f} | {result['rss_mb']:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
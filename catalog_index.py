@@ -0,0 +1,295 @@
+"""
+Índices secundarios del catálogo de vehículos.
+
+`CatalogIndex` se construye una sola vez por versión del catálogo (`VehicleTable.version`)
+y permite resolver los filtros de la página del catálogo sin recorrer todas las filas:
+
+* Precio y año: arreglos ordenados con búsqueda binaria para consultas por rango.
+* Tipo, combustible, marca y modelo: listas de publicación (posting lists) por código.
+* Texto libre sobre marca/modelo: índice de trigramas sobre el vocabulario de marcas y modelos.
+* Selector del Comparador: índice de prefijos sobre "marca modelo año" (`VehicleTypeahead`).
+* Facetas: valores distintos por columna y conteos de resultados bajo los filtros actuales.
+
+Cada filtro aporta un conjunto de filas candidatas; se materializa el más selectivo y los
+demás se verifican solo sobre esos candidatos. Si incluso el filtro más selectivo deja pasar
+una fracción grande del catálogo, es más barato evaluar las máscaras columnares completas.
+"""
+import bisect
+
+import numpy as np
+
+from vehicle_catalog import CATEGORIES, MAKES, MODELS_BY_MAKE
+
+# Código de marca de cada código de modelo (cada modelo pertenece a una sola marca).
+MODEL_MAKE = np.repeat(np.arange(len(MAKES)), [len(MODELS_BY_MAKE[make]) for make in MAKES])
+
+
+def trigrams(text):
+    """
+    Devuelve el conjunto de trigramas (en minúsculas) de un texto.
+    """
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """
+    Índice de trigramas sobre una lista de cadenas (el vocabulario de una columna categórica).
+    Devuelve los códigos de las cadenas que contienen una subcadena dada.
+    """
+
+    def __init__(self, values):
+        self.values = [value.lower() for value in values]
+        self.postings = {}
+        for code, value in enumerate(self.values):
+            for gram in trigrams(value):
+                self.postings.setdefault(gram, set()).add(code)
+
+    def search(self, query):
+        """
+        Códigos de las cadenas que contienen `query` (sin distinguir mayúsculas).
+        """
+        query = query.lower()
+        if len(query) < 3:
+            candidates = range(len(self.values))
+        else:
+            grams = sorted(trigrams(query), key=lambda gram: len(self.postings.get(gram, ())))
+            candidates = set(self.postings.get(grams[0], ()))
+            for gram in grams[1:]:
+                candidates &= self.postings.get(gram, set())
+                if not candidates:
+                    break
+        # Los trigramas solo descartan; la coincidencia final se verifica sobre la cadena.
+        return sorted(code for code in candidates if query in self.values[code])
+
+
+class VehicleTypeahead:
+    """
+    Índice de prefijos para elegir vehículos escribiendo ("toy", "corolla 20", "4521").
+
+    Las filas se agrupan por combinación (marca, modelo, año); cada combinación se indexa
+    con las claves "marca modelo año" y "modelo año" en una lista ordenada, de modo que un
+    prefijo se resuelve con dos búsquedas binarias. Las consultas numéricas se resuelven
+    como id de vehículo.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        cols = table.columns
+        # Clave entera única por (marca, modelo, año) para agrupar con un `np.unique` 1D.
+        year_min = int(cols["year"].min()) if len(table) else 0
+        year_span = int(cols["year"].max()) - year_min + 1 if len(table) else 1
+        keys = (cols["make"].astype(np.int64) * len(CATEGORIES["model"]) + cols["model"]) * year_span + (cols["year"] - year_min)
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        combos = np.stack([
+            unique_keys // year_span // len(CATEGORIES["model"]),
+            unique_keys // year_span % len(CATEGORIES["model"]),
+            unique_keys % year_span + year_min,
+        ], axis=1)
+        order = np.argsort(inverse, kind="stable").astype(np.int32)
+        bounds = np.searchsorted(inverse[order], np.arange(len(combos) + 1))
+        self.combo_rows = [order[bounds[i]:bounds[i + 1]] for i in range(len(combos))]
+
+        entries = []
+        for combo, (make, model, year) in enumerate(combos):
+            make_name, model_name = CATEGORIES["make"][make].lower(), CATEGORIES["model"][model].lower()
+            entries.append((f"{make_name} {model_name} {year}", combo))
+            entries.append((f"{model_name} {year}", combo))
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.combos = [combo for _, combo in entries]
+
+    def search(self, query, limit=20):
+        """
+        Hasta `limit` filas cuyo "marca modelo año" o "modelo año" empieza por `query`.
+        """
+        query = " ".join(query.lower().split())
+        if not query:
+            return []
+        if query.isdigit():
+            index = self.table.row_index(int(query))
+            return [] if index is None else [index]
+
+        lo = bisect.bisect_left(self.keys, query)
+        hi = bisect.bisect_right(self.keys, query + "\uffff")
+        results, seen = [], set()
+        for combo in self.combos[lo:hi]:
+            if combo in seen:
+                continue
+            seen.add(combo)
+            results.extend(self.combo_rows[combo][:limit - len(results)].tolist())
+            if len(results) >= limit:
+                break
+        return results
+
+
+class CatalogIndex:
+    """
+    Capa de índices sobre una `VehicleTable`. Ver el docstring del módulo.
+    """
+
+    POSTING_COLUMNS = ("make", "model", "type", "fuel")
+    # Facetas de la interfaz y el argumento de `filter` que las restringe.
+    FACET_FILTERS = {"make": None, "type": "types", "fuel": "fuels"}
+    # Por encima de esta fracción de filas candidatas se usan las máscaras de `VehicleTable`.
+    DENSE_FRACTION = 0.05
+
+    def __init__(self, table):
+        self.table = table
+        self.version = table.version
+        cols = table.columns
+
+        # Las permutaciones se guardan como int32 para reducir la memoria propia de cada proceso.
+        self.price_order = np.argsort(cols["price"], kind="stable").astype(np.int32)
+        self.sorted_price = cols["price"][self.price_order]
+        self.year_order = np.argsort(cols["year"], kind="stable").astype(np.int32)
+        self.sorted_year = cols["year"][self.year_order]
+
+        self.postings = {column: self._build_postings(cols[column], len(CATEGORIES[column]))
+                         for column in self.POSTING_COLUMNS}
+        self.text_indexes = {column: TrigramIndex(CATEGORIES[column]) for column in ("make", "model")}
+        self.typeahead = VehicleTypeahead(table)
+
+    @staticmethod
+    def _build_postings(codes, num_categories):
+        """
+        Lista de filas (ordenadas) por cada código de una columna categórica.
+        """
+        order = np.argsort(codes, kind="stable").astype(np.int32)
+        bounds = np.searchsorted(codes[order], np.arange(num_categories + 1))
+        return [order[bounds[code]:bounds[code + 1]] for code in range(num_categories)]
+
+    # --- Facetas ---
+
+    def facet_values(self, column):
+        """
+        Valores distintos presentes en el catálogo para la faceta `column`, en orden alfabético.
+        """
+        categories = CATEGORIES[column]
+        return sorted(categories[code] for code, rows in enumerate(self.postings[column]) if len(rows))
+
+    def facet_counts(self, column, **filters):
+        """
+        Número de vehículos por valor de la faceta `column` bajo los filtros dados.
+        El filtro de la propia faceta se ignora, de modo que los conteos indican cuántos
+        resultados habría al marcar cada opción.
+        """
+        own_filter = self.FACET_FILTERS.get(column)
+        filters = {name: value for name, value in filters.items() if name != own_filter}
+        categories = CATEGORIES[column]
+        if any(filters.values()):
+            counts = np.bincount(self.table.columns[column][self.filter(**filters)], minlength=len(categories))
+        else:
+            counts = [len(rows) for rows in self.postings[column]]
+        return {categories[code]: int(count) for code, count in enumerate(counts)}
+
+    # --- Consultas por rango (búsqueda binaria) ---
+
+    def price_range(self, min_price=None, max_price=None):
+        """
+        Filas con precio en [min_price, max_price], en orden de precio.
+        """
+        lo = 0 if min_price is None else np.searchsorted(self.sorted_price, min_price, side="left")
+        hi = len(self.sorted_price) if max_price is None else np.searchsorted(self.sorted_price, max_price, side="right")
+        return self.price_order[lo:max(lo, hi)]
+
+    def year_range(self, min_year=None, max_year=None):
+        """
+        Filas con año en [min_year, max_year], en orden de año.
+        """
+        lo = 0 if min_year is None else np.searchsorted(self.sorted_year, min_year, side="left")
+        hi = len(self.sorted_year) if max_year is None else np.searchsorted(self.sorted_year, max_year, side="right")
+        return self.year_order[lo:max(lo, hi)]
+
+    # --- Listas de publicación ---
+
+    def posting(self, column, values):
+        """
+        Filas cuya columna categórica toma alguno de los `values`.
+        """
+        categories = CATEGORIES[column]
+        lists = [self.postings[column][categories.index(value)] for value in values]
+        return np.concatenate(lists) if lists else np.empty(0, dtype=np.int32)
+
+    def text_codes(self, search_query):
+        """
+        Códigos de marca y de modelo que contienen `search_query`.
+        """
+        return {column: self.text_indexes[column].search(search_query) for column in ("make", "model")}
+
+    # --- Resolución de filtros ---
+
+    def _predicates(self, search_query, min_price, max_price, types, fuels, min_year):
+        """
+        Devuelve, por cada filtro activo, (número exacto de filas, candidatos perezosos, verificación sobre filas).
+        """
+        cols = self.table.columns
+        predicates = []
+
+        if search_query:
+            codes = self.text_codes(search_query)
+            make_hits = np.zeros(len(CATEGORIES["make"]), dtype=bool)
+            make_hits[codes["make"]] = True
+            model_hits = np.zeros(len(CATEGORIES["model"]), dtype=bool)
+            model_hits[codes["model"]] = True
+            # Las filas de un modelo están contenidas en las de su marca: la unión son las filas de las
+            # marcas encontradas más las de los modelos encontrados de otras marcas, sin solaparse.
+            lists = [self.postings["make"][c] for c in codes["make"]] + \
+                [self.postings["model"][c] for c in codes["model"] if not make_hits[MODEL_MAKE[c]]]
+            predicates.append((
+                sum(len(rows) for rows in lists),
+                lambda lists=lists: np.concatenate(lists) if lists else np.empty(0, dtype=np.int32),
+                lambda rows: make_hits[cols["make"][rows]] | model_hits[cols["model"][rows]],
+            ))
+
+        if min_price is not None or max_price is not None:
+            low = -np.inf if min_price is None else min_price
+            high = np.inf if max_price is None else max_price
+            predicates.append((
+                len(self.price_range(min_price, max_price)),
+                lambda: self.price_range(min_price, max_price),
+                lambda rows: (cols["price"][rows] >= low) & (cols["price"][rows] <= high),
+            ))
+
+        for column, values in (("type", types), ("fuel", fuels)):
+            if values:
+                categories = CATEGORIES[column]
+                lookup = np.zeros(len(categories), dtype=bool)
+                lookup[[categories.index(value) for value in values]] = True
+                predicates.append((
+                    sum(len(self.postings[column][categories.index(value)]) for value in values),
+                    lambda column=column, values=values: self.posting(column, values),
+                    lambda rows, column=column, lookup=lookup: lookup[cols[column][rows]],
+                ))
+
+        if min_year is not None:
+            predicates.append((
+                len(self.year_range(min_year)),
+                lambda: self.year_range(min_year),
+                lambda rows: cols["year"][rows] >= min_year,
+            ))
+        return predicates
+
+    def filter(self, search_query="", min_price=None, max_price=None, types=None, fuels=None, min_year=None):
+        """
+        Índices de fila (en orden del catálogo) que cumplen los filtros.
+        Equivalente a `VehicleTable.filter`, pero partiendo del filtro más selectivo.
+        """
+        num_rows = len(self.table)
+        predicates = self._predicates(search_query, min_price, max_price, types, fuels, min_year)
+        # Un filtro que cubre todo el catálogo (los tamaños son exactos) no restringe nada.
+        predicates = [predicate for predicate in predicates if predicate[0] < num_rows]
+        if not predicates:
+            return np.arange(num_rows)
+
+        predicates.sort(key=lambda predicate: predicate[0])
+        if predicates[0][0] > num_rows * self.DENSE_FRACTION:
+            return self.table.filter(search_query=search_query, min_price=min_price, max_price=max_price,
+                                     types=types, fuels=fuels, min_year=min_year)
+        _, candidates, _ = predicates[0]
+        rows = candidates()
+        for _, _, check in predicates[1:]:
+            if len(rows) == 0:
+                break
+            rows = rows[check(rows)]
+        return np.sort(rows)
@@ -0,0 +1,115 @@
+"""
+Vista paginada de resultados del Catálogo de Vehículos.
+
+En lugar de emitir un bloque de widgets por vehículo, los resultados se muestran en una
+única tabla (`st.dataframe`) con la página y el orden guardados en el servidor
+(`st.session_state`). Solo se serializan al navegador las filas de la página visible; el
+detalle de un vehículo se muestra bajo demanda al seleccionar su fila.
+"""
+import math
+
+import streamlit as st
+
+PAGE_SIZE_OPTIONS = [10, 25, 50, 100]
+DEFAULT_PAGE_SIZE = 25
+
+# Etiqueta visible -> columna de `VehicleTable` (None conserva el orden del catálogo).
+SORT_OPTIONS = {
+    "Orden del catálogo": None,
+    "Precio": "price",
+    "Año": "year",
+    "Kilometraje": "mileage",
+    "Marca": "make",
+    "Modelo": "model",
+}
+
+# Columnas mostradas en la tabla: columna de `VehicleTable` -> encabezado.
+GRID_COLUMNS = {
+    "year": "Año",
+    "make": "Marca",
+    "model": "Modelo",
+    "type": "Tipo",
+    "fuel": "Combustible",
+    "mileage": "Kilometraje (km)",
+    "color": "Color",
+    "price": "Precio ($)",
+}
+
+
+def paginate(indices, page, page_size):
+    """
+    Devuelve (filas de la página, número de páginas, página ajustada al rango válido).
+    """
+    num_pages = max(1, math.ceil(len(indices) / page_size))
+    page = min(max(1, page), num_pages)
+    start = (page - 1) * page_size
+    return indices[start:start + page_size], num_pages, page
+
+
+def render_vehicle_details(vehicle, key):
+    """
+    Muestra la ficha completa de un vehículo (detalle bajo demanda).
+    """
+    st.subheader(f"{vehicle['year']} {vehicle['make']} {vehicle['model']}")
+    st.write(f"**Tipo:** {vehicle['type']} | **Combustible:** {vehicle['fuel']} | **Kilometraje:** {vehicle['mileage']:,} km")
+    st.write(f"**Color:** {vehicle['color']} | **Características:** {', '.join(vehicle['features'])}")
+    st.markdown(f"### Precio: <span style='color:green; font-weight:bold;'>${vehicle['price']:,.2f}</span>", unsafe_allow_html=True)
+    st.button(f"Financiar este vehículo ({vehicle['id']})", key=f"{key}_finance_{vehicle['id']}")
+
+
+def render_catalog_results(table, indices, key="catalog"):
+    """
+    Renderiza la página actual de los resultados `indices` de `table` con controles de
+    orden y paginación, y el detalle del vehículo seleccionado.
+    """
+    page_key = f"{key}_page"
+
+    # Si cambian los resultados (otros filtros) o el orden, se vuelve a la primera página.
+    signature = (
+        len(indices), int(indices[0]) if len(indices) else -1, int(indices[-1]) if len(indices) else -1,
+        st.session_state.get(f"{key}_sort", next(iter(SORT_OPTIONS))),
+        st.session_state.get(f"{key}_descending", False),
+        st.session_state.get(f"{key}_page_size", DEFAULT_PAGE_SIZE),
+    )
+    if st.session_state.get(f"{key}_signature") != signature:
+        st.session_state[f"{key}_signature"] = signature
+        st.session_state[page_key] = 1
+
+    col_sort, col_order, col_size = st.columns(3)
+    with col_sort:
+        sort_label = st.selectbox("Ordenar por", options=list(SORT_OPTIONS), key=f"{key}_sort")
+    with col_order:
+        descending = st.toggle("Descendente", key=f"{key}_descending")
+    with col_size:
+        page_size = st.selectbox("Vehículos por página", options=PAGE_SIZE_OPTIONS, index=PAGE_SIZE_OPTIONS.index(DEFAULT_PAGE_SIZE), key=f"{key}_page_size")
+
+    sort_column = SORT_OPTIONS[sort_label]
+    if sort_column is not None:
+        indices = table.sort_indices(indices, sort_column, descending=descending)
+    elif descending:
+        indices = indices[::-1]
+
+    page_rows, num_pages, page = paginate(indices, st.session_state.get(page_key, 1), page_size)
+    st.session_state[page_key] = page
+
+    grid = {"ID": table.decode_column("id", page_rows)}
+    grid.update({label: table.decode_column(column, page_rows) for column, label in GRID_COLUMNS.items()})
+    # La clave incluye página y orden para que la selección no salte a otra fila al navegar.
+    event = st.dataframe(
+        grid,
+        hide_index=True,
+        column_config={"Precio ($)": st.column_config.NumberColumn(format="$%.2f")},
+        on_select="rerun",
+        selection_mode="single-row",
+        key=f"{key}_grid_{page}_{page_size}_{sort_label}_{descending}",
+    )
+
+    st.number_input("Página", min_value=1, max_value=num_pages, step=1, key=page_key)
+    start = (page - 1) * page_size
+    st.caption(f"Página {page:,} de {num_pages:,} · vehículos {start + 1 if len(page_rows) else 0:,}–{start + len(page_rows):,} de {len(indices):,}. "
+               "Selecciona una fila para ver el detalle y financiar.")
+
+    selected_rows = event.selection.rows
+    if selected_rows:
+        st.markdown("---")
+        render_vehicle_details(table.row(int(page_rows[selected_rows[0]])), key)
@@ -0,0 +1,165 @@
+"""
+Historial acotado de la conversación del Asistente AI.
+
+* `ChatHistory`: vive en `st.session_state`. Guarda literalmente solo los últimos
+  `recent_turns` turnos (pregunta, respuesta); los anteriores pasan al archivo en disco y se
+  condensan en un resumen acumulado, de modo que la memoria de la sesión, el trabajo de cada
+  rerun y el contexto de conversación que se envía al LLM no crecen con la sesión.
+* `ChatArchive`: turnos archivados en SQLite por sesión, para mostrarlos bajo demanda.
+* `summarize_turns`: actualiza el resumen con el LLM (a través del `LLMGateway`).
+"""
+import os
+import sqlite3
+import time
+
+RECENT_TURNS = 6
+SUMMARY_BATCH_TURNS = 3
+SUMMARY_MAX_CHARS = 1500
+SUMMARY_TIMEOUT_SECONDS = 20.0
+CONTEXT_RECENT_TURNS = 2
+CONTEXT_MAX_MESSAGE_CHARS = 600
+ARCHIVE_PAGE_TURNS = 10
+ARCHIVE_RETENTION_SECONDS = 30 * 24 * 3600
+
+SUMMARY_PROMPT_TEMPLATE = """
+Eres el asistente de Finanzauto. Actualiza el resumen de una conversación con un cliente para poder entender sus próximas preguntas.
+Conserva los datos que el cliente dio (montos, vehículos, planes, plazos) y los temas que preguntó; omite saludos y detalles de las respuestas.
+Responde solo con el resumen, en español y en menos de 150 palabras.
+
+Resumen actual:
+{summary}
+
+Turnos nuevos:
+{turns}
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chat_turns (
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (session_id, seq)
+) WITHOUT ROWID;
+"""
+
+
+def _truncate(text, max_chars):
+    return text if len(text) <= max_chars else text[:max_chars].rstrip() + "…"
+
+
+def format_turns(turns, max_chars=CONTEXT_MAX_MESSAGE_CHARS):
+    return "\n".join(
+        f"Cliente: {_truncate(question, max_chars)}\nAsistente: {_truncate(answer, max_chars)}" for question, answer in turns
+    )
+
+
+def summarize_turns(gateway, summary, turns, timeout=SUMMARY_TIMEOUT_SECONDS):
+    """
+    Resumen nuevo a partir de `summary` y los `turns` que salieron de la ventana.
+    """
+    prompt = SUMMARY_PROMPT_TEMPLATE.format(summary=summary or "(vacío)", turns=format_turns(turns))
+    return gateway.invoke(prompt, timeout=timeout).strip()
+
+
+def _extractive_summary(summary, turns):
+    """
+    Resumen de respaldo sin LLM: las preguntas del cliente, conservando las más recientes.
+    """
+    questions = "; ".join(_truncate(question, 200) for question, _ in turns)
+    text = f"{summary} El cliente también preguntó: {questions}." if summary else f"El cliente preguntó: {questions}."
+    return text[-SUMMARY_MAX_CHARS:]
+
+
+class ChatArchive:
+    """
+    Turnos archivados en SQLite. Cada operación abre su propia conexión, por lo que la misma
+    instancia puede usarse desde varios hilos y sesiones de Streamlit.
+    """
+
+    def __init__(self, db_path, retention_seconds=ARCHIVE_RETENTION_SECONDS):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            conn.execute("DELETE FROM chat_turns WHERE created_at < ?", (time.time() - retention_seconds,))
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def append(self, session_id, first_seq, turns):
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO chat_turns (session_id, seq, question, answer, created_at) VALUES (?, ?, ?, ?, ?)",
+                [(session_id, first_seq + i, question, answer, now) for i, (question, answer) in enumerate(turns)],
+            )
+
+    def load(self, session_id, start, stop):
+        """
+        Turnos `start` a `stop - 1` de la sesión, en orden.
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT question, answer FROM chat_turns WHERE session_id = ? AND seq >= ? AND seq < ? ORDER BY seq",
+                (session_id, start, stop),
+            ).fetchall()
+
+
+class ChatHistory:
+    """
+    Conversación de una sesión: ventana de turnos recientes, turnos archivados pendientes de
+    resumir y resumen acumulado de todo lo anterior.
+    """
+
+    def __init__(self, session_id, recent_turns=RECENT_TURNS, summary_batch=SUMMARY_BATCH_TURNS):
+        self.session_id = session_id
+        self.recent_turns = recent_turns
+        self.summary_batch = summary_batch
+        self.turns = []
+        self.pending = []
+        self.summary = ""
+        self.archived = 0
+
+    def add_turn(self, question, answer, archive):
+        """
+        Agrega un turno; los que salen de la ventana se archivan en `archive` y quedan
+        pendientes de resumir.
+        """
+        self.turns.append((question, answer))
+        overflow = self.turns[:-self.recent_turns]
+        if overflow:
+            archive.append(self.session_id, self.archived, overflow)
+            self.archived += len(overflow)
+            self.pending.extend(overflow)
+            self.turns = self.turns[-self.recent_turns:]
+
+    def needs_summary(self):
+        return len(self.pending) >= self.summary_batch
+
+    def update_summary(self, summarize):
+        """
+        Incorpora los turnos pendientes al resumen con `summarize(resumen, turnos)`; si falla,
+        usa un resumen extractivo para que los pendientes no se acumulen.
+        """
+        try:
+            summary = summarize(self.summary, self.pending) or _extractive_summary(self.summary, self.pending)
+        except Exception:
+            summary = _extractive_summary(self.summary, self.pending)
+        self.summary = _truncate(summary, SUMMARY_MAX_CHARS)
+        self.pending = []
+
+    def context(self, recent=CONTEXT_RECENT_TURNS):
+        """
+        Conversación previa para el prompt: el resumen, los turnos aún sin resumir y los
+        últimos `recent` turnos, con cada mensaje recortado.
+        """
+        parts = []
+        if self.summary:
+            parts.append(f"Resumen de la conversación anterior: {self.summary}")
+        turns = self.pending + self.turns[-recent:] if recent else self.pending
+        if turns:
+            parts.append(format_turns(turns))
+        return "\n".join(parts)
@@ -0,0 +1,319 @@
+"""
+Extracción y fragmentación de documentos para la ingesta RAG.
+
+* `iter_pdf_pages`: recorre un PDF página a página y produce `(número de página, texto)` sin
+  concatenar el documento completo. En PDFs grandes reparte rangos de páginas entre un pool
+  de procesos y devuelve las páginas en orden a medida que terminan, con un número acotado
+  de rangos en vuelo.
+* `iter_document_pages`: lo mismo para un archivo subido (PDF, TXT o MD).
+* `chunk_pages`: divide las páginas en objetos `Document` con metadatos de origen y página.
+* `embed_and_store`: genera los embeddings de los fragmentos en lotes, con concurrencia
+  acotada y reintentos con espera exponencial solo para los lotes que fallan, y escribe cada
+  lote en la colección de Chroma en cuanto está listo.
+* `CollectionVersion`: número de versión de la colección vectorial, compartido entre procesos.
+  La ingesta lo incrementa tras cada cambio y las cachés del lado de consulta lo usan como
+  clave, así que solo ellas se invalidan (no los clientes de Gemini ni el handle de Chroma).
+* `sync_document`: reingesta idempotente. Cada fragmento tiene un id derivado de su contenido
+  y cada documento una huella (`document_fingerprint`); un archivo sin cambios no se vuelve a
+  procesar y uno modificado solo inserta y borra los fragmentos que cambiaron.
+"""
+import hashlib
+import multiprocessing
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from langchain_core.documents import Document
+
+# PyMuPDF y el divisor de texto de LangChain se importan al leer o dividir un documento: tardan
+# en cargarse y las páginas que solo consultan la colección (vía `rag_pipeline`) no los usan.
+
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 200
+# Por debajo de este número de páginas no compensa arrancar procesos.
+PARALLEL_MIN_PAGES = 64
+PAGES_PER_TASK = 32
+TEXT_MIME_TYPES = ("text/plain", "text/markdown")
+EMBED_BATCH_SIZE = 64
+EMBED_MAX_WORKERS = 4
+EMBED_MAX_RETRIES = 3
+EMBED_BACKOFF_SECONDS = 1.0
+
+
+def _extract_page_range(path, start, stop):
+    """
+    Texto de las páginas [start, stop) de un PDF en disco. Se ejecuta en los procesos del pool.
+    """
+    import fitz  # PyMuPDF
+
+    with fitz.open(path) as doc:
+        return [(number + 1, doc[number].get_text()) for number in range(start, stop)]
+
+
+def _pool_context():
+    """
+    Contexto de multiprocessing del pool de extracción. No se usa "fork" (el predeterminado en
+    Linux): la ingesta se llama desde el servidor de Streamlit, con varios hilos, y un proceso
+    bifurcado de ahí puede heredar bloqueos tomados por otros hilos (logging, sqlite, gRPC).
+    "forkserver" bifurca los procesos desde un servidor de un solo hilo que ya importó este
+    módulo y PyMuPDF y que se reutiliza entre ingestas; donde no existe (Windows), "spawn".
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(["__main__", __name__, "fitz"])
+    return context
+
+
+def _iter_parallel(path, num_pages, workers):
+    ranges = [(start, min(start + PAGES_PER_TASK, num_pages)) for start in range(0, num_pages, PAGES_PER_TASK)]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as executor:
+        # Como mucho 2 rangos por proceso en vuelo: la memoria no crece con el tamaño del PDF.
+        pending = []
+        next_range = 0
+        while next_range < len(ranges) or pending:
+            while next_range < len(ranges) and len(pending) < 2 * workers:
+                pending.append(executor.submit(_extract_page_range, path, *ranges[next_range]))
+                next_range += 1
+            yield from pending.pop(0).result()
+
+
+def iter_pdf_pages(source, workers=None):
+    """
+    Produce `(número de página, texto)` para cada página de un PDF, empezando en 1.
+    `source` puede ser una ruta o un archivo (por ejemplo, el `UploadedFile` de Streamlit).
+    `workers` es el número de procesos para PDFs grandes (por defecto, uno por CPU; 1 para
+    extraer siempre en el proceso actual).
+    """
+    import fitz  # PyMuPDF
+
+    workers = workers or os.cpu_count() or 1
+    if isinstance(source, (str, os.PathLike)):
+        doc = fitz.open(source)
+    else:
+        data = source.getvalue() if hasattr(source, "getvalue") else source.read()
+        doc = fitz.open(stream=data, filetype="pdf")
+
+    with doc:
+        num_pages = doc.page_count
+        if workers == 1 or num_pages < PARALLEL_MIN_PAGES:
+            for number, page in enumerate(doc, start=1):
+                yield number, page.get_text()
+            return
+
+    if isinstance(source, (str, os.PathLike)):
+        yield from _iter_parallel(os.fspath(source), num_pages, workers)
+        return
+    # Los procesos del pool abren el PDF desde disco; un archivo subido se vuelca una sola vez.
+    tmp_dir = tempfile.mkdtemp(prefix="ingest_")
+    try:
+        path = os.path.join(tmp_dir, "document.pdf")
+        with open(path, "wb") as tmp_file:
+            tmp_file.write(data)
+        del data
+        yield from _iter_parallel(path, num_pages, workers)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def iter_document_pages(uploaded_file, workers=None):
+    """
+    Páginas de un archivo subido según su tipo MIME. Un TXT o MD es una sola página.
+    Lanza `ValueError` si el tipo no está soportado.
+    """
+    if uploaded_file.type == "application/pdf":
+        return iter_pdf_pages(uploaded_file, workers=workers)
+    if uploaded_file.type in TEXT_MIME_TYPES:
+        return iter([(1, uploaded_file.getvalue().decode("utf-8"))])
+    raise ValueError(f"Tipo de archivo no soportado: {uploaded_file.type}")
+
+
+def chunk_pages(pages, source, chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP):
+    """
+    Divide cada página en fragmentos y produce un `Document` por fragmento con metadatos
+    `source` (nombre del archivo) y `page`. Consume `pages` de forma perezosa.
+    """
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+    text_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len
+    )
+    for page_number, text in pages:
+        for chunk in text_splitter.split_text(text):
+            yield Document(page_content=chunk, metadata={"source": source, "page": page_number})
+
+
+def _embed_with_retry(embeddings, texts, max_retries, backoff):
+    """
+    Embeddings de un lote, reintentando hasta `max_retries` veces con espera exponencial
+    (con jitter). Devuelve (vectores, reintentos usados); relanza el último error.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return embeddings.embed_documents(texts), attempt
+        except Exception:
+            if attempt == max_retries:
+                raise
+            time.sleep(backoff * 2 ** attempt * random.uniform(0.5, 1.0))
+
+
+def embed_and_store(documents, embeddings, collection, ids=None, batch_size=EMBED_BATCH_SIZE, max_workers=EMBED_MAX_WORKERS,
+                    max_retries=EMBED_MAX_RETRIES, backoff=EMBED_BACKOFF_SECONDS, on_progress=None):
+    """
+    Genera los embeddings de `documents` con `embeddings` (cualquier `Embeddings` de LangChain)
+    en lotes de `batch_size`, con como mucho `max_workers` lotes en paralelo, y guarda cada lote
+    en `collection` (una colección de Chroma) apenas termina. Sin `ids`, cada fragmento recibe
+    un id aleatorio.
+
+    Un lote que sigue fallando tras los reintentos no detiene a los demás: se cuenta en
+    `failed`. `on_progress`, si se da, se llama desde el hilo que invoca a esta función (seguro
+    para Streamlit) con las estadísticas tras cada lote. Devuelve las estadísticas: `chunks`,
+    `stored`, `failed`, `batches`, `retries`, `errors`, `seconds` y `chunks_per_second`.
+    """
+    documents = list(documents)
+    ids = list(ids) if ids is not None else [str(uuid.uuid4()) for _ in documents]
+    batches = [(ids[start:start + batch_size], documents[start:start + batch_size]) for start in range(0, len(documents), batch_size)]
+    stats = dict(chunks=len(documents), stored=0, failed=0, batches=len(batches), retries=0, errors=[],
+                 seconds=0.0, chunks_per_second=0.0)
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_embed_with_retry, embeddings, [doc.page_content for doc in batch], max_retries, backoff): (batch_ids, batch)
+            for batch_ids, batch in batches
+        }
+        for future in as_completed(futures):
+            batch_ids, batch = futures[future]
+            try:
+                vectors, retries = future.result()
+            except Exception as e:
+                stats["failed"] += len(batch)
+                stats["retries"] += max_retries
+                stats["errors"].append(str(e))
+            else:
+                # Las escrituras se hacen desde este hilo: Chroma (SQLite) admite un solo escritor.
+                collection.upsert(
+                    ids=batch_ids,
+                    embeddings=vectors,
+                    documents=[doc.page_content for doc in batch],
+                    metadatas=[doc.metadata for doc in batch],
+                )
+                stats["stored"] += len(batch)
+                stats["retries"] += retries
+            stats["seconds"] = time.perf_counter() - start_time
+            stats["chunks_per_second"] = stats["stored"] / stats["seconds"] if stats["seconds"] else 0.0
+            if on_progress is not None:
+                on_progress(stats)
+    return stats
+
+
+class CollectionVersion:
+    """
+    Versiones de colecciones en SQLite. El incremento es atómico, así que dos ingestas
+    simultáneas (en el mismo o en distintos procesos) nunca dejan la misma versión.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS collection_versions (name TEXT PRIMARY KEY, version INTEGER NOT NULL)")
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def get(self, name):
+        with self._connect() as conn:
+            row = conn.execute("SELECT version FROM collection_versions WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else 0
+
+    def bump(self, name):
+        """
+        Incrementa y devuelve la versión de la colección `name`.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO collection_versions (name, version) VALUES (?, 1) "
+                "ON CONFLICT (name) DO UPDATE SET version = version + 1",
+                (name,),
+            )
+            return conn.execute("SELECT version FROM collection_versions WHERE name = ?", (name,)).fetchone()[0]
+
+
+def document_fingerprint(data):
+    """
+    Huella de un archivo: SHA-256 de su contenido y de los parámetros de fragmentación (si
+    estos cambian, el documento debe volver a fragmentarse).
+    """
+    digest = hashlib.sha256(data)
+    digest.update(f"|{CHUNK_SIZE}|{CHUNK_OVERLAP}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def chunk_ids(documents, source):
+    """
+    Ids deterministas: SHA-256 del origen y del texto del fragmento, más el número de
+    aparición para los fragmentos repetidos dentro del documento.
+    """
+    seen = {}
+    ids = []
+    for doc in documents:
+        content_hash = hashlib.sha256(f"{source}\0{doc.page_content}".encode("utf-8")).hexdigest()
+        occurrence = seen.get(content_hash, 0)
+        seen[content_hash] = occurrence + 1
+        ids.append(f"{content_hash}-{occurrence}")
+    return ids
+
+
+def is_document_current(collection, source, fingerprint):
+    """
+    True si `collection` ya tiene `source` y todos sus fragmentos tienen esta huella. La huella
+    solo se escribe cuando una sincronización termina sin lotes fallidos, así que un documento
+    a medio ingerir nunca se considera al día.
+    """
+    existing = collection.get(where={"source": source}, include=["metadatas"])
+    return bool(existing["ids"]) and all(
+        (metadata or {}).get("fingerprint") == fingerprint for metadata in existing["metadatas"]
+    )
+
+
+def sync_document(documents, source, fingerprint, embeddings, collection, lexical_index=None, **embed_kwargs):
+    """
+    Deja en `collection` exactamente los fragmentos `documents` de `source`: inserta (con
+    embeddings) solo los que no estaban, actualiza los metadatos de los que siguen y borra los
+    que ya no existen. Si algún lote falla no se borra nada, para que una nueva subida complete
+    la sincronización. Por lo mismo, los fragmentos nuevos se guardan sin la huella y todos los
+    de `source` la reciben solo si ningún lote falló. `embed_kwargs` se pasa a `embed_and_store`.
+
+    Con `lexical_index` (un `LexicalIndex`) aplica los mismos cambios al índice léxico, que
+    indexa también los fragmentos cuyo embedding falló.
+
+    Devuelve las estadísticas de `embed_and_store` más `added`, `kept` y `deleted`.
+    """
+    documents = [Document(page_content=doc.page_content, metadata={**doc.metadata, "source": source}) for doc in documents]
+    ids = chunk_ids(documents, source)
+    existing_ids = set(collection.get(where={"source": source}, include=[])["ids"])
+    new_ids = set(ids) - existing_ids
+    to_add = [(chunk_id, doc) for chunk_id, doc in zip(ids, documents) if chunk_id in new_ids]
+    stale_ids = sorted(existing_ids - set(ids))
+
+    stats = embed_and_store([doc for _, doc in to_add], embeddings, collection, ids=[chunk_id for chunk_id, _ in to_add], **embed_kwargs)
+    if lexical_index is not None:
+        lexical_index.upsert(ids, documents)
+    if not stats["failed"]:
+        if ids:
+            # Sin lotes fallidos: todos los fragmentos reciben la huella (y los que siguen, su
+            # página actual) sin recalcular embeddings.
+            collection.update(ids=ids, metadatas=[{**doc.metadata, "fingerprint": fingerprint} for doc in documents])
+        if stale_ids:
+            collection.delete(ids=stale_ids)
+            if lexical_index is not None:
+                lexical_index.delete(stale_ids)
+    stats.update(added=stats["stored"], kept=len(ids) - len(to_add), deleted=0 if stats["failed"] else len(stale_ids))
+    return stats
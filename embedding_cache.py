@@ -0,0 +1,134 @@
+"""
+Caché persistente de embeddings direccionada por contenido.
+
+Los vectores se guardan en SQLite con clave (nombre del modelo de embeddings, SHA-256 del
+texto), así que un fragmento idéntico (del mismo documento subido otra vez o de una versión
+apenas editada) nunca se vuelve a enviar al servicio de embeddings.
+
+* `EmbeddingCache`: almacén de vectores en SQLite (float32).
+* `CachedEmbeddings`: envoltorio de cualquier `Embeddings` de LangChain que consulta la caché
+  antes de llamar al modelo y lleva estadísticas de aciertos y fallos.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, text_hash)
+) WITHOUT ROWID;
+"""
+# Límite de parámetros por consulta en versiones antiguas de SQLite.
+MAX_SQL_PARAMS = 900
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Vectores en SQLite. Cada operación abre su propia conexión, por lo que la misma instancia
+    puede usarse desde varios hilos y sesiones de Streamlit.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def get_many(self, model, hashes):
+        """
+        Devuelve {hash: vector} para los hashes que están en la caché.
+        """
+        found = {}
+        hashes = list(hashes)
+        with self._connect() as conn:
+            for start in range(0, len(hashes), MAX_SQL_PARAMS):
+                chunk = hashes[start:start + MAX_SQL_PARAMS]
+                rows = conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({','.join('?' * len(chunk))})",
+                    [model, *chunk],
+                )
+                for hash_value, blob in rows:
+                    found[hash_value] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def put_many(self, model, items):
+        """
+        Guarda pares (hash, vector).
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)",
+                [(model, hash_value, np.asarray(vector, dtype=np.float32).tobytes()) for hash_value, vector in items],
+            )
+
+    def count(self, model=None):
+        with self._connect() as conn:
+            if model is None:
+                return conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM embeddings WHERE model = ?", (model,)).fetchone()[0]
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    `Embeddings` que solo envía a `embeddings` los textos que nunca ha visto. Los textos
+    repetidos dentro de una misma llamada se calculan una sola vez.
+
+    Solo se cachean los embeddings de documentos: las consultas usan otro tipo de tarea en
+    Gemini y pasan directamente al modelo.
+    """
+
+    def __init__(self, embeddings, cache, model=None):
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model = model or getattr(embeddings, "model", type(embeddings).__name__)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def embed_documents(self, texts):
+        texts = list(texts)
+        hashes = [text_hash(text) for text in texts]
+        vectors = self.cache.get_many(self.model, set(hashes))
+
+        missing = {}
+        for hash_value, text in zip(hashes, texts):
+            if hash_value not in vectors:
+                missing.setdefault(hash_value, text)
+        if missing:
+            new_vectors = self.embeddings.embed_documents(list(missing.values()))
+            new_items = list(zip(missing, new_vectors))
+            self.cache.put_many(self.model, new_items)
+            vectors.update(new_items)
+
+        with self._lock:
+            self.misses += len(missing)
+            self.hits += len(texts) - len(missing)
+        return [list(vectors[hash_value]) for hash_value in hashes]
+
+    def embed_query(self, text):
+        return self.embeddings.embed_query(text)
+
+    def stats(self):
+        """
+        Aciertos y fallos desde que se creó el envoltorio, y vectores guardados para el modelo.
+        """
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return dict(hits=hits, misses=misses, hit_rate=hits / total if total else 0.0,
+                    stored=self.cache.count(self.model))
@@ -0,0 +1,119 @@
+"""
+Backends locales que imitan a los servicios de Gemini para pruebas y benchmarks sin clave API.
+
+* `FakeEmbeddings`: embeddings deterministas por hashing de palabras (textos con palabras en
+  común quedan cerca), con latencia por llamada y fallos transitorios configurables.
+* `FakeChatModel`: modelo de chat de LangChain con respuestas deterministas, latencia hasta el
+  primer token y latencia por token, también en streaming, y fallos transitorios configurables.
+"""
+import hashlib
+import random
+import re
+import threading
+import time
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class FakeEmbeddings(Embeddings):
+    """
+    Implementa la interfaz `Embeddings` de LangChain sin red. Cada llamada espera
+    `latency` segundos (más `latency_per_text` por texto) y falla con probabilidad
+    `failure_rate` lanzando `ConnectionError`, como un error transitorio de la API. Como el
+    cliente de Gemini, `embed_documents` parte las listas largas en peticiones secuenciales de
+    `max_batch_size` textos, y un fallo en cualquiera de ellas aborta toda la llamada.
+    """
+
+    def __init__(self, dimensions=256, latency=0.0, latency_per_text=0.0, failure_rate=0.0, seed=0,
+                 model="fake-embedding", max_batch_size=100):
+        self.dimensions = dimensions
+        self.max_batch_size = max_batch_size
+        self.latency = latency
+        self.latency_per_text = latency_per_text
+        self.failure_rate = failure_rate
+        self.model = model
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.texts_embedded = 0
+        self.failures = 0
+
+    def _vector(self, text):
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for word in WORD_PATTERN.findall(text.lower()):
+            digest = hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dimensions
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+
+    def _call(self, texts):
+        with self._lock:
+            self.calls += 1
+            failed = self._rng.random() < self.failure_rate
+            if failed:
+                self.failures += 1
+        time.sleep(self.latency + self.latency_per_text * len(texts))
+        if failed:
+            raise ConnectionError("Fallo transitorio simulado del servicio de embeddings.")
+        with self._lock:
+            self.texts_embedded += len(texts)
+        return [self._vector(text) for text in texts]
+
+    def embed_documents(self, texts):
+        texts = list(texts)
+        vectors = []
+        for start in range(0, len(texts), self.max_batch_size):
+            vectors.extend(self._call(texts[start:start + self.max_batch_size]))
+        return vectors
+
+    def embed_query(self, text):
+        return self._call([text])[0]
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat de LangChain sin red. La respuesta es una frase determinista derivada del prompt de
+    `answer_words` palabras; llega tras `first_token_latency` segundos y luego a razón de
+    `token_latency` segundos por palabra (también con `invoke`, que espera a la última). Con
+    probabilidad `failure_rate` la llamada falla antes del primer token con `ConnectionError`.
+    """
+
+    answer_words: int = 60
+    first_token_latency: float = 0.0
+    token_latency: float = 0.0
+    failure_rate: float = 0.0
+    model: str = "fake-chat"
+
+    @property
+    def _llm_type(self):
+        return "fake-chat"
+
+    def _words(self, messages):
+        prompt = "\n".join(str(message.content) for message in messages)
+        digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=8).hexdigest()
+        vocabulary = WORD_PATTERN.findall(prompt) or ["respuesta"]
+        rng = random.Random(digest)
+        return [f"[{digest}]"] + [rng.choice(vocabulary) for _ in range(self.answer_words - 1)]
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.first_token_latency)
+        if random.random() < self.failure_rate:
+            raise ConnectionError("Fallo transitorio simulado del servicio de chat.")
+        for i, word in enumerate(self._words(messages)):
+            if i:
+                time.sleep(self.token_latency)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=word if i == 0 else " " + word))
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        text = "".join(chunk.text for chunk in self._stream(messages))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
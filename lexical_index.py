@@ -0,0 +1,143 @@
+"""
+Índice léxico (BM25) de los fragmentos de la colección vectorial, en SQLite FTS5.
+
+Se mantiene junto a la colección de Chroma en la ingesta (`document_ingestion.sync_document`)
+y encuentra lo que la búsqueda por similitud recupera mal: nombres de planes
+("Plan Flexi-Cuota"), números de artículo o porcentajes. No necesita llamar al servicio de
+embeddings, por lo que también sirve de respaldo cuando este está lento o caído.
+
+Los fragmentos se guardan con su texto y metadatos en `chunks`; `chunks_fts` es una tabla
+FTS5 de contenido externo que los triggers mantienen sincronizada. El tokenizador ignora
+mayúsculas y tildes.
+"""
+import json
+import os
+import re
+import sqlite3
+
+from langchain_core.documents import Document
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    rowid INTEGER PRIMARY KEY,
+    chunk_id TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_source ON chunks (source);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+    text, content='chunks', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS chunks_ai AFTER INSERT ON chunks BEGIN
+    INSERT INTO chunks_fts (rowid, text) VALUES (new.rowid, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS chunks_ad AFTER DELETE ON chunks BEGIN
+    INSERT INTO chunks_fts (chunks_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS chunks_au AFTER UPDATE OF text ON chunks BEGIN
+    INSERT INTO chunks_fts (chunks_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+    INSERT INTO chunks_fts (rowid, text) VALUES (new.rowid, new.text);
+END;
+"""
+# Límite de parámetros por consulta en versiones antiguas de SQLite.
+MAX_SQL_PARAMS = 900
+# Palabras vacías frecuentes en las preguntas: no aportan al ranking y harían que la consulta
+# coincidiera con casi todos los fragmentos.
+STOPWORDS = frozenset("""
+a al algo como con cual cuales cuando cuanto de del donde el en es esta este esto hay la las lo los me mi mis
+para pero por puedo que se si sin sobre son su sus tengo un una uno y o ya
+""".split())
+
+_WORDS = re.compile(r"\w+", re.UNICODE)
+
+
+def match_query(text):
+    """
+    Consulta FTS5 con los términos de `text` (sin palabras vacías) unidos con OR, o None si
+    no queda ninguno.
+    """
+    terms = []
+    for word in _WORDS.findall(text.lower()):
+        if word not in STOPWORDS and word not in terms:
+            terms.append(word)
+    return " OR ".join(f'"{term}"' for term in terms) or None
+
+
+class LexicalIndex:
+    """
+    Fragmentos indexados por id (los mismos ids que en Chroma). Cada operación abre su propia
+    conexión, por lo que la misma instancia puede usarse desde varios hilos y sesiones.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def upsert(self, ids, documents):
+        """
+        Inserta o actualiza los fragmentos `documents` con sus `ids`.
+        """
+        rows = [
+            (chunk_id, doc.metadata.get("source", ""), json.dumps(doc.metadata, ensure_ascii=False), doc.page_content)
+            for chunk_id, doc in zip(ids, documents)
+        ]
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO chunks (chunk_id, source, metadata, text) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (chunk_id) DO UPDATE SET source = excluded.source, metadata = excluded.metadata, text = excluded.text",
+                rows,
+            )
+
+    def delete(self, ids):
+        ids = list(ids)
+        with self._connect() as conn:
+            for start in range(0, len(ids), MAX_SQL_PARAMS):
+                chunk = ids[start:start + MAX_SQL_PARAMS]
+                conn.execute(f"DELETE FROM chunks WHERE chunk_id IN ({','.join('?' * len(chunk))})", chunk)
+
+    def count(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def rebuild_from(self, collection, batch_size=1000):
+        """
+        Vuelve a indexar todos los fragmentos de una colección de Chroma (por ejemplo, una
+        colección anterior a este índice). Devuelve cuántos se indexaron.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM chunks")
+        total = 0
+        while True:
+            batch = collection.get(include=["documents", "metadatas"], limit=batch_size, offset=total)
+            if not batch["ids"]:
+                return total
+            self.upsert(batch["ids"], [
+                Document(page_content=text, metadata=metadata or {})
+                for text, metadata in zip(batch["documents"], batch["metadatas"])
+            ])
+            total += len(batch["ids"])
+
+    def search(self, query, k):
+        """
+        Los `k` fragmentos con mejor puntuación BM25 para `query`, como (ids, documentos).
+        """
+        match = match_query(query)
+        if match is None:
+            return [], []
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT chunks.chunk_id, chunks.metadata, chunks.text FROM chunks_fts "
+                "JOIN chunks ON chunks.rowid = chunks_fts.rowid "
+                "WHERE chunks_fts MATCH ? ORDER BY bm25(chunks_fts) LIMIT ?",
+                (match, k),
+            ).fetchall()
+        ids = [chunk_id for chunk_id, _, _ in rows]
+        documents = [Document(page_content=text, metadata=json.loads(metadata)) for _, metadata, text in rows]
+        return ids, documents
@@ -0,0 +1,201 @@
+"""
+Pasarela única hacia el modelo de chat: todas las páginas llaman al LLM a través de ella.
+
+* Límite de llamadas simultáneas por proceso: las llamadas corren en un pool de
+  `max_concurrency` hilos compartido por todas las sesiones; el resto espera turno.
+* Plazo por llamada (`timeout`): cubre la espera de turno, los reintentos y la respuesta. Al
+  vencer se lanza `LLMTimeoutError` y el hilo de Streamlit queda libre aunque la petición
+  HTTP siga en curso.
+* Reintentos con espera exponencial (con jitter) ante errores transitorios
+  (`TRANSIENT_ERRORS`), solo si queda plazo. En streaming solo se reintenta antes del
+  primer fragmento, para no repetir texto ya mostrado.
+* `batch`: varias consultas en paralelo (por ejemplo, un análisis por solicitud).
+"""
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from llm_streaming import message_text, stream_text
+
+try:
+    from google.api_core import exceptions as google_exceptions
+except ImportError:  # el gateway también funciona con otros modelos de LangChain
+    google_exceptions = None
+
+LLM_MAX_CONCURRENCY = 8
+LLM_TIMEOUT_SECONDS = 60.0
+LLM_MAX_RETRIES = 2
+LLM_BACKOFF_SECONDS = 1.0
+
+TRANSIENT_ERRORS = (ConnectionError, TimeoutError)
+if google_exceptions is not None:
+    TRANSIENT_ERRORS += (
+        google_exceptions.TooManyRequests,
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.InternalServerError,
+        google_exceptions.DeadlineExceeded,
+    )
+
+_CHUNK, _DONE, _ERROR = range(3)
+
+
+class LLMTimeoutError(TimeoutError):
+    """
+    La respuesta del LLM no llegó dentro del plazo de la llamada.
+    """
+
+
+class LLMGateway:
+    """
+    Envuelve un modelo de chat de LangChain (`llm`). Una instancia por proceso (por ejemplo,
+    con `st.cache_resource`), para que el límite de concurrencia sea global.
+    """
+
+    def __init__(self, llm, max_concurrency=LLM_MAX_CONCURRENCY, timeout=LLM_TIMEOUT_SECONDS,
+                 max_retries=LLM_MAX_RETRIES, backoff=LLM_BACKOFF_SECONDS):
+        self.llm = llm
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="llm-gateway")
+        self._lock = threading.Lock()
+        self._stats = dict(calls=0, in_flight=0, retries=0, timeouts=0, failures=0)
+
+    def _count(self, key, delta=1):
+        with self._lock:
+            self._stats[key] += delta
+
+    def stats(self):
+        """
+        Llamadas, llamadas en curso, reintentos, plazos vencidos y errores definitivos.
+        """
+        with self._lock:
+            return dict(self._stats, max_concurrency=self.max_concurrency)
+
+    def _deadline(self, timeout):
+        return time.monotonic() + (self.timeout if timeout is None else timeout)
+
+    def _sleep_before_retry(self, attempt, deadline):
+        """
+        Espera antes del reintento `attempt + 1`. Devuelve False (sin esperar) si no quedan
+        reintentos o si la espera agotaría el plazo.
+        """
+        delay = self.backoff * 2 ** attempt * random.uniform(0.5, 1.0)
+        if attempt >= self.max_retries or time.monotonic() + delay >= deadline:
+            return False
+        self._count("retries")
+        time.sleep(delay)
+        return True
+
+    def _run(self, call, deadline):
+        """
+        Ejecuta `call()` en un hilo del pool con reintentos. Si el plazo venció mientras
+        esperaba turno, no llega a llamar al modelo.
+        """
+        self._count("in_flight")
+        try:
+            for attempt in range(self.max_retries + 1):
+                if time.monotonic() >= deadline:
+                    raise LLMTimeoutError("Plazo agotado antes de llamar al LLM.")
+                try:
+                    return call()
+                except TRANSIENT_ERRORS:
+                    if not self._sleep_before_retry(attempt, deadline):
+                        raise
+        finally:
+            self._count("in_flight", -1)
+
+    def _wait(self, future, deadline):
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except (FutureTimeoutError, LLMTimeoutError):
+            future.cancel()
+            self._count("timeouts")
+            raise LLMTimeoutError("El LLM no respondió dentro del plazo.") from None
+        except Exception:
+            self._count("failures")
+            raise
+
+    def invoke(self, prompt, timeout=None):
+        """
+        Texto completo de la respuesta a `prompt`, o `LLMTimeoutError` si no llega en
+        `timeout` segundos (por defecto, el plazo del gateway).
+        """
+        self._count("calls")
+        deadline = self._deadline(timeout)
+        future = self._executor.submit(self._run, lambda: message_text(self.llm.invoke(prompt)), deadline)
+        return self._wait(future, deadline)
+
+    def batch(self, prompts, timeout=None):
+        """
+        Respuestas a `prompts`, ejecutadas en paralelo y en el mismo orden. Un error en una
+        consulta no afecta a las demás: su posición contiene la excepción. `timeout` es el
+        plazo del lote completo.
+        """
+        prompts = list(prompts)
+        self._count("calls", len(prompts))
+        deadline = self._deadline(timeout)
+        futures = [
+            self._executor.submit(self._run, lambda prompt=prompt: message_text(self.llm.invoke(prompt)), deadline)
+            for prompt in prompts
+        ]
+        results = []
+        for future in futures:
+            try:
+                results.append(self._wait(future, deadline))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _produce_stream(self, prompt, deadline, chunks, cancelled):
+        def call():
+            started = False
+            try:
+                for text in stream_text(self.llm, prompt):
+                    if cancelled.is_set():
+                        return
+                    started = True
+                    chunks.put((_CHUNK, text))
+            except TRANSIENT_ERRORS as e:
+                if started:
+                    raise RuntimeError(f"Se interrumpió la respuesta del LLM: {e}") from e
+                raise
+
+        try:
+            self._run(call, deadline)
+            chunks.put((_DONE, None))
+        except Exception as e:
+            chunks.put((_ERROR, e))
+
+    def stream(self, prompt, timeout=None):
+        """
+        Fragmentos de texto de la respuesta a `prompt` a medida que llegan. Lanza
+        `LLMTimeoutError` si la respuesta completa no termina en `timeout` segundos; si el
+        consumidor deja de leer, la generación se abandona en el siguiente fragmento.
+        """
+        self._count("calls")
+        deadline = self._deadline(timeout)
+        chunks = queue.Queue()
+        cancelled = threading.Event()
+        self._executor.submit(self._produce_stream, prompt, deadline, chunks, cancelled)
+        try:
+            while True:
+                try:
+                    kind, value = chunks.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    self._count("timeouts")
+                    raise LLMTimeoutError("El LLM no terminó de responder dentro del plazo.") from None
+                if kind == _CHUNK:
+                    yield value
+                elif kind == _DONE:
+                    return
+                else:
+                    self._count("timeouts" if isinstance(value, LLMTimeoutError) else "failures")
+                    raise value
+        finally:
+            cancelled.set()
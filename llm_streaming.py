@@ -0,0 +1,91 @@
+"""
+Respuestas del LLM en streaming e instrumentación de latencia.
+
+* `stream_text`: produce el texto de la respuesta del modelo de chat a medida que llega, para
+  mostrarlo con `st.write_stream`.
+* `LLMLatencyLog`: registro compartido entre sesiones del tiempo hasta el primer token (TTFT)
+  y del tiempo total de cada respuesta, por página.
+"""
+import threading
+import time
+from collections import defaultdict, deque
+
+MAX_SAMPLES_PER_PAGE = 500
+
+
+def message_text(message):
+    """
+    Texto de un mensaje (o fragmento) de LangChain, cuyo contenido puede venir por partes.
+    """
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+
+
+def stream_text(llm, prompt):
+    """
+    Fragmentos de texto (no vacíos) de la respuesta de `llm` a `prompt`.
+    """
+    for chunk in llm.stream(prompt):
+        text = message_text(chunk)
+        if text:
+            yield text
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+class LLMLatencyLog:
+    """
+    Últimas `max_samples` mediciones por página: (TTFT en s, total en s, caracteres).
+    """
+
+    def __init__(self, max_samples=MAX_SAMPLES_PER_PAGE):
+        self._samples = defaultdict(lambda: deque(maxlen=max_samples))
+        self._lock = threading.Lock()
+
+    def record(self, page, ttft, total, num_chars):
+        with self._lock:
+            self._samples[page].append((ttft, total, num_chars))
+
+    def track(self, page, chunks, start=None, measurement=None):
+        """
+        Reemite `chunks` midiendo el tiempo hasta el primero y hasta el final desde `start`
+        (por defecto, desde que se empieza a consumir) y lo registra al terminar. Si el
+        generador se abandona a medias no se registra nada. El registro es compartido entre
+        sesiones: quien muestre la medición de esta respuesta la recibe en el dict `measurement`
+        (claves `ttft`, `total` y `num_chars`).
+        """
+        start = time.perf_counter() if start is None else start
+        ttft = None
+        num_chars = 0
+        for text in chunks:
+            if ttft is None:
+                ttft = time.perf_counter() - start
+            num_chars += len(text)
+            yield text
+        total = time.perf_counter() - start
+        ttft = total if ttft is None else ttft
+        self.record(page, ttft, total, num_chars)
+        if measurement is not None:
+            measurement.update(ttft=ttft, total=total, num_chars=num_chars)
+
+    def summary(self):
+        """
+        Por página: número de respuestas y p50/p95 de TTFT y de tiempo total, en segundos.
+        """
+        with self._lock:
+            snapshot = {page: list(samples) for page, samples in self._samples.items() if samples}
+        return {
+            page: dict(
+                responses=len(samples),
+                ttft_p50=percentile([s[0] for s in samples], 0.5),
+                ttft_p95=percentile([s[0] for s in samples], 0.95),
+                total_p50=percentile([s[1] for s in samples], 0.5),
+                total_p95=percentile([s[1] for s in samples], 0.95),
+            )
+            for page, samples in snapshot.items()
+        }
@@ -0,0 +1,206 @@
+"""
+Caché persistente de respuestas del LLM para las herramientas de IA basadas en formularios.
+
+La clave es el SHA-256 de (herramienta, plantilla del prompt canónica, entradas canónicas):
+la plantilla con los espacios colapsados y las entradas ya cuantizadas por la página
+(`quantize`, `bucket`) y, si son texto, normalizadas como las consultas del RAG. Así dos
+usuarios con entradas equivalentes comparten la misma respuesta.
+
+* `PromptCache`: respuestas en SQLite con caducidad por herramienta y un tamaño máximo en
+  bytes; al superarlo se descartan las menos usadas recientemente.
+* `cached_stream`: respuesta en streaming a través del `LLMGateway`, servida desde la caché si
+  está y guardada al terminar si no.
+"""
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+
+PROMPT_CACHE_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 24 * 3600
+TOOL_TTL_SECONDS = {
+    "Análisis Preliminar": 7 * 24 * 3600,
+    "Valoración de Vehículos Usados (IA)": 24 * 3600,  # el mercado cambia; la fecha va por mes en la clave
+    "Asesor de Mantenimiento (IA)": 30 * 24 * 3600,
+    "Simulador de Escenarios Financieros (IA)": 7 * 24 * 3600,
+}
+# Tras superar el tamaño máximo se libera hasta este porcentaje, para no desalojar en cada escritura.
+EVICTION_TARGET = 0.9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS prompt_results (
+    key TEXT PRIMARY KEY,
+    tool TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS prompt_results_last_used ON prompt_results (last_used);
+"""
+
+
+def quantize(value, step):
+    """
+    `value` redondeado al múltiplo de `step` más cercano (p. ej. kilometraje a 5.000 km).
+    """
+    return round(value / step) * step
+
+
+def bucket(value, significant_digits=2):
+    """
+    `value` redondeado a `significant_digits` cifras significativas (p. ej. 87.345.000 ->
+    87.000.000), para montos de órdenes de magnitud muy distintos.
+    """
+    if not value:
+        return 0
+    step = 10 ** (math.floor(math.log10(abs(value))) - significant_digits + 1)
+    return quantize(value, step)
+
+
+def canonical_template(template):
+    return " ".join(template.split())
+
+
+def _canonical_value(value):
+    if isinstance(value, str):
+        # Importado aquí: la barra lateral abre esta caché en todas las páginas y `rag_pipeline`
+        # arrastra LangChain, que solo necesitan las herramientas de IA.
+        from rag_pipeline import normalize_query
+
+        return normalize_query(value)
+    if isinstance(value, float):
+        return round(value, 6)
+    return value
+
+
+def prompt_key(tool, template, inputs):
+    payload = json.dumps(
+        [tool, canonical_template(template), {name: _canonical_value(value) for name, value in inputs.items()}],
+        ensure_ascii=False, sort_keys=True, default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PromptCache:
+    """
+    Respuestas en SQLite. Cada operación abre su propia conexión, por lo que la misma instancia
+    puede usarse desde varios hilos y sesiones de Streamlit. Los contadores de aciertos son del
+    proceso.
+    """
+
+    def __init__(self, db_path, max_bytes=PROMPT_CACHE_MAX_BYTES, ttl_seconds=None, clock=time.time):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = dict(TOOL_TTL_SECONDS, **(ttl_seconds or {}))
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._counters = defaultdict(lambda: dict(hits=0, misses=0, bypassed=0))
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _count(self, tool, counter):
+        with self._lock:
+            self._counters[tool][counter] += 1
+
+    def record_bypass(self, tool):
+        self._count(tool, "bypassed")
+
+    def get(self, tool, key):
+        """
+        Respuesta guardada para `key`, o None si no está o caducó.
+        """
+        now = self.clock()
+        with self._connect() as conn:
+            row = conn.execute("SELECT response, expires_at FROM prompt_results WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[1] > now:
+                conn.execute("UPDATE prompt_results SET last_used = ? WHERE key = ?", (now, key))
+                self._count(tool, "hits")
+                return row[0]
+            if row is not None:
+                conn.execute("DELETE FROM prompt_results WHERE key = ?", (key,))
+        self._count(tool, "misses")
+        return None
+
+    def put(self, tool, key, response):
+        now = self.clock()
+        size = len(response.encode("utf-8"))
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO prompt_results (key, tool, response, size, expires_at, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, tool, response, size, now + self.ttl_seconds.get(tool, DEFAULT_TTL_SECONDS), now),
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn, now):
+        """
+        Si el total supera `max_bytes`, borra lo caducado y luego lo menos usado recientemente.
+        """
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM prompt_results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        conn.execute("DELETE FROM prompt_results WHERE expires_at <= ?", (now,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM prompt_results").fetchone()[0]
+        excess = total - int(self.max_bytes * EVICTION_TARGET)
+        evicted = []
+        for key, size in conn.execute("SELECT key, size FROM prompt_results ORDER BY last_used"):
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+        conn.executemany("DELETE FROM prompt_results WHERE key = ?", evicted)
+
+    def stats(self):
+        """
+        Por herramienta: aciertos, fallos, consultas que saltaron la caché, tasa de aciertos,
+        respuestas guardadas y bytes.
+        """
+        with self._connect() as conn:
+            stored = {tool: (entries, size) for tool, entries, size in conn.execute(
+                "SELECT tool, COUNT(*), SUM(size) FROM prompt_results GROUP BY tool"
+            )}
+        with self._lock:
+            counters = {tool: dict(values) for tool, values in self._counters.items()}
+        stats = {}
+        for tool in sorted(set(stored) | set(counters)):
+            values = counters.get(tool, dict(hits=0, misses=0, bypassed=0))
+            lookups = values["hits"] + values["misses"]
+            entries, size = stored.get(tool, (0, 0))
+            stats[tool] = dict(values, hit_rate=values["hits"] / lookups if lookups else 0.0, entries=entries, bytes=size)
+        return stats
+
+
+def _stream_and_store(gateway, prompt, cache, tool, key):
+    parts = []
+    for text in gateway.stream(prompt):
+        parts.append(text)
+        yield text
+    if parts:
+        cache.put(tool, key, "".join(parts))
+
+
+def cached_stream(gateway, cache, tool, template, inputs, refresh=False):
+    """
+    Respuesta al prompt `template.format(**inputs)` de la herramienta `tool`. Con `refresh` no
+    se consulta la caché, pero la respuesta nueva la reemplaza. Devuelve dict(answer, cached):
+    `answer` es un generador de fragmentos de texto (una respuesta cacheada llega en uno solo)
+    y se guarda en la caché cuando se termina de leer.
+    """
+    key = prompt_key(tool, template, inputs)
+    if refresh:
+        cache.record_bypass(tool)
+        response = None
+    else:
+        response = cache.get(tool, key)
+    if response is not None:
+        return dict(answer=iter([response]), cached=True)
+    return dict(answer=_stream_and_store(gateway, template.format(**inputs), cache, tool, key), cached=False)
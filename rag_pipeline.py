@@ -0,0 +1,408 @@
+"""
+Recuperación y respuesta RAG del Asistente AI, con cachés compartidas entre sesiones.
+
+* `TTLCache`: caché LRU en memoria con caducidad por tiempo, segura entre hilos.
+* `RAGCache`: dos niveles, ambos con la consulta normalizada (`normalize_query`):
+  - consulta -> embedding, para no volver a llamar al modelo de embeddings;
+  - (consulta, ids de los fragmentos recuperados, versión de la colección, conversación previa)
+    -> respuesta, para no volver a llamar al LLM. Como la clave incluye la versión y los
+    fragmentos, una ingesta invalida las respuestas automáticamente.
+* `retrieve_hybrid`: fusiona con reciprocal rank fusion (RRF) la búsqueda por similitud en
+  Chroma y la búsqueda BM25 del `LexicalIndex`. Si el embedding de la consulta falla o tarda
+  más de `QUERY_EMBEDDING_TIMEOUT_SECONDS`, responde solo con la búsqueda léxica.
+* `pack_context`: de los candidatos fusionados, elige por MMR los que entran en un
+  presupuesto de tokens, sin casi duplicados ni el texto solapado entre fragmentos vecinos, y
+  con la fuente y la página de cada uno.
+* `answer_query`: embedding de la consulta, búsqueda y respuesta del LLM (a través de un
+  `LLMGateway`) usando las cachés, completa o en streaming.
+"""
+import hashlib
+import logging
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from langchain_core.documents import Document
+
+from document_ingestion import CHUNK_OVERLAP
+
+QUERY_EMBEDDING_CACHE_SIZE = 10_000
+QUERY_EMBEDDING_TTL_SECONDS = 24 * 3600
+ANSWER_CACHE_SIZE = 2_000
+ANSWER_TTL_SECONDS = 3600
+DEFAULT_K = 3
+# Candidatos de cada búsqueda que entran a la fusión, y constante de RRF (la del artículo original).
+HYBRID_CANDIDATES = 20
+RRF_K = 60
+QUERY_EMBEDDING_TIMEOUT_SECONDS = 2.0
+# Empaquetado del contexto: candidatos que pasan por MMR, peso de la relevancia frente a la
+# diversidad y similitud a partir de la cual un candidato es un casi duplicado. No hay umbral
+# de relevancia: las puntuaciones de RRF solo ordenan (un fragmento que encuentra una sola de
+# las búsquedas puntúa la mitad que uno que encuentran ambas), así que el límite lo ponen
+# `MMR_CANDIDATES` y el presupuesto de tokens.
+MMR_CANDIDATES = 12
+MMR_LAMBDA = 0.7
+DUPLICATE_SIMILARITY = 0.95
+CONTEXT_TOKEN_BUDGET = 1000
+# Estimación para texto en español; el tokenizador de Gemini no está disponible localmente.
+CHARS_PER_TOKEN = 4
+MIN_OVERLAP_CHARS = 40
+
+RAG_PROMPT_TEMPLATE = """
+        Eres un asistente amable de Finanzauto especializado en responder preguntas sobre nuestros servicios y documentos internos.
+        Utiliza **solo la siguiente información contextual** para responder a la pregunta.
+        Si no sabes la respuesta basándote en el contexto proporcionado, simplemente di "Lo siento, no puedo encontrar la respuesta a esa pregunta en los documentos disponibles."
+        Sé conciso y claro en tus respuestas.
+
+        Contexto:
+        {context}
+        {conversation}
+        Pregunta del usuario: {user_query}
+        """
+RAG_CONVERSATION_TEMPLATE = """
+        Conversación previa (solo para entender a qué se refiere la pregunta; no es fuente de información):
+        {conversation}
+"""
+
+logger = logging.getLogger(__name__)
+
+_PUNCTUATION = re.compile(r"[¿?¡!.,;:\"'()]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_query(query):
+    """
+    Forma canónica de una consulta para las claves de caché: minúsculas, sin tildes, sin
+    signos de puntuación y con los espacios colapsados.
+    """
+    text = unicodedata.normalize("NFKD", query.lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = _PUNCTUATION.sub(" ", text)
+    return _SPACES.sub(" ", text).strip()
+
+
+class TTLCache:
+    """
+    Caché LRU de como mucho `max_entries` entradas que caducan a los `ttl_seconds`.
+    """
+
+    def __init__(self, max_entries, ttl_seconds, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Devuelve el valor de `key`, o None si no está o caducó.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return dict(entries=len(self._entries), hits=self.hits, misses=self.misses,
+                        hit_rate=self.hits / total if total else 0.0)
+
+
+class RAGCache:
+    """
+    Cachés de embeddings de consultas y de respuestas. Una instancia se comparte entre todas
+    las sesiones (por ejemplo, con `st.cache_resource`).
+    """
+
+    def __init__(self, embedding_size=QUERY_EMBEDDING_CACHE_SIZE, embedding_ttl=QUERY_EMBEDDING_TTL_SECONDS,
+                 answer_size=ANSWER_CACHE_SIZE, answer_ttl=ANSWER_TTL_SECONDS):
+        self.query_embeddings = TTLCache(embedding_size, embedding_ttl)
+        self.answers = TTLCache(answer_size, answer_ttl)
+        self._collection_version = None
+
+    def embed_query(self, embeddings, query):
+        key = (getattr(embeddings, "model", type(embeddings).__name__), normalize_query(query))
+        vector = self.query_embeddings.get(key)
+        if vector is None:
+            vector = embeddings.embed_query(query)
+            self.query_embeddings.put(key, vector)
+        return vector
+
+    def answer_key(self, query, chunk_ids, collection_version, conversation=""):
+        """
+        Clave de respuesta. Al ver una versión nueva de la colección se vacían las respuestas
+        anteriores en lugar de esperar a que caduquen. Una pregunta de seguimiento solo
+        reutiliza respuestas dadas con la misma conversación previa.
+        """
+        if collection_version != self._collection_version:
+            self.answers.clear()
+            self._collection_version = collection_version
+        conversation_hash = hashlib.blake2b(conversation.encode("utf-8"), digest_size=16).hexdigest() if conversation else ""
+        return normalize_query(query), tuple(chunk_ids), collection_version, conversation_hash
+
+    def stats(self):
+        return dict(query_embeddings=self.query_embeddings.stats(), answers=self.answers.stats())
+
+
+def retrieve(collection, query_vector, k=DEFAULT_K):
+    """
+    Los `k` fragmentos más cercanos a `query_vector` en una colección de Chroma, como
+    (ids, documentos).
+    """
+    result = collection.query(query_embeddings=[query_vector], n_results=k, include=["documents", "metadatas"])
+    ids = result["ids"][0]
+    documents = [
+        Document(page_content=text, metadata=metadata or {})
+        for text, metadata in zip(result["documents"][0], result["metadatas"][0])
+    ]
+    return ids, documents
+
+
+def reciprocal_rank_fusion(rankings, rrf_k=RRF_K):
+    """
+    Ids de varias listas ordenadas fusionados por la suma de 1 / (`rrf_k` + posición), como
+    pares (id, puntuación) de mayor a menor puntuación.
+    """
+    scores = {}
+    for ranking in rankings:
+        for rank, chunk_id in enumerate(ranking, 1):
+            scores[chunk_id] = scores.get(chunk_id, 0.0) + 1.0 / (rrf_k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def retrieve_candidates(collection, lexical_index, user_query, query_vector, candidates=HYBRID_CANDIDATES):
+    """
+    Candidatos de la búsqueda vectorial (si hay `query_vector`) y de la léxica (si hay
+    `lexical_index`) fusionados con RRF, como (ids, documentos, puntuaciones).
+    """
+    rankings = []
+    documents = {}
+    if query_vector is not None:
+        ids, docs = retrieve(collection, query_vector, candidates)
+        rankings.append(ids)
+        documents.update(zip(ids, docs))
+    if lexical_index is not None:
+        ids, docs = lexical_index.search(user_query, candidates)
+        rankings.append(ids)
+        documents.update(zip(ids, docs))
+    fused = reciprocal_rank_fusion(rankings)
+    return [chunk_id for chunk_id, _ in fused], [documents[chunk_id] for chunk_id, _ in fused], [score for _, score in fused]
+
+
+def retrieve_hybrid(collection, lexical_index, user_query, query_vector, k=DEFAULT_K, candidates=HYBRID_CANDIDATES):
+    """
+    Los `k` mejores fragmentos tras fusionar la búsqueda vectorial (si hay `query_vector`) y la
+    léxica, como (ids, documentos).
+    """
+    ids, documents, _ = retrieve_candidates(collection, lexical_index, user_query, query_vector, candidates)
+    return ids[:k], documents[:k]
+
+
+def estimate_tokens(text):
+    """
+    Tokens aproximados de `text` (sin llamar al servicio para contarlos).
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def format_context_block(doc):
+    """
+    Fragmento con su atribución: "[Fuente: archivo, página N]" y el texto.
+    """
+    source = doc.metadata.get("source", "desconocida")
+    page = doc.metadata.get("page")
+    header = f"[Fuente: {source}, página {page}]" if page is not None else f"[Fuente: {source}]"
+    return f"{header}\n{doc.page_content}"
+
+
+def _strip_overlap(text, previous_texts, min_overlap=MIN_OVERLAP_CHARS, max_overlap=2 * CHUNK_OVERLAP):
+    """
+    `text` sin el texto que repite de alguno de `previous_texts`: el solapamiento entre
+    fragmentos consecutivos del mismo documento, al principio (si `text` va después) o al
+    final (si va antes).
+    """
+    for previous in previous_texts:
+        for size in range(min(len(previous), len(text), max_overlap), min_overlap - 1, -1):
+            if previous.endswith(text[:size]):
+                return text[size:].lstrip()
+            if previous.startswith(text[-size:]):
+                return text[:-size].rstrip()
+    return text
+
+
+def _mmr_order(relevance, vectors, lambda_mult):
+    """
+    Índices en orden de máxima relevancia marginal y, para cada uno, su similitud máxima con
+    los elegidos antes.
+    """
+    similarities = vectors @ vectors.T
+    max_similarity = np.zeros(len(relevance))
+    remaining = list(range(len(relevance)))
+    order = []
+    while remaining:
+        scores = lambda_mult * relevance[remaining] - (1 - lambda_mult) * max_similarity[remaining]
+        best = remaining.pop(int(np.argmax(scores)))
+        order.append((best, float(max_similarity[best])))
+        max_similarity = np.maximum(max_similarity, similarities[best])
+    return order
+
+
+def _candidate_vectors(collection, ids):
+    """
+    Embeddings normalizados de los candidatos, leídos de Chroma (filas en cero para los que no
+    tienen embedding, como los que solo están en el índice léxico).
+    """
+    found = collection.get(ids=list(ids), include=["embeddings"])
+    by_id = dict(zip(found["ids"], found["embeddings"]))
+    dimensions = len(next(iter(by_id.values()))) if by_id else 1
+    vectors = np.zeros((len(ids), dimensions), dtype=np.float32)
+    for row, chunk_id in enumerate(ids):
+        if by_id.get(chunk_id) is not None:
+            vectors[row] = by_id[chunk_id]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def pack_context(collection, ids, documents, scores, token_budget=CONTEXT_TOKEN_BUDGET, lambda_mult=MMR_LAMBDA):
+    """
+    Elige qué candidatos entran al prompt: los ordena por MMR (relevancia de la fusión frente a
+    similitud con los ya elegidos), descarta los casi duplicados, quita el texto solapado con
+    fragmentos ya elegidos del mismo documento y agrega fragmentos mientras quepan en
+    `token_budget` tokens.
+
+    Devuelve (ids, documentos recortados, estadísticas) con `candidates`, `selected`,
+    `duplicates`, `over_budget`, `overlap_chars` y `context_tokens`.
+    """
+    stats = dict(candidates=len(ids), selected=0, duplicates=0, over_budget=0, overlap_chars=0, context_tokens=0)
+    if not ids:
+        return [], [], stats
+    relevance = np.asarray(scores, dtype=np.float32) / max(scores)
+    selected_ids, selected_docs = [], []
+    for index, similarity in _mmr_order(relevance, _candidate_vectors(collection, ids), lambda_mult):
+        if similarity >= DUPLICATE_SIMILARITY:
+            stats["duplicates"] += 1
+            continue
+        doc = documents[index]
+        same_source = [d.page_content for d in selected_docs if d.metadata.get("source") == doc.metadata.get("source")]
+        text = _strip_overlap(doc.page_content, same_source)
+        tokens = estimate_tokens(format_context_block(Document(page_content=text, metadata=doc.metadata)))
+        if stats["context_tokens"] + tokens > token_budget:
+            stats["over_budget"] += 1
+            continue
+        stats["overlap_chars"] += len(doc.page_content) - len(text)
+        stats["context_tokens"] += tokens
+        selected_ids.append(ids[index])
+        selected_docs.append(Document(page_content=text, metadata=doc.metadata))
+    stats["selected"] = len(selected_ids)
+    return selected_ids, selected_docs, stats
+
+
+_query_embedding_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="query-embedding")
+
+
+def embed_query_with_timeout(embeddings, user_query, cache=None, timeout=QUERY_EMBEDDING_TIMEOUT_SECONDS):
+    """
+    Embedding de la consulta, o None si el servicio falla o tarda más de `timeout` segundos.
+    La llamada lenta sigue en segundo plano y, con `cache`, su resultado queda guardado para la
+    próxima consulta igual.
+    """
+    if cache:
+        future = _query_embedding_pool.submit(cache.embed_query, embeddings, user_query)
+    else:
+        future = _query_embedding_pool.submit(embeddings.embed_query, user_query)
+    try:
+        return future.result(timeout=timeout)
+    except Exception:
+        return None
+
+
+def build_rag_prompt(user_query, documents, conversation=""):
+    context = "\n\n".join(format_context_block(doc) for doc in documents)
+    conversation = RAG_CONVERSATION_TEMPLATE.format(conversation=conversation) if conversation else ""
+    return RAG_PROMPT_TEMPLATE.format(context=context, conversation=conversation, user_query=user_query)
+
+
+def _stream_and_cache(gateway, prompt, cache, key):
+    parts = []
+    for text in gateway.stream(prompt):
+        parts.append(text)
+        yield text
+    if cache:
+        cache.answers.put(key, "".join(parts))
+
+
+def answer_query(user_query, embeddings, collection, gateway, collection_version, cache=None, stream=False,
+                 lexical_index=None, embed_timeout=QUERY_EMBEDDING_TIMEOUT_SECONDS, fetch_k=MMR_CANDIDATES,
+                 token_budget=CONTEXT_TOKEN_BUDGET, conversation=""):
+    """
+    Responde `user_query` con RAG sobre `collection`, llamando al LLM a través de `gateway`
+    (un `LLMGateway`). Con `cache` (un `RAGCache`) reutiliza el embedding de la consulta y, si
+    los fragmentos recuperados y la versión de la colección coinciden, la respuesta. Con
+    `lexical_index` la recuperación es híbrida, o solo léxica si el embedding de la consulta no
+    llega en `embed_timeout` segundos. De los `fetch_k` mejores candidatos, `pack_context`
+    elige los que entran en `token_budget` tokens de contexto. `conversation` (por ejemplo,
+    `ChatHistory.context()`) se agrega al prompt para entender preguntas de seguimiento.
+
+    Devuelve dict(answer, documents, chunk_ids, cached_answer, retrieval, context), con
+    `retrieval` en "vectorial", "híbrida" o "léxica" y en `context` las estadísticas de
+    `pack_context` más `prompt_tokens` (estimados).
+
+    Con `stream=True`, `answer` es un generador de fragmentos de texto (una respuesta cacheada
+    llega en un solo fragmento) y la respuesta se guarda en la caché cuando se termina de leer.
+    """
+    if lexical_index is None:
+        query_vector = cache.embed_query(embeddings, user_query) if cache else embeddings.embed_query(user_query)
+        retrieval = "vectorial"
+    else:
+        query_vector = embed_query_with_timeout(embeddings, user_query, cache, embed_timeout)
+        retrieval = "léxica" if query_vector is None else "híbrida"
+    candidate_ids, candidates, scores = retrieve_candidates(collection, lexical_index, user_query, query_vector)
+    chunk_ids, documents, context = pack_context(collection, candidate_ids[:fetch_k], candidates[:fetch_k], scores[:fetch_k],
+                                                 token_budget)
+    prompt = build_rag_prompt(user_query, documents, conversation)
+    context["prompt_tokens"] = estimate_tokens(prompt)
+    logger.info("RAG %s: %d candidatos, %d fragmentos (%d casi duplicados, %d fuera del presupuesto), "
+                "%d tokens de contexto, %d tokens de prompt", retrieval, context["candidates"], context["selected"],
+                context["duplicates"], context["over_budget"], context["context_tokens"], context["prompt_tokens"])
+
+    key = cache.answer_key(user_query, chunk_ids, collection_version, conversation) if cache else None
+    answer = cache.answers.get(key) if cache else None
+    cached_answer = answer is not None
+    if cached_answer:
+        answer = iter([answer]) if stream else answer
+    elif stream:
+        answer = _stream_and_cache(gateway, prompt, cache, key)
+    else:
+        answer = gateway.invoke(prompt)
+        if cache:
+            cache.answers.put(key, answer)
+    return dict(answer=answer, documents=documents, chunk_ids=chunk_ids, cached_answer=cached_answer, retrieval=retrieval,
+                context=context)
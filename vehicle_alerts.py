@@ -0,0 +1,277 @@
+"""
+Motor de coincidencias de Alertas de Vehículos.
+
+* `AlertStore`: persistencia en SQLite de las alertas, de las novedades de inventario ya
+  procesadas y de la bandeja de salida de notificaciones (que reemplaza al envío de correos).
+* `AlertMatcher`: índice de predicados sobre las alertas activas. Las alertas se agrupan por
+  (marca, tipo, modelo), incluyendo un grupo "cualquiera" para cada criterio, y dentro de
+  cada grupo se ordenan por precio máximo. Cada grupo solo ve los vehículos del lote con su
+  marca, tipo y modelo, y una búsqueda binaria por precio da cuántos le interesan a cada
+  alerta, sin comparar cada alerta con cada vehículo.
+* `process_inventory_delta`: procesa un lote de vehículos nuevos y deja una notificación por
+  alerta con el número de vehículos del lote que le interesan y los más baratos de ellos.
+"""
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+
+from vehicle_catalog import MAKES, MODELS, VEHICLE_TYPES
+
+ANY = "Cualquiera"
+# Código de "cualquiera" en los índices y de modelo escrito por el usuario que no existe.
+ANY_CODE = -1
+UNKNOWN_MODEL_CODE = -2
+MAX_VEHICLES_PER_NOTIFICATION = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS alerts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL,
+    make TEXT,
+    model TEXT,
+    max_price REAL NOT NULL,
+    types TEXT,
+    status TEXT NOT NULL DEFAULT 'Activa',
+    created_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS alerts_email ON alerts (email);
+CREATE TABLE IF NOT EXISTS notification_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    alert_id INTEGER NOT NULL,
+    email TEXT NOT NULL,
+    batch_id TEXT NOT NULL,
+    vehicle_ids TEXT NOT NULL,
+    num_matches INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    sent_at TEXT,
+    UNIQUE (alert_id, batch_id)
+);
+CREATE INDEX IF NOT EXISTS outbox_email ON notification_outbox (email);
+CREATE TABLE IF NOT EXISTS processed_batches (
+    batch_id TEXT PRIMARY KEY,
+    num_vehicles INTEGER NOT NULL,
+    num_notifications INTEGER NOT NULL,
+    processed_at TEXT NOT NULL
+);
+"""
+
+
+class AlertStore:
+    """
+    Alertas y bandeja de salida en SQLite. Cada operación abre su propia conexión, por lo
+    que la misma instancia puede usarse desde varias sesiones de Streamlit.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def add_alert(self, email, make=ANY, model=ANY, max_price=0, types=ANY):
+        """
+        Guarda una alerta activa y devuelve su id. `ANY` (o vacío) significa "cualquiera".
+        """
+        return self.add_alerts([dict(email=email, make=make, model=model, max_price=max_price, types=types)])[0]
+
+    def add_alerts(self, alerts):
+        """
+        Guarda varias alertas en una sola transacción y devuelve sus ids.
+        """
+        created_date = datetime.now().strftime("%Y-%m-%d")
+        ids = []
+        with self._connect() as conn:
+            for alert in alerts:
+                types = alert.get("types")
+                cursor = conn.execute(
+                    "INSERT INTO alerts (email, make, model, max_price, types, created_date) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        alert["email"],
+                        None if alert.get("make") in (None, "", ANY) else alert["make"],
+                        None if alert.get("model") in (None, "", ANY) else alert["model"],
+                        float(alert["max_price"]),
+                        None if types in (None, "", ANY, []) else json.dumps(list(types)),
+                        created_date,
+                    ),
+                )
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def set_status(self, alert_id, status):
+        with self._connect() as conn:
+            conn.execute("UPDATE alerts SET status = ? WHERE id = ?", (status, alert_id))
+
+    @staticmethod
+    def _alert_from_row(row):
+        return {
+            "id": row["id"],
+            "email": row["email"],
+            "make": row["make"] or ANY,
+            "model": row["model"] or ANY,
+            "max_price": row["max_price"],
+            "type": json.loads(row["types"]) if row["types"] else ANY,
+            "status": row["status"],
+            "created_date": row["created_date"],
+        }
+
+    def alerts_for(self, email):
+        """
+        Alertas de un usuario (por correo), en orden de creación.
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM alerts WHERE email = ? ORDER BY id", (email,)).fetchall()
+        return [self._alert_from_row(row) for row in rows]
+
+    def active_alerts(self):
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM alerts WHERE status = 'Activa' ORDER BY id").fetchall()
+        return [self._alert_from_row(row) for row in rows]
+
+    def alerts_version(self):
+        """
+        Cambia cada vez que se crea o modifica una alerta; sirve para invalidar el índice.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT COUNT(*), COALESCE(MAX(id), 0), "
+                               "SUM(status = 'Activa') FROM alerts").fetchone()
+        return tuple(row)
+
+    def is_batch_processed(self, batch_id):
+        with self._connect() as conn:
+            return conn.execute("SELECT 1 FROM processed_batches WHERE batch_id = ?", (batch_id,)).fetchone() is not None
+
+    def record_batch(self, batch_id, num_vehicles, notifications):
+        """
+        Escribe las notificaciones de un lote y lo marca como procesado en una transacción.
+        `notifications` es una lista de (alert_id, email, [vehicle_id, ...], num_matches).
+        """
+        created_at = datetime.now().isoformat(timespec="seconds")
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO notification_outbox (alert_id, email, batch_id, vehicle_ids, num_matches, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(alert_id, email, batch_id, json.dumps(vehicle_ids), num_matches, created_at)
+                 for alert_id, email, vehicle_ids, num_matches in notifications],
+            )
+            conn.execute("INSERT OR REPLACE INTO processed_batches VALUES (?, ?, ?, ?)",
+                         (batch_id, num_vehicles, len(notifications), created_at))
+
+    def notifications_for(self, email, limit=20):
+        """
+        Notificaciones más recientes de un usuario.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM notification_outbox WHERE email = ? ORDER BY id DESC LIMIT ?", (email, limit)
+            ).fetchall()
+        return [dict(row, vehicle_ids=json.loads(row["vehicle_ids"])) for row in rows]
+
+    def processed_batch_count(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM processed_batches").fetchone()[0]
+
+
+class AlertMatcher:
+    """
+    Índice de predicados sobre un conjunto de alertas. Ver el docstring del módulo.
+    """
+
+    def __init__(self, alerts):
+        self.alert_ids = np.array([alert["id"] for alert in alerts], dtype=np.int64)
+        self.emails = [alert["email"] for alert in alerts]
+        max_price = np.array([alert["max_price"] for alert in alerts], dtype=np.float64)
+        model_codes = {model.lower(): code for code, model in enumerate(MODELS)}
+        self.model = np.array([
+            ANY_CODE if alert["model"] == ANY else model_codes.get(alert["model"].strip().lower(), UNKNOWN_MODEL_CODE)
+            for alert in alerts
+        ], dtype=np.int32)
+
+        # (código de marca, código de tipo) -> código de modelo -> (posiciones de alerta, precios
+        # máximos), ordenados por precio máximo.
+        groups = {}
+        for position, alert in enumerate(alerts):
+            make_code = ANY_CODE if alert["make"] == ANY else MAKES.index(alert["make"])
+            type_codes = [ANY_CODE] if alert["type"] == ANY else [VEHICLE_TYPES.index(t) for t in alert["type"]]
+            for type_code in type_codes:
+                groups.setdefault((make_code, type_code), {}).setdefault(int(self.model[position]), []).append(position)
+        self.buckets = {}
+        for key, by_model in groups.items():
+            self.buckets[key] = {}
+            for model_code, positions in by_model.items():
+                positions = np.array(positions, dtype=np.int64)
+                order = np.argsort(max_price[positions], kind="stable")
+                self.buckets[key][model_code] = (positions[order], max_price[positions][order])
+
+    def __len__(self):
+        return len(self.alert_ids)
+
+    def match(self, makes, types, models, prices, limit=MAX_VEHICLES_PER_NOTIFICATION):
+        """
+        Empareja un lote de vehículos, dado en columnas (códigos de marca, tipo y modelo, y
+        precios), con las alertas. Devuelve (coincidencias por alerta, muestras), donde
+        `muestras` asocia cada alerta con coincidencias a las posiciones de sus `limit`
+        vehículos más baratos.
+
+        Dentro de un grupo, los vehículos se ordenan por precio: los que le interesan a una
+        alerta son un prefijo de ese orden, cuyo largo se obtiene con una búsqueda binaria.
+        Así no se materializa cada par (alerta, vehículo).
+        """
+        counts = np.zeros(len(self.alert_ids), dtype=np.int64)
+        parts = {}
+        for (make_code, type_code), by_model in self.buckets.items():
+            in_bucket = np.ones(len(prices), dtype=bool)
+            if make_code != ANY_CODE:
+                in_bucket &= makes == make_code
+            if type_code != ANY_CODE:
+                in_bucket &= types == type_code
+            vehicles = np.flatnonzero(in_bucket)
+            if len(vehicles) == 0:
+                continue
+            vehicles = vehicles[np.argsort(prices[vehicles], kind="stable")]
+
+            for model_code, (positions, max_prices) in by_model.items():
+                if model_code == UNKNOWN_MODEL_CODE:
+                    continue
+                candidates = vehicles if model_code == ANY_CODE else vehicles[models[vehicles] == model_code]
+                matched = np.searchsorted(prices[candidates], max_prices, side="right")
+                counts[positions] += matched
+                for position, num_matched in zip(positions[matched > 0].tolist(), matched[matched > 0].tolist()):
+                    parts.setdefault(position, []).append(candidates[:min(num_matched, limit)])
+
+        samples = {}
+        for position, arrays in parts.items():
+            sample = arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+            if len(arrays) > 1:
+                sample = sample[np.argsort(prices[sample], kind="stable")][:limit]
+            samples[position] = sample
+        return counts, samples
+
+
+def process_inventory_delta(store, matcher, table, rows, batch_id):
+    """
+    Compara los vehículos `rows` de `table` (novedades de inventario) con las alertas del
+    `matcher` y escribe en la bandeja de salida una notificación por alerta coincidente.
+    Un lote ya procesado se ignora. Devuelve el número de notificaciones generadas.
+    """
+    if store.is_batch_processed(batch_id):
+        return 0
+    rows = np.asarray(rows)
+    cols = table.columns
+    counts, samples = matcher.match(cols["make"][rows], cols["type"][rows], cols["model"][rows], cols["price"][rows])
+
+    vehicle_ids = cols["id"][rows]
+    notifications = [
+        (int(matcher.alert_ids[position]), matcher.emails[position], vehicle_ids[sample].tolist(), int(counts[position]))
+        for position, sample in samples.items()
+    ]
+    store.record_batch(batch_id, len(rows), notifications)
+    return len(notifications)
@@ -0,0 +1,503 @@
+"""
+Motor columnar del catálogo de vehículos de Finanzauto.
+
+El inventario se guarda como un conjunto de arreglos NumPy (uno por campo) en lugar de
+una lista de diccionarios. Los campos de texto (marca, modelo, tipo, combustible, color)
+se almacenan como códigos categóricos y las características como una máscara de bits,
+de modo que los filtros del catálogo se evalúan como máscaras booleanas combinadas.
+
+El inventario de prueba se genera de forma vectorizada y determinista (con semilla) y se
+guarda como snapshot `.npz` para que otros procesos lo carguen en lugar de regenerarlo.
+Para servirlo, el catálogo se exporta además como un directorio de columnas `.npy` sin
+comprimir que todos los procesos mapean en memoria (solo lectura, sin copias).
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from collections.abc import Sequence
+
+import numpy as np
+
+# --- Dominio del Catálogo ---
+MAKES = ["Toyota", "Honda", "Ford", "Chevrolet", "BMW", "Mercedes-Benz", "Audi", "Tesla", "Hyundai", "Kia", "Nissan", "Mazda", "Subaru", "Volvo", "Volkswagen"]
+MODELS_BY_MAKE = {
+    "Toyota": ["Corolla", "Camry", "RAV4", "Highlander", "Tacoma", "Sienna", "Prius"],
+    "Honda": ["Civic", "Accord", "CR-V", "Pilot", "Ridgeline", "Odyssey", "HR-V"],
+    "Ford": ["F-150", "Explorer", "Escape", "Mustang", "Bronco", "Ranger", "Maverick"],
+    "Chevrolet": ["Silverado", "Equinox", "Traverse", "Malibu", "Camaro", "Tahoe", "Blazer"],
+    "BMW": ["3 Series", "5 Series", "X1", "X3", "X5", "X7", "iX"],
+    "Mercedes-Benz": ["C-Class", "E-Class", "GLC", "GLE", "S-Class", "EQE", "EQS"],
+    "Audi": ["A3", "A4", "A6", "Q3", "Q5", "Q7", "e-tron"],
+    "Tesla": ["Model 3", "Model Y", "Model S", "Model X", "Cybertruck"],
+    "Hyundai": ["Elantra", "Sonata", "Tucson", "Santa Fe", "Kona", "Palisade", "Ioniq 5"],
+    "Kia": ["Forte", "K5", "Sportage", "Sorento", "Telluride", "Niro", "EV6"],
+    "Nissan": ["Altima", "Sentra", "Rogue", "Titan", "Murano", "Pathfinder", "Frontier"],
+    "Mazda": ["Mazda3", "Mazda6", "CX-5", "CX-9", "MX-5 Miata"],
+    "Subaru": ["Impreza", "Legacy", "Forester", "Outback", "Crosstrek", "Ascent"],
+    "Volvo": ["S60", "S90", "XC40", "XC60", "XC90", "C40 Recharge"],
+    "Volkswagen": ["Jetta", "Passat", "Tiguan", "Atlas", "GTI", "ID.4"]
+}
+# Lista plana de modelos: el código categórico de un modelo es su posición en esta lista.
+MODELS = [model for make in MAKES for model in MODELS_BY_MAKE[make]]
+VEHICLE_TYPES = ["Sedan", "SUV", "Truck", "Hatchback", "Coupe", "Convertible", "Minivan", "EV"]
+FUEL_TYPES = ["Gasoline", "Hybrid", "Electric", "Diesel"]
+COLORS = ["White", "Black", "Silver", "Red", "Blue", "Gray", "Green", "Yellow"]
+COMMON_FEATURES = [
+    "Bluetooth", "Backup Camera", "Sunroof", "Leather Seats", "Navigation System",
+    "Heated Seats", "Lane Assist", "Adaptive Cruise Control", "AWD", "Keyless Entry",
+    "Apple CarPlay", "Android Auto", "Blind Spot Monitoring", "Towing Package",
+    "Premium Sound System", "Panoramic Roof", "Automatic Emergency Braking"
+]
+PREMIUM_MAKES = ["BMW", "Mercedes-Benz", "Audi", "Tesla"]
+DEFAULT_SEED = 42
+# Versión del formato de snapshot; se incrementa si cambian el esquema o las reglas de generación.
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Nombre de cada columna y su tipo NumPy. Es el esquema del catálogo columnar.
+COLUMN_DTYPES = {
+    "id": np.int32,
+    "make": np.int16,
+    "model": np.int16,
+    "year": np.int16,
+    "price": np.float64,
+    "type": np.int8,
+    "fuel": np.int8,
+    "features": np.uint32,
+    "mileage": np.int32,
+    "color": np.int8,
+}
+
+# Categorías de cada columna codificada: el valor almacenado es el índice en esta lista.
+CATEGORIES = {
+    "make": MAKES,
+    "model": MODELS,
+    "type": VEHICLE_TYPES,
+    "fuel": FUEL_TYPES,
+    "color": COLORS,
+}
+
+
+def encode_features(features):
+    """
+    Convierte una lista de nombres de características en su máscara de bits.
+    """
+    mask = 0
+    for feature in features:
+        mask |= 1 << COMMON_FEATURES.index(feature)
+    return mask
+
+
+def decode_features(mask):
+    """
+    Convierte una máscara de bits de características en la lista de nombres correspondiente.
+    """
+    mask = int(mask)
+    return [feature for bit, feature in enumerate(COMMON_FEATURES) if mask & (1 << bit)]
+
+
+def _alphabetical_rank(column):
+    """
+    Posición alfabética de cada código de una columna categórica.
+    """
+    categories = CATEGORIES[column]
+    rank = np.empty(len(categories), dtype=np.int32)
+    rank[sorted(range(len(categories)), key=lambda code: categories[code].lower())] = np.arange(len(categories))
+    return rank
+
+
+class VehicleTable(Sequence):
+    """
+    Catálogo de vehículos en formato columnar.
+
+    Cada campo vive en un arreglo NumPy (`self.columns`), que puede ser un mapeo en memoria
+    de solo lectura (ver `open_mapped`). La tabla se comporta como una
+    secuencia de solo lectura: `len(table)`, `table[i]` e iterar devuelven diccionarios
+    con la misma forma que los antiguos elementos de `DUMMY_VEHICLES`, de modo que las
+    páginas que aún trabajan fila a fila siguen funcionando.
+    """
+
+    def __init__(self, columns, version=None):
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Todas las columnas deben tener la misma longitud, se recibió {sorted(lengths)}.")
+        self.columns = {name: np.asarray(columns[name], dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+        self._version = version
+        self._row_by_id = None
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Construye la tabla a partir de una lista de diccionarios de vehículos.
+        """
+        columns = {name: np.empty(len(records), dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+        lookups = {name: {value: code for code, value in enumerate(values)} for name, values in CATEGORIES.items()}
+        for i, record in enumerate(records):
+            for name in COLUMN_DTYPES:
+                if name in lookups:
+                    columns[name][i] = lookups[name][record[name]]
+                elif name == "features":
+                    columns[name][i] = encode_features(record[name])
+                else:
+                    columns[name][i] = record[name]
+        return cls(columns)
+
+    @property
+    def version(self):
+        """
+        Huella del contenido del catálogo. Sirve como clave de caché para los índices y
+        cualquier estructura derivada: cambia si y solo si cambia algún dato.
+        """
+        if self._version is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for name in COLUMN_DTYPES:
+                digest.update(name.encode())
+                digest.update(np.ascontiguousarray(self.columns[name]).tobytes())
+            self._version = digest.hexdigest()
+        return self._version
+
+    def __len__(self):
+        return len(self.columns["id"])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.rows(np.arange(len(self))[index])
+        return self.row(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def row(self, index):
+        """
+        Devuelve la fila `index` como diccionario de vehículo.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice de vehículo fuera de rango.")
+        cols = self.columns
+        return {
+            "id": int(cols["id"][index]),
+            "make": MAKES[cols["make"][index]],
+            "model": MODELS[cols["model"][index]],
+            "year": int(cols["year"][index]),
+            "price": float(cols["price"][index]),
+            "type": VEHICLE_TYPES[cols["type"][index]],
+            "fuel": FUEL_TYPES[cols["fuel"][index]],
+            "features": decode_features(cols["features"][index]),
+            "mileage": int(cols["mileage"][index]),
+            "color": COLORS[cols["color"][index]],
+        }
+
+    def row_index(self, vehicle_id):
+        """
+        Posición (fila) del vehículo con id `vehicle_id` en tiempo constante, o None si no existe.
+        Usa un arreglo denso id -> fila construido la primera vez que se necesita.
+        """
+        if self._row_by_id is None:
+            ids = self.columns["id"]
+            self._row_by_id = np.full(int(ids.max()) + 1 if len(ids) else 0, -1, dtype=np.int32)
+            self._row_by_id[ids] = np.arange(len(ids))
+        if not 0 <= vehicle_id < len(self._row_by_id):
+            return None
+        index = self._row_by_id[vehicle_id]
+        return None if index < 0 else int(index)
+
+    def get_by_id(self, vehicle_id):
+        """
+        Devuelve el vehículo con id `vehicle_id` como diccionario, o None si no existe.
+        """
+        index = self.row_index(vehicle_id)
+        return None if index is None else self.row(index)
+
+    def rows(self, indices):
+        """
+        Devuelve como lista de diccionarios las filas indicadas (solo se materializan esas).
+        """
+        return [self.row(int(i)) for i in indices]
+
+    def to_records(self):
+        """
+        Materializa toda la tabla como lista de diccionarios (formato antiguo).
+        """
+        return self.rows(range(len(self)))
+
+    def decode_column(self, name, indices):
+        """
+        Valores legibles de la columna `name` para las filas `indices` (las categorías se
+        traducen a texto y las características a listas de nombres).
+        """
+        values = self.columns[name][indices]
+        if name in CATEGORIES:
+            return [CATEGORIES[name][code] for code in values]
+        if name == "features":
+            return [decode_features(mask) for mask in values]
+        return values
+
+    def sort_indices(self, indices, column, descending=False):
+        """
+        Ordena las filas `indices` por `column` de forma estable. Las columnas categóricas
+        se ordenan alfabéticamente por su texto, no por su código.
+        """
+        keys = self.columns[column][indices]
+        if column in CATEGORIES:
+            keys = _alphabetical_rank(column)[keys]
+        order = np.argsort(-keys.astype(np.float64) if descending else keys, kind="stable")
+        return np.asarray(indices)[order]
+
+    def text_match_mask(self, search_query):
+        """
+        Máscara de filas cuya marca o modelo contiene `search_query` (sin distinguir mayúsculas).
+        La búsqueda se evalúa una vez por categoría y se propaga a las filas por sus códigos.
+        """
+        query = search_query.lower()
+        make_hits = np.array([query in make.lower() for make in MAKES])
+        model_hits = np.array([query in model.lower() for model in MODELS])
+        return make_hits[self.columns["make"]] | model_hits[self.columns["model"]]
+
+    def category_mask(self, column, values):
+        """
+        Máscara de filas cuya columna categórica `column` toma alguno de los `values`.
+        Se usa una tabla de búsqueda por código en lugar de comparar fila a fila.
+        """
+        categories = CATEGORIES[column]
+        lookup = np.zeros(len(categories), dtype=bool)
+        lookup[[categories.index(value) for value in values]] = True
+        return lookup[self.columns[column]]
+
+    def filter_mask(self, search_query="", min_price=None, max_price=None, types=None, fuels=None, min_year=None):
+        """
+        Evalúa los filtros del catálogo como máscaras booleanas combinadas.
+        Los filtros vacíos o en `None` no restringen el resultado.
+        """
+        cols = self.columns
+        mask = np.ones(len(self), dtype=bool)
+        if search_query:
+            mask &= self.text_match_mask(search_query)
+        if min_price is not None:
+            mask &= cols["price"] >= min_price
+        if max_price is not None:
+            mask &= cols["price"] <= max_price
+        if types:
+            mask &= self.category_mask("type", types)
+        if fuels:
+            mask &= self.category_mask("fuel", fuels)
+        if min_year is not None:
+            mask &= cols["year"] >= min_year
+        return mask
+
+    def filter(self, **filters):
+        """
+        Devuelve los índices de fila (en orden del catálogo) que cumplen los filtros.
+        """
+        return np.flatnonzero(self.filter_mask(**filters))
+
+
+# --- Generación Vectorizada del Inventario ---
+
+def _generate_block(rng, first_id, num_vehicles):
+    """
+    Genera `num_vehicles` vehículos en columnas con las mismas reglas de precio, kilometraje
+    y características que la generación original fila a fila.
+    """
+    models_per_make = np.array([len(MODELS_BY_MAKE[make]) for make in MAKES])
+    model_offsets = np.concatenate([[0], np.cumsum(models_per_make)[:-1]])
+    premium_codes = [MAKES.index(make) for make in PREMIUM_MAKES]
+
+    make = rng.integers(0, len(MAKES), num_vehicles)
+    model = model_offsets[make] + (rng.random(num_vehicles) * models_per_make[make]).astype(np.int64)
+    year = rng.integers(2018, 2026, num_vehicles)
+
+    base_price = np.where(
+        np.isin(make, premium_codes),
+        rng.integers(35000, 120001, num_vehicles),
+        rng.integers(15000, 80001, num_vehicles),
+    )
+    price = base_price + (year - 2018) * rng.uniform(500, 2000, num_vehicles) + rng.uniform(-1000, 1000, num_vehicles)
+    price = np.maximum(10000, price)
+
+    v_type = rng.integers(0, len(VEHICLE_TYPES), num_vehicles)
+    fuel = rng.integers(0, len(FUEL_TYPES), num_vehicles)
+    is_ev = v_type == VEHICLE_TYPES.index("EV")
+    fuel[is_ev] = FUEL_TYPES.index("Electric")
+    price[is_ev] = rng.integers(35000, 90001, int(is_ev.sum()))
+
+    # Entre 2 y 6 características distintas: se eligen las k claves aleatorias más pequeñas de cada fila.
+    num_features = rng.integers(2, 7, num_vehicles)
+    keys = rng.random((num_vehicles, len(COMMON_FEATURES)), dtype=np.float32)
+    thresholds = np.sort(keys, axis=1)[np.arange(num_vehicles), num_features - 1]
+    selected = keys <= thresholds[:, None]
+    features = selected.astype(np.uint32) @ (np.uint32(1) << np.arange(len(COMMON_FEATURES), dtype=np.uint32))
+
+    mileage = np.where(year < 2025, rng.integers(500, 150001, num_vehicles), rng.integers(10, 5001, num_vehicles))
+    color = rng.integers(0, len(COLORS), num_vehicles)
+
+    return {
+        "id": np.arange(first_id, first_id + num_vehicles),
+        "make": make,
+        "model": model,
+        "year": year,
+        "price": price.round(2),
+        "type": v_type,
+        "fuel": fuel,
+        "features": features,
+        "mileage": mileage,
+        "color": color,
+    }
+
+
+def generate_vehicle_table(num_vehicles=5000, seed=DEFAULT_SEED, block_size=250_000):
+    """
+    Genera un inventario aleatorio reproducible: la misma semilla produce siempre el mismo
+    catálogo. Se genera por bloques para acotar la memoria intermedia.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {name: np.empty(num_vehicles, dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+    for start in range(0, num_vehicles, block_size):
+        size = min(block_size, num_vehicles - start)
+        for name, values in _generate_block(rng, start + 1, size).items():
+            columns[name][start:start + size] = values
+    return VehicleTable(columns)
+
+
+# --- Snapshots en Disco ---
+
+def snapshot_path(directory, num_vehicles, seed):
+    """
+    Ruta del snapshot para un tamaño y semilla dados.
+    """
+    return os.path.join(directory, f"vehicles_{num_vehicles}_seed{seed}.npz")
+
+
+def _snapshot_metadata():
+    """
+    Metadatos que deben coincidir para que un snapshot sea válido con este código.
+    """
+    return {
+        "format_version": np.int32(SNAPSHOT_FORMAT_VERSION),
+        **{f"categories_{name}": np.array(values) for name, values in CATEGORIES.items()},
+        "categories_features": np.array(COMMON_FEATURES),
+    }
+
+
+def save_snapshot(table, path):
+    """
+    Guarda la tabla como `.npz` comprimido. La escritura es atómica: se escribe en un
+    archivo temporal y luego se renombra, así otro proceso nunca lee un snapshot a medias.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+    np.savez_compressed(tmp_path, **table.columns, **_snapshot_metadata())
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path):
+    """
+    Carga un snapshot. Devuelve None si no existe o fue generado con otro esquema/categorías.
+    """
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as data:
+        for name, expected in _snapshot_metadata().items():
+            if name not in data.files or not np.array_equal(data[name], expected):
+                return None
+        return VehicleTable({name: data[name] for name in COLUMN_DTYPES})
+
+
+# --- Catálogo Mapeado en Memoria (compartido entre procesos) ---
+
+def mapped_path(directory, num_vehicles, seed):
+    """
+    Ruta del directorio de columnas mapeables para un tamaño y semilla dados. Incluye la
+    versión del formato: un directorio de una versión anterior no bloquea la exportación.
+    """
+    return os.path.join(directory, f"vehicles_{num_vehicles}_seed{seed}_v{SNAPSHOT_FORMAT_VERSION}.cols")
+
+
+def export_mapped(table, path):
+    """
+    Escribe cada columna como `.npy` sin comprimir más un `meta.json` con la versión del
+    catálogo y sus categorías. El directorio se publica con un renombrado atómico; si en `path`
+    ya hay un directorio que no se puede abrir (incompleto o de otras categorías), se sustituye.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    os.makedirs(tmp_path, exist_ok=True)
+    for name in COLUMN_DTYPES:
+        np.save(os.path.join(tmp_path, f"{name}.npy"), np.ascontiguousarray(table.columns[name]))
+    metadata = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "version": table.version,
+        "num_vehicles": len(table),
+        "categories": {**CATEGORIES, "features": COMMON_FEATURES},
+    }
+    with open(os.path.join(tmp_path, "meta.json"), "w", encoding="utf-8") as meta_file:
+        json.dump(metadata, meta_file)
+    try:
+        os.replace(tmp_path, path)
+        return
+    except OSError:
+        pass
+    if open_mapped(path) is None:
+        shutil.rmtree(path, ignore_errors=True)
+        try:
+            os.replace(tmp_path, path)
+            return
+        except OSError:
+            pass
+    # Otro proceso publicó el mismo catálogo primero; su copia es equivalente.
+    shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def open_mapped(path):
+    """
+    Abre un catálogo exportado con `export_mapped` mapeando sus columnas en memoria (solo
+    lectura). Las páginas del archivo viven en la caché del sistema operativo y se comparten
+    entre todos los procesos que lo abren. Devuelve None si no existe, no es compatible o está
+    incompleto.
+    """
+    meta_path = os.path.join(path, "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, encoding="utf-8") as meta_file:
+            metadata = json.load(meta_file)
+        if metadata.get("format_version") != SNAPSHOT_FORMAT_VERSION or \
+           metadata.get("categories") != {**CATEGORIES, "features": COMMON_FEATURES}:
+            return None
+        columns = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in COLUMN_DTYPES}
+    except (OSError, ValueError):
+        return None
+    return VehicleTable(columns, version=metadata["version"])
+
+
+def load_or_generate(directory, num_vehicles=5000, seed=DEFAULT_SEED):
+    """
+    Devuelve el catálogo mapeado en memoria. Si aún no existe, lo construye a partir del
+    snapshot `.npz` (o lo genera y guarda el snapshot) y lo exporta en formato mapeable. Si aun
+    así no se puede abrir el catálogo mapeado, devuelve la tabla en memoria.
+    """
+    path = mapped_path(directory, num_vehicles, seed)
+    mapped = open_mapped(path)
+    if mapped is not None:
+        return mapped
+    npz_path = snapshot_path(directory, num_vehicles, seed)
+    table = load_snapshot(npz_path)
+    if table is None:
+        table = generate_vehicle_table(num_vehicles, seed)
+        save_snapshot(table, npz_path)
+    export_mapped(table, path)
+    mapped = open_mapped(path)
+    return table if mapped is None else mapped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera un snapshot del inventario de vehículos para pruebas de carga.")
+    parser.add_argument("--vehicles", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output-dir", default="catalog_data")
+    args = parser.parse_args()
+    table = load_or_generate(args.output_dir, args.vehicles, args.seed)
+    print(f"Catálogo con {len(table):,} vehículos en {mapped_path(args.output_dir, args.vehicles, args.seed)} "
+          f"(snapshot comprimido: {snapshot_path(args.output_dir, args.vehicles, args.seed)})")